@@ -392,8 +392,8 @@ class PhoneOSINTMaster:
         self.logger.info("Running comprehensive phone validation...")
 
         from scripts.phone_validator import PhoneValidator
-        validator = PhoneValidator(self.phone_number)
-        results = validator.validate_comprehensive()
+        with PhoneValidator(self.phone_number) as validator:
+            results = validator.validate_comprehensive()
 
         output_file = self.output_dir / "phone_validation.json"
         with open(output_file, 'w', encoding='utf-8') as f:
@@ -409,8 +409,10 @@ class PhoneOSINTMaster:
             self.logger.info(f"🎯 Enhanced hunting with identity data: {list(identity_data.keys())}")
 
         from scripts.unified_name_hunter import UnifiedNameHunter
-        hunter = UnifiedNameHunter(self.phone_number, identity_data, skip_truepeoplesearch=skip_truepeoplesearch)
-        results = hunter.hunt_ultimate()
+        with UnifiedNameHunter(self.phone_number, identity_data, skip_truepeoplesearch=skip_truepeoplesearch) as hunter:
+            results = hunter.hunt_ultimate()
+            # NumVerify never returns names, so its carrier lookup runs once here instead of as a hunter
+            results['source_summary']['numverify'] = {'found': False, **hunter.get_carrier_info()}
 
         output_file = self.output_dir / "name_hunting_results.json"
         with open(output_file, 'w', encoding='utf-8') as f:
@@ -431,8 +433,8 @@ class PhoneOSINTMaster:
         self.logger.info("🎯 Starting email discovery...")
 
         from scripts.email_hunter import EmailHunter
-        hunter = EmailHunter(self.phone_number, identity_data)
-        results = hunter.hunt_comprehensive(skip_pattern_generation=skip_pattern_generation, skip_public_records=skip_public_records)
+        with EmailHunter(self.phone_number, identity_data) as hunter:
+            results = hunter.hunt_comprehensive(skip_pattern_generation=skip_pattern_generation, skip_public_records=skip_public_records)
 
         output_file = self.output_dir / "email_discovery_results.json"
         with open(output_file, 'w', encoding='utf-8') as f:
@@ -469,8 +471,8 @@ class PhoneOSINTMaster:
         self.logger.info("🎯 Starting employment intelligence hunting...")
 
         from scripts.employment_hunter import EmploymentHunter
-        hunter = EmploymentHunter(self.phone_number, identity_data)
-        results = hunter.hunt_comprehensive()
+        with EmploymentHunter(self.phone_number, identity_data) as hunter:
+            results = hunter.hunt_comprehensive()
 
         output_file = self.output_dir / "employment_intelligence_results.json"
         with open(output_file, 'w', encoding='utf-8') as f:
@@ -8,8 +8,79 @@ import random
 import requests
 import logging
 import json
+import threading
 from typing import Dict, Optional
 from pathlib import Path
+from selectolax.lexbor import LexborHTMLParser
+
+try:
+    import orjson  # Decodes search API payloads from bytes, several times faster than json
+except ImportError:
+    orjson = None
+
+
+def _decode_json(response: requests.Response):
+    """Decode a JSON response body, using orjson when installed"""
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class HostRateLimiter:
+    """
+    Token-bucket rate limiter keyed by hostname, shared by the scrapers
+
+    Each host refills at its configured requests/second up to `burst` tokens, so an
+    idle host costs no wait and a busy one is paced. Hosts match their configured
+    parent domain (www.truepeoplesearch.com uses the truepeoplesearch.com rate).
+    """
+
+    DEFAULT_RATES = {
+        'default': 1.0,
+        'duckduckgo.com': 0.5,
+        'truepeoplesearch.com': 0.2,
+    }
+
+    def __init__(self, rates: Dict[str, float] = None, burst: float = 1.0):
+        self.rates = dict(self.DEFAULT_RATES if rates is None else rates)
+        self.burst = burst
+        self._buckets = {}  # host -> (tokens, last refill time)
+        self._host_locks = {}
+        self._lock = threading.Lock()
+
+    def _rate_for(self, host: str) -> float:
+        labels = host.split('.')
+        for i in range(len(labels) - 1):
+            rate = self.rates.get('.'.join(labels[i:]))
+            if rate:
+                return rate
+        return self.rates.get('default', 1.0)
+
+    def acquire(self, host: str) -> float:
+        """Block until a request to host is allowed; returns the seconds waited"""
+        host = host.lower()
+        with self._lock:
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+
+        # Per-host lock: concurrent callers for one host queue up, other hosts don't wait
+        with host_lock:
+            rate = self._rate_for(host)
+            now = time.monotonic()
+            tokens, last = self._buckets.get(host, (self.burst, now))
+            tokens = min(self.burst, tokens + rate * (now - last))
+
+            waited = 0.0
+            if tokens < 1:
+                waited = (1 - tokens) / rate
+                time.sleep(waited)
+                tokens, now = 1.0, time.monotonic()
+
+            self._buckets[host] = (tokens - 1, now)
+            return waited
+
+
+# Process-wide limiter so every scraper shares one budget per host
+RATE_LIMITER = HostRateLimiter()
 
 
 class RateLimitedAPIClient:
@@ -17,12 +88,55 @@ class RateLimitedAPIClient:
     Rate-limited API client with exponential backoff for handling API quotas
     """
 
-    def __init__(self, base_delay: float = 2.0, max_retries: int = 3):
+    def __init__(self, base_delay: float = 2.0, max_retries: int = 3,
+                 session: Optional[requests.Session] = None):
         self.base_delay = base_delay
         self.max_retries = max_retries
+        # Keep-alive session: a shared one when given, otherwise one owned by this client
+        self._owns_session = session is None
+        self.session = requests.Session() if session is None else session
         self.logger = logging.getLogger(__name__)
         self.last_request_time = 0
 
+    def close(self):
+        """Release pooled connections, unless the session is shared"""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _cache_query(query: str, num_results: int) -> str:
+        """Cache key text - a page of 1 result must not answer a request for 10"""
+        return f"{query}|num={num_results}"
+
+    def _get_cached(self, query: str, api_type: str, num_results: int) -> Optional[Dict]:
+        """Result for query from the shared query cache, if one is stored"""
+        try:
+            from .query_cache import get_query_cache
+            cached = get_query_cache().get_cached_result(self._cache_query(query, num_results), api_type)
+        except Exception as e:
+            self.logger.debug(f"Cache check failed: {e}")
+            return None
+
+        if cached:
+            self.logger.info(f"📦 Using cached {api_type} result for: {query}")
+        return cached
+
+    def _store_cached(self, query: str, api_type: str, num_results: int, result: Dict):
+        """Save a result with hits to the shared query cache; empty pages may be blocks, so they aren't kept"""
+        if not result.get('items'):
+            return
+        try:
+            from .query_cache import get_query_cache
+            get_query_cache().cache_result(self._cache_query(query, num_results), api_type, result)
+        except Exception as e:
+            self.logger.debug(f"Cache write failed: {e}")
+
     def make_request_with_backoff(self, url: str, params: Dict = None, headers: Dict = None,
                                 timeout: int = 15, proxies: Dict = None) -> Optional[requests.Response]:
         """
@@ -45,7 +159,7 @@ class RateLimitedAPIClient:
         for attempt in range(self.max_retries + 1):
             try:
                 self.last_request_time = time.time()
-                response = requests.get(url, params=params, headers=headers, timeout=timeout, proxies=proxies)
+                response = self.session.get(url, params=params, headers=headers, timeout=timeout, proxies=proxies)
 
                 if response.status_code == 200:
                     return response
@@ -109,24 +223,19 @@ class GoogleAPIClient(RateLimitedAPIClient):
             self.logger.warning("Google Custom Search API not configured")
             return None
 
-        # Check cache first
+        # Try cached result first - costs no quota
+        cached = self._get_cached(query, 'google', num_results)
+        if cached:
+            return cached
+
         try:
             from .query_cache import get_query_cache
-            cache = get_query_cache()
-            
             # Check if we should skip due to quota concerns
-            if cache.should_skip_query('google'):
+            if get_query_cache().should_skip_query('google'):
                 self.logger.warning("🚫 Skipping Google query - approaching daily quota limit")
                 return None
-            
-            # Try cached result first
-            cached = cache.get_cached_result(query, 'google')
-            if cached:
-                self.logger.info(f"📦 Using cached result for: {query}")
-                return cached
-                
         except Exception as e:
-            self.logger.debug(f"Cache check failed: {e}")
+            self.logger.debug(f"Quota check failed: {e}")
 
         params = {
             'key': self.api_key,
@@ -140,15 +249,13 @@ class GoogleAPIClient(RateLimitedAPIClient):
 
         if response and response.status_code == 200:
             try:
-                result_data = response.json()
-                
-                # Cache successful result
+                result_data = _decode_json(response)
+                self._store_cached(query, 'google', num_results, result_data)
                 try:
-                    cache.cache_result(query, 'google', result_data)
-                    cache.track_quota_usage('google')
-                except:
+                    get_query_cache().track_quota_usage('google')
+                except Exception:
                     pass  # Don't break on cache failure
-                    
+
                 return result_data
             except ValueError as e:
                 self.logger.error(f"Invalid JSON in Google response: {e}")
@@ -206,6 +313,10 @@ class SerpApiClient(RateLimitedAPIClient):
             self.logger.warning("SerpApi not configured")
             return None
 
+        cached = self._get_cached(query, 'serpapi', num_results)
+        if cached:
+            return cached
+
         params = {
             'engine': 'bing',        # Use Bing search engine
             'q': query,              # Query string
@@ -220,7 +331,7 @@ class SerpApiClient(RateLimitedAPIClient):
 
         if response and response.status_code == 200:
             try:
-                data = response.json()
+                data = _decode_json(response)
 
                 # Convert SerpApi format to Google-compatible format
                 items = []
@@ -236,12 +347,14 @@ class SerpApiClient(RateLimitedAPIClient):
                     items.append(item)
 
                 # Return in Google-compatible format
-                return {
+                result = {
                     'items': items,
                     'searchInformation': {
                         'totalResults': len(items)
                     }
                 }
+                self._store_cached(query, 'serpapi', num_results, result)
+                return result
 
             except Exception as e:
                 self.logger.error(f"Error parsing SerpApi response: {e}")
@@ -357,6 +470,10 @@ class DuckDuckGoClient(RateLimitedAPIClient):
             'Accept-Language': 'en-US,en;q=0.5',
         }
 
+        cached = self._get_cached(query, 'duckduckgo', num_results)
+        if cached:
+            return cached
+
         params = {'q': query}
 
         self.logger.info(f"DuckDuckGo scraping (no API): {query}")
@@ -369,32 +486,34 @@ class DuckDuckGoClient(RateLimitedAPIClient):
 
         if response and response.status_code == 200:
             try:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.text, 'html.parser')
+                # Raw bytes: skips requests' charset detection and str decode of the whole page
+                tree = LexborHTMLParser(response.content)
 
-                # Parse DDG HTML results
+                # Parse DDG HTML results with CSS selectors
                 items = []
-                result_divs = soup.find_all('div', class_='result')[:num_results]
+                result_divs = tree.css('div.result')[:num_results]
 
                 for div in result_divs:
-                    link_elem = div.find('a', class_='result__a')
-                    snippet_elem = div.find('a', class_='result__snippet')
+                    link_elem = div.css_first('a.result__a')
+                    snippet_elem = div.css_first('a.result__snippet')
 
                     if link_elem:
                         item = {
-                            'link': link_elem.get('href', ''),
-                            'title': link_elem.get_text(strip=True),
-                            'snippet': snippet_elem.get_text(strip=True) if snippet_elem else ''
+                            'link': link_elem.attributes.get('href') or '',
+                            'title': link_elem.text(strip=True),
+                            'snippet': snippet_elem.text(strip=True) if snippet_elem else ''
                         }
                         items.append(item)
 
                 # Return in Google-compatible format
-                return {
+                result = {
                     'items': items,
                     'searchInformation': {
                         'totalResults': len(items)
                     }
                 }
+                self._store_cached(query, 'duckduckgo', num_results, result)
+                return result
 
             except Exception as e:
                 self.logger.error(f"Error parsing DuckDuckGo HTML: {e}")
@@ -445,8 +564,8 @@ class NumVerifyClient(RateLimitedAPIClient):
     Specialized client for NumVerify API with timeout handling
     """
 
-    def __init__(self, api_key: str):
-        super().__init__(base_delay=1.0, max_retries=2)
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None):
+        super().__init__(base_delay=1.0, max_retries=2, session=session)
         self.api_key = api_key
 
     def validate(self, phone_number: str) -> Optional[Dict]:
@@ -507,6 +626,18 @@ class UnifiedSearchClient:
         self.bing_exhausted = False
         self.yandex_exhausted = False
 
+    def close(self):
+        """Close every engine client handed to or created by this router"""
+        for client in (self.google, self.bing, self.yandex, self.ddg):
+            if client is not None:
+                client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def search(self, query: str, query_type: str = 'general', num_results: int = 10) -> Optional[Dict]:
         """
         Intelligent search with automatic engine selection and failover
@@ -8,6 +8,13 @@ from selenium.webdriver.chrome.options import Options
 import logging
 import random
 
+# Default user agents for anti-detection, built once rather than per driver
+DEFAULT_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+)
+
 def get_stealth_chrome_options(user_agent=None):
     """
     Get Chrome options optimized for headless scraping with minimal errors
@@ -74,13 +81,7 @@ def get_stealth_chrome_options(user_agent=None):
     if user_agent:
         options.add_argument(f'--user-agent={user_agent}')
     else:
-        # Default user agents for anti-detection
-        default_user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
-        ]
-        options.add_argument(f'--user-agent={random.choice(default_user_agents)}')
+        options.add_argument(f'--user-agent={random.choice(DEFAULT_USER_AGENTS)}')
     
     # Prefs to disable additional features that cause errors
     prefs = {
@@ -70,6 +70,16 @@ class EmailHunter:
         # Extract potential domains and search terms from identity data
         self.search_terms = self._extract_search_terms()
 
+    def close(self):
+        """Release the search clients' pooled connections"""
+        self.search_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _extract_search_terms(self) -> List[str]:
         """Extract search terms from identity data and phone number"""
         terms = []
@@ -573,8 +583,8 @@ class EmailHunter:
             from scripts.employment_hunter import EmploymentHunter
 
             # Initialize employment hunter
-            emp_hunter = EmploymentHunter(self.phone, self.identity_data)
-            employment_results = emp_hunter.hunt_comprehensive()
+            with EmploymentHunter(self.phone, self.identity_data) as emp_hunter:
+                employment_results = emp_hunter.hunt_comprehensive()
 
             results['employment_data'] = employment_results
 
@@ -44,6 +44,16 @@ class EmploymentHunter:
         # Clean phone number for processing
         self.clean_phone = re.sub(r'[^\d]', '', phone_number)
 
+    def close(self):
+        """Release the search clients' pooled connections"""
+        self.search_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _is_valid_employer(self, employer: str) -> bool:
         """
         Validate employer name to filter out noise
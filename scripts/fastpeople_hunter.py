@@ -5,6 +5,7 @@ Advanced scraping module for extracting owner names from public records
 """
 
 import requests
+import itertools
 import logging
 import time
 import random
@@ -13,6 +14,7 @@ from urllib.parse import quote
 import re
 from typing import Dict, List, Optional
 from .api_utils import FastPeopleSearchClient
+from .chrome_config import DEFAULT_USER_AGENTS
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -33,14 +35,13 @@ class FastPeopleHunter:
 
         # Load proxies from config/proxies.txt if not provided
         self.proxy_list = proxy_list if proxy_list is not None else self._load_proxies()
-        self.current_proxy_index = 0
+        # requests proxy mappings built once, cycled from a random start so runs don't all open on the first proxy
+        self._proxy_dicts = [{'http': proxy, 'https': proxy} for proxy in self.proxy_list]
+        random.shuffle(self._proxy_dicts)
+        self._proxy_cycle = itertools.cycle(self._proxy_dicts)
 
         # User agents for rotation
-        self.user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
-        ]
+        self.user_agents = DEFAULT_USER_AGENTS
 
         # Search patterns for different phone formats
         self.search_formats = self._generate_search_formats()
@@ -84,25 +85,10 @@ class FastPeopleHunter:
             return []
 
     def _rotate_proxy(self) -> Optional[Dict]:
-        """Get proxy from pool (simplified for whitelisted IPRoyal)"""
-        if not self.proxy_list or len(self.proxy_list) == 0:
+        """Get proxy from pool (the single whitelisted IPRoyal endpoint, or the next legacy proxy)"""
+        if not self._proxy_dicts:
             return None
-
-        # For whitelisted IPRoyal, just use the single endpoint (no rotation needed)
-        # For legacy proxies, rotate through the list
-        if len(self.proxy_list) == 1:
-            # Single whitelisted proxy (IPRoyal)
-            proxy = self.proxy_list[0]
-        else:
-            # Multiple proxies (legacy mode)
-            proxy = self.proxy_list[self.current_proxy_index]
-            self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxy_list)
-
-        # SOCKS5 proxy format
-        return {
-            'http': proxy,
-            'https': proxy
-        }
+        return next(self._proxy_cycle)
 
     def _clean_phone_number(self, phone: str) -> str:
         """Clean phone number for searching"""
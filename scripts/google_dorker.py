@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 import os
+import re
 import time
 import json
 from googlesearch import search
 from urllib.parse import quote
 import logging
 
+# Result buckets in priority order - the first matching pattern wins, anything else is 'other'
+CATEGORY_PATTERNS = [
+    ('social_media', re.compile(r'facebook\.|linkedin\.|twitter\.|instagram\.', re.IGNORECASE)),
+    ('documents', re.compile(r'\.pdf|document', re.IGNORECASE)),
+    ('business', re.compile(r'business|company|corp|llc', re.IGNORECASE)),
+    ('government', re.compile(r'\.gov', re.IGNORECASE)),
+]
+
 class GoogleDorker:
     def __init__(self, phone_number, phone_data, enriched_identity=None):
         self.phone = phone_number
@@ -138,36 +147,9 @@ class GoogleDorker:
     
     def categorize_result(self, url, results, dork):
         """Categorize URL into appropriate bucket"""
-        url_lower = url.lower()
-        
-        if any(site in url_lower for site in ['facebook.', 'linkedin.', 'twitter.', 'instagram.']):
-            if url not in results['social_media']:
-                results['social_media'].append({
-                    'url': url,
-                    'dork': dork,
-                    'timestamp': time.time()
-                })
-        elif '.pdf' in url_lower or 'document' in url_lower:
-            results['documents'].append({
-                'url': url,
-                'dork': dork,
-                'timestamp': time.time()
-            })
-        elif any(term in url_lower for term in ['business', 'company', 'corp', 'llc']):
-            results['business'].append({
-                'url': url,
-                'dork': dork,
-                'timestamp': time.time()
-            })
-        elif '.gov' in url_lower:
-            results['government'].append({
-                'url': url,
-                'dork': dork,
-                'timestamp': time.time()
-            })
-        else:
-            results['other'].append({
-                'url': url,
-                'dork': dork,
-                'timestamp': time.time()
-            })
\ No newline at end of file
+        bucket = next((name for name, pattern in CATEGORY_PATTERNS if pattern.search(url)), 'other')
+        results[bucket].append({
+            'url': url,
+            'dork': dork,
+            'timestamp': time.time()
+        })
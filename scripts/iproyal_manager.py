@@ -57,6 +57,7 @@ class IPRoyalManager:
         self.config = self._load_config()
 
         self.proxies: List[ProxyInfo] = []
+        self._proxies_by_string: Dict[str, ProxyInfo] = {}  # O(1) lookup for success/failure reports
         self.blacklist: set = set()  # IPs that consistently fail
 
         # IP reputation preferences
@@ -131,6 +132,7 @@ class IPRoyalManager:
                 )
 
                 self.proxies.append(proxy_info)
+                self._proxies_by_string[proxy_string] = proxy_info
 
         self.logger.info(f"Loaded {len(self.proxies)} IPRoyal proxy sessions")
 
@@ -249,10 +251,7 @@ class IPRoyalManager:
 
     def _find_proxy(self, proxy_string: str) -> Optional[ProxyInfo]:
         """Find proxy by proxy string"""
-        for proxy in self.proxies:
-            if proxy.proxy_string == proxy_string:
-                return proxy
-        return None
+        return self._proxies_by_string.get(proxy_string)
 
     def _update_reputation(self, proxy: ProxyInfo):
         """
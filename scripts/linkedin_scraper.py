@@ -72,29 +72,25 @@ class LinkedInScraper:
         
         try:
             from ..api_utils import GoogleAPIClient
-            google_client = GoogleAPIClient(
-                os.getenv('GOOGLE_API_KEY'), 
-                os.getenv('GOOGLE_CSE_ID')
-            )
-            
-            for profile_url in profile_urls[:3]:  # Limit to top 3
-                # Search for cached version
-                cache_query = f'cache:{profile_url}'
+            with GoogleAPIClient(os.getenv('GOOGLE_API_KEY'), os.getenv('GOOGLE_CSE_ID')) as google_client:
+                for profile_url in profile_urls[:3]:  # Limit to top 3
+                    # Search for cached version
+                    cache_query = f'cache:{profile_url}'
                 
-                cache_data = google_client.search(cache_query, num_results=1)
-                if cache_data and 'items' in cache_data:
-                    for item in cache_data['items']:
-                        snippet = item.get('snippet', '')
-                        title = item.get('title', '')
+                    cache_data = google_client.search(cache_query, num_results=1)
+                    if cache_data and 'items' in cache_data:
+                        for item in cache_data['items']:
+                            snippet = item.get('snippet', '')
+                            title = item.get('title', '')
                         
-                        # Extract emails from cached content
-                        email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-                        found_emails = email_pattern.findall(f"{title} {snippet}")
+                            # Extract emails from cached content
+                            email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+                            found_emails = email_pattern.findall(f"{title} {snippet}")
                         
-                        for email in found_emails:
-                            if self._is_target_email(email, target_name):
-                                results['emails'].append(email.lower())
-                                self.logger.info(f"✅ Found email in Google cache: {email}")
+                            for email in found_emails:
+                                if self._is_target_email(email, target_name):
+                                    results['emails'].append(email.lower())
+                                    self.logger.info(f"✅ Found email in Google cache: {email}")
         
         except Exception as e:
             self.logger.debug(f"Google cache approach failed: {e}")
@@ -124,9 +124,9 @@ class ComprehensiveBreachSearcher:
                 results['total_records'] += dehashed_results.get('records_found', 0)
             results['databases_checked'].append('dehashed')
         
-        # Deduplicate
-        results['associated_emails'] = list(set(results['associated_emails']))
-        results['associated_usernames'] = list(set(results['associated_usernames']))
+        # Deduplicate, keeping the order the databases reported them in
+        results['associated_emails'] = list(dict.fromkeys(results['associated_emails']))
+        results['associated_usernames'] = list(dict.fromkeys(results['associated_usernames']))
         
         if results['found']:
             self.logger.warning(f"🚨 Phone number found in {len(results['breaches_found'])} breaches!")
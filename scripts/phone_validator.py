@@ -6,14 +6,22 @@ Uses NumVerify and Twilio APIs to validate and gather carrier information
 import os
 import requests
 import logging
+from functools import lru_cache
 from twilio.rest import Client
 from dotenv import load_dotenv
 from .api_utils import NumVerifyClient
 
 load_dotenv('config/.env')
 
+
+@lru_cache(maxsize=4)
+def twilio_client(sid, token):
+    """Shared Twilio client per credential pair, so lookups reuse its pooled connections"""
+    return Client(sid, token)
+
+
 class PhoneValidator:
-    def __init__(self, phone_number):
+    def __init__(self, phone_number, session=None):
         self.phone = phone_number
         self.logger = logging.getLogger(__name__)
 
@@ -23,7 +31,17 @@ class PhoneValidator:
         self.twilio_token = os.getenv('TWILIO_AUTH_TOKEN')
 
         # Rate-limited API clients
-        self.numverify_client = NumVerifyClient(self.numverify_key)
+        self.numverify_client = NumVerifyClient(self.numverify_key, session=session)
+
+    def close(self):
+        """Release the NumVerify client's pooled connections"""
+        self.numverify_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def validate_with_numverify(self):
         """Validate phone number using NumVerify API"""
@@ -69,7 +87,7 @@ class PhoneValidator:
             return {}
 
         try:
-            client = Client(self.twilio_sid, self.twilio_token)
+            client = twilio_client(self.twilio_sid, self.twilio_token)
             result = {}
 
             # Try basic validation first
@@ -180,26 +198,30 @@ class PhoneValidator:
                 summary['country'] = twilio_data['country_code']
 
             # Use Twilio line type intelligence data if available (more accurate than NumVerify)
-            if 'line_type_intelligence_data' in twilio_data:
-                lti_data = twilio_data['line_type_intelligence_data']
-                if lti_data.get('carrier_name'):
-                    summary['carrier'] = lti_data['carrier_name']
-                if lti_data.get('type'):
-                    summary['line_type'] = lti_data['type']
+            lti_data = twilio_data.get('line_type_intelligence_data')
+            if lti_data:
+                carrier_name = lti_data.get('carrier_name')
+                if carrier_name:
+                    summary['carrier'] = carrier_name
+                line_type = lti_data.get('type')
+                if line_type:
+                    summary['line_type'] = line_type
 
             summary['sources_used'].append('Twilio')
 
         # Extract owner name from Twilio if found
-        if twilio_data.get('OWNER_NAME'):
-            summary['owner_name'] = twilio_data['OWNER_NAME']
+        owner_name = twilio_data.get('OWNER_NAME')
+        if owner_name:
+            summary['owner_name'] = owner_name
             if 'Twilio Name Hunt' not in summary['sources_used']:
                 summary['sources_used'].append('Twilio Name Hunt')
 
         # Also check caller_name_data for names
-        if 'caller_name_data' in twilio_data:
-            caller_data = twilio_data['caller_name_data']
-            if isinstance(caller_data, dict) and caller_data.get('caller_name'):
-                summary['owner_name'] = caller_data['caller_name']
+        caller_data = twilio_data.get('caller_name_data')
+        if isinstance(caller_data, dict):
+            caller_name = caller_data.get('caller_name')
+            if caller_name:
+                summary['owner_name'] = caller_name
                 if 'Twilio Name Hunt' not in summary['sources_used']:
                     summary['sources_used'].append('Twilio Name Hunt')
 
@@ -27,6 +27,7 @@ class ProxyGoogleClient(RateLimitedAPIClient):
         self.use_iproyal = use_iproyal
         self.iproyal_manager = None
         self.proxy_rotation_enabled = False
+        self.proxy_dict = None  # requests proxies mapping, built once when IPRoyal is enabled
         
         # Initialize IPRoyal integration
         if self.use_iproyal:
@@ -47,6 +48,8 @@ class ProxyGoogleClient(RateLimitedAPIClient):
                     # Simple whitelisted setup - no authentication needed
                     self.proxy_host = config.get('proxy_host', 'geo.iproyal.com')
                     self.proxy_port = config.get('proxy_port', 51222)
+                    proxy_url = f"socks5://{self.proxy_host}:{self.proxy_port}"
+                    self.proxy_dict = {'http': proxy_url, 'https': proxy_url}
                     self.proxy_rotation_enabled = True
                     
                     self.logger.info(f"✅ IPRoyal whitelisted proxy enabled: {self.proxy_host}:{self.proxy_port}")
@@ -77,13 +80,7 @@ class ProxyGoogleClient(RateLimitedAPIClient):
         }
 
         # Try with IPRoyal whitelisted proxy first (much simpler)
-        if self.proxy_rotation_enabled and hasattr(self, 'proxy_host') and hasattr(self, 'proxy_port'):
-            # Simple whitelisted proxy format
-            proxy_dict = {
-                'http': f"socks5://{self.proxy_host}:{self.proxy_port}",
-                'https': f"socks5://{self.proxy_host}:{self.proxy_port}"
-            }
-            
+        if self.proxy_rotation_enabled and self.proxy_dict:
             self.logger.debug(f"Using IPRoyal whitelisted proxy: {self.proxy_host}:{self.proxy_port}")
             
             # Make request with proxy
@@ -92,7 +89,7 @@ class ProxyGoogleClient(RateLimitedAPIClient):
                 response = requests.get(
                     self.base_url, 
                     params=params, 
-                    proxies=proxy_dict,
+                    proxies=self.proxy_dict,
                     timeout=15
                 )
 
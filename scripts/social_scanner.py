@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
+import functools
+import io
+import os
 import requests
 import json
-import time
 import logging
 import re
-from bs4 import BeautifulSoup
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus, urlparse
+from cachetools import TTLCache
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -12,13 +19,168 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from .api_utils import RATE_LIMITER
+
+try:
+    import re2 as bio_regex  # google-re2: linear-time matching on untrusted bio text
+except ImportError:
+    bio_regex = re
+
+# Combined CSS selectors - one tree walk instead of one find() per field
+LINKEDIN_TOP_CARD_SELECTOR = ', '.join([
+    'h1[class*="top-card"][class*="name"]',
+    'div[class*="top-card"][class*="headline"]',
+    'span[class*="top-card"][class*="location"]'
+])
+
+INSTAGRAM_BIO_SELECTOR = ', '.join([
+    'div[class*="biography"]',
+    'h1[class*="_aacl"]',
+    'div[class*="_aa_c"]',
+    'span[class*="_aade"]'
+])
+
+X_PROFILE_SELECTOR = ', '.join([
+    'div[data-testid="UserDescription"]',
+    'div[data-testid="UserName"]',
+    'span[data-testid="UserLocation"]',
+    'a[data-testid="UserUrl"]',
+    'a[href$="/followers"]',
+    'a[href$="/verified_followers"]'
+])
+
+X_PROFILE_TESTIDS = {
+    'UserDescription': 'bio_text',
+    'UserName': 'full_name',
+    'UserLocation': 'location',
+    'UserUrl': 'website'
+}
+
+GITHUB_BIO_SELECTOR = ', '.join([
+    'div[class*="user-profile-bio"]',
+    'div[data-bio-text]',
+    'article[class*="markdown-body"]',
+    'div[class*="vcard-detail"]'
+])
+
+# URL / headline patterns, compiled once instead of per link
+LINKEDIN_PROFILE_URL_PATTERN = re.compile(r'(https://[a-z]{2,3}\.linkedin\.com/in/[^/?&]+)')
+INSTAGRAM_USERNAME_PATTERN = re.compile(r'instagram\.com/([^/\?]+)')
+TWITTER_HANDLE_PATTERN = re.compile(r'twitter\.com/([^/?]+)')
+HEADLINE_JOB_PATTERN = re.compile(r'(.+?)\s+at\s+(.+)')  # "Job Title at Company"
+
+EMAIL_PATTERN = bio_regex.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Emails and US phone numbers in a single scan of the bio (email alternative wins on overlap)
+CONTACT_PATTERN = bio_regex.compile(
+    r'\b(?P<email>[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})\b'
+    r'|\b(?:\+?1[-.]?)?\(?(?P<area>[0-9]{3})\)?[-.]?(?P<exchange>[0-9]{3})[-.]?(?P<line>[0-9]{4})\b'
+)
+
+def _node_text(node):
+    """Stripped text of a parsed node, or None when the selector matched nothing"""
+    return node.text().strip() if node is not None else None
+
+def _iter_link_hrefs(page_source):
+    """Yield <a href> values in one streaming pass, without building a full DOM"""
+    events = etree.iterparse(
+        io.BytesIO(page_source.encode('utf-8')), events=('end',), tag='a',
+        html=True, recover=True, encoding='utf-8'
+    )
+    try:
+        for _, elem in events:
+            href = elem.get('href')
+            elem.clear(keep_tail=True)
+            if href:
+                yield href
+    except etree.XMLSyntaxError:
+        return  # Empty page - no links
+
+def _memoize_scrape(platform):
+    """Cache a successful _scrape_*_profile result on (platform, key) for the scanner's lifetime"""
+    def decorator(scrape):
+        @functools.wraps(scrape)
+        def wrapper(self, key):
+            cache_key = (platform, key)
+            with self._scrape_cache_lock:
+                if cache_key in self._scrape_cache:
+                    return self._scrape_cache[cache_key]
+            result = scrape(self, key)
+            # Failed or skipped scrapes are retried on the next call instead of pinned
+            if result.get('scraped') and not result.get('error'):
+                with self._scrape_cache_lock:
+                    result = self._scrape_cache.setdefault(cache_key, result)
+            return result
+        return wrapper
+    return decorator
+
+# Upper bound for explicit Selenium waits - returns as soon as the selector renders
+PAGE_WAIT_TIMEOUT = 5
+
+# Process-wide LRU of rendered profile HTML keyed by URL, so re-scanning the
+# same handle (in this scan or a later one) skips the Chrome page load.
+# Entries expire so a long-lived process doesn't keep serving stale bios
+PROFILE_HTML_CACHE_SIZE = 256
+PROFILE_HTML_CACHE_TTL = 1800  # Seconds
+_profile_html_cache = TTLCache(maxsize=PROFILE_HTML_CACHE_SIZE, ttl=PROFILE_HTML_CACHE_TTL)
+_profile_html_cache_lock = threading.Lock()
+
+# Platform checks run concurrently; the shared driver and per-host rate limiter keep them polite
+PLATFORM_SCAN_WORKERS = 8
+
+# GitHub's public REST search - JSON over plain HTTP, so the GitHub check never needs Chrome
+GITHUB_USER_SEARCH_API = "https://api.github.com/search/users"
+
+# Concurrent profile scrapes per platform (HTTP-fetched profiles only - the
+# shared Selenium driver cannot be driven from several threads)
+PROFILE_SCRAPE_WORKERS = 3
+
+
+def _get_cached_html(url):
+    """Return cached profile HTML for url, or None"""
+    with _profile_html_cache_lock:
+        return _profile_html_cache.get(url)
+
+
+def _cache_html(url, page_source):
+    """Store profile HTML; TTLCache drops expired entries, then the least recently used"""
+    with _profile_html_cache_lock:
+        _profile_html_cache[url] = page_source
+
 class SocialMediaScanner:
     def __init__(self, phone_number, discovered_emails=None, enriched_identity=None):
         self.phone = phone_number
         self.emails = discovered_emails or []
         self.enriched_identity = enriched_identity or {}
         self.logger = logging.getLogger(__name__)
+
+        # Primary name and URL-encoded search terms, computed once for all platforms
+        primary_names = self.enriched_identity.get('primary_names') or []
+        self.primary_name = primary_names[0] if primary_names else None
+        self._name_q = quote_plus(self.primary_name) if self.primary_name else None
+        self._phone_q = quote_plus(self.phone)
+
+        # Nitter mirror used for static-HTML Twitter profile scrapes
+        self.nitter_base_url = os.getenv('NITTER_BASE_URL', 'https://nitter.net').rstrip('/')
+
+        # Profile scrape results keyed by (platform, username) - platforms cross-reference handles
+        self._scrape_cache = {}
+        self._scrape_cache_lock = threading.Lock()  # Platform checks scrape from PLATFORM_SCAN_WORKERS threads
+
+        # One browser shared by concurrently running platform checks
+        self._driver_lock = threading.Lock()
+        # Per-host token buckets shared with the other scrapers in this process
+        self.rate_limiter = RATE_LIMITER
+
+        self.http = self._create_http_session()
         self.setup_selenium()
+
+    def _create_http_session(self):
+        """Shared keep-alive session for profiles that render without JavaScript"""
+        from .chrome_config import COMMON_USER_AGENTS
+        session = requests.Session()
+        session.headers.update({'User-Agent': COMMON_USER_AGENTS[0]})
+        return session
         
     def setup_selenium(self):
         """Setup headless Chrome for dynamic content"""
@@ -47,12 +209,12 @@ class SocialMediaScanner:
         }
 
         # Facebook search by phone number
-        phone_search_url = f"https://www.facebook.com/search/top?q={self.phone}"
+        phone_search_url = f"https://www.facebook.com/search/top?q={self._phone_q}"
         results['search_urls'].append({'type': 'phone', 'url': phone_search_url})
 
         # Facebook search by discovered emails
         for email in self.emails[:3]:  # Limit to first 3 emails
-            email_search_url = f"https://www.facebook.com/search/top?q={email}"
+            email_search_url = f"https://www.facebook.com/search/top?q={quote_plus(email)}"
             results['search_urls'].append({'type': 'email', 'url': email_search_url, 'email': email})
 
         # Additional metadata
@@ -60,6 +222,44 @@ class SocialMediaScanner:
 
         return results
     
+    def _load_page(self, url: str, wait_selector: str, timeout: float = PAGE_WAIT_TIMEOUT) -> str:
+        """Navigate to url and return page source once wait_selector is present (or timeout hits)"""
+        with self._driver_lock:
+            self._throttle_host(url)
+            self.driver.get(url)
+            try:
+                WebDriverWait(self.driver, timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
+                )
+            except TimeoutException:
+                # Login walls and empty results never render the selector - parse what we have
+                self.logger.debug(f"Timed out waiting for '{wait_selector}' on {url}")
+            return self.driver.page_source
+
+    def _throttle_host(self, url: str):
+        """Wait for the url's host token bucket (e.g. Google SERPs shared by LinkedIn and Instagram)"""
+        self.rate_limiter.acquire(urlparse(url).netloc)
+
+    def _fetch_profile_html(self, url: str, wait_selector: str) -> str:
+        """Load a profile page with Selenium, reusing HTML already fetched for this URL"""
+        page_source = _get_cached_html(url)
+        if page_source is None:
+            page_source = self._load_page(url, wait_selector)
+            _cache_html(url, page_source)
+        return page_source
+
+    def _fetch_static_html(self, url: str, timeout: int = 10) -> str:
+        """Fetch a server-rendered profile page over the shared HTTP session (thread-safe)"""
+        page_source = _get_cached_html(url)
+        if page_source is None:
+            self._throttle_host(url)
+            response = self.http.get(url, timeout=timeout)
+            response.raise_for_status()
+            page_source = response.text
+            _cache_html(url, page_source)
+        return page_source
+
+    @_memoize_scrape('linkedin')
     def _scrape_linkedin_profile(self, profile_url: str) -> dict:
         """Scrape LinkedIn public profile for comprehensive data (login-wall limited)"""
         data = {
@@ -76,32 +276,21 @@ class SocialMediaScanner:
             return data
 
         try:
-            self.driver.get(profile_url)
-            time.sleep(3)
-
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            page_source = self._fetch_profile_html(profile_url, 'h1[class*="top-card"]')
+            tree = LexborHTMLParser(page_source)
 
             # LinkedIn often shows limited data without login, but try anyway
-            # Extract full name
-            name_elem = soup.find('h1', {'class': re.compile(r'.*top-card.*name.*')})
-            if name_elem:
-                data['full_name'] = name_elem.get_text().strip()
-
-            # Extract headline/job title
-            headline_elem = soup.find('div', {'class': re.compile(r'.*top-card.*headline.*')})
-            if headline_elem:
-                data['headline'] = headline_elem.get_text().strip()
-
-            # Extract location
-            location_elem = soup.find('span', {'class': re.compile(r'.*top-card.*location.*')})
-            if location_elem:
-                data['location'] = location_elem.get_text().strip()
+            # Single selector pass for name (h1), headline (div) and location (span)
+            fields_by_tag = {'h1': 'full_name', 'div': 'headline', 'span': 'location'}
+            for elem in tree.css(LINKEDIN_TOP_CARD_SELECTOR):
+                field = fields_by_tag[elem.tag]
+                if data[field] is None:
+                    data[field] = _node_text(elem)
 
             # Try to extract company/job title from headline
             if data['headline']:
                 # Pattern: "Job Title at Company"
-                job_match = re.search(r'(.+?)\s+at\s+(.+)', data['headline'])
+                job_match = HEADLINE_JOB_PATTERN.search(data['headline'])
                 if job_match:
                     data['job_title'] = job_match.group(1).strip()
                     data['company'] = job_match.group(2).strip()
@@ -130,33 +319,24 @@ class SocialMediaScanner:
         }
 
         # Get primary name if available
-        primary_name = None
-        if self.enriched_identity.get('primary_names'):
-            primary_name = self.enriched_identity['primary_names'][0]
+        primary_name = self.primary_name
 
         # LinkedIn search by name (via Google - more effective than LinkedIn direct)
         if primary_name and self.selenium_available:
             try:
-                search_query = f"site:linkedin.com/in/ {primary_name}"
-                search_url = f"https://www.google.com/search?q={search_query.replace(' ', '+')}"
-                self.driver.get(search_url)
-                time.sleep(3)
-
-                page_source = self.driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
+                search_url = f"https://www.google.com/search?q=site:linkedin.com/in/+{self._name_q}"
+                page_source = self._load_page(search_url, 'a[href*="linkedin.com/in/"]')
 
                 # Extract LinkedIn profile URLs from Google results
                 linkedin_urls = []
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
+                for href in _iter_link_hrefs(page_source):
                     if 'linkedin.com/in/' in href:
                         # Extract clean profile URL
-                        match = re.search(r'(https://[a-z]{2,3}\.linkedin\.com/in/[^/?&]+)', href)
-                        if match:
+                        match = LINKEDIN_PROFILE_URL_PATTERN.search(href)
+                        if match and match.group(1) not in linkedin_urls:
                             linkedin_urls.append(match.group(1))
-
-                # Dedupe and limit
-                linkedin_urls = list(set(linkedin_urls))[:3]
+                            if len(linkedin_urls) >= 3:  # Dedupe and limit, keeping rank order
+                                break
 
                 # Attempt to scrape each profile (likely login-walled)
                 for profile_url in linkedin_urls:
@@ -183,14 +363,12 @@ class SocialMediaScanner:
                             'job_title': scrape_result.get('job_title')
                         })
 
-                    time.sleep(2)
-
             except Exception as e:
                 self.logger.warning(f"LinkedIn search/scrape error: {e}")
 
         # Generate search URLs for manual checking
         if primary_name:
-            search_url = f"https://www.linkedin.com/search/results/all/?keywords={primary_name.replace(' ', '%20')}"
+            search_url = f"https://www.linkedin.com/search/results/all/?keywords={self._name_q}"
             results['search_urls'].append({'type': 'name_search', 'url': search_url})
 
         results['note'] = f"LinkedIn login-wall restricts scraping. Found {len(results['usernames_discovered'])} profiles, {len(results['profiles'])} with data. Manual verification recommended."
@@ -226,12 +404,57 @@ class SocialMediaScanner:
     
     def _extract_emails_from_text(self, text: str) -> list:
         """Extract email addresses from text content"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return list(set(emails))  # Dedupe
-
+        return list(dict.fromkeys(EMAIL_PATTERN.findall(text)))  # Dedupe, keep order
+
+    def _extract_contacts_from_text(self, text: str) -> tuple:
+        """Extract (emails, phone_numbers) from text in one regex pass"""
+        emails, phones = {}, {}
+        for match in CONTACT_PATTERN.finditer(text):
+            if match.group('email'):
+                emails[match.group('email')] = None
+            else:
+                phones[match.group('area') + match.group('exchange') + match.group('line')] = None
+        return list(emails), list(phones)  # Deduped, first-seen order
+
+    def _parse_nitter_profile(self, tree, data: dict):
+        """Fill profile data from a Nitter page (static HTML, stable profile-* classes)"""
+        data['full_name'] = _node_text(tree.css_first('.profile-card-fullname'))
+
+        bio_elem = tree.css_first('.profile-bio')
+        if bio_elem:
+            data['bio_text'] = _node_text(bio_elem)
+
+        data['location'] = _node_text(tree.css_first('.profile-location'))
+
+        website_elem = tree.css_first('.profile-website a')
+        if website_elem:
+            data['website'] = website_elem.attributes.get('href')
+
+        data['follower_count'] = _node_text(tree.css_first('.profile-statlist .followers .profile-stat-num'))
+
+    def _parse_x_profile(self, tree, data: dict):
+        """Fill profile data from a rendered x.com page using 2025 data-testid selectors"""
+        # One selector pass over the tree, dispatched by data-testid (first match per field wins)
+        found = set()
+        for node in tree.css(X_PROFILE_SELECTOR):
+            field = X_PROFILE_TESTIDS.get(node.attributes.get('data-testid'), 'follower_count')
+            if field in found:
+                continue
+            found.add(field)
+
+            if field == 'full_name':
+                # UserName contains both display name and @handle
+                data['full_name'] = _node_text(node).split('@')[0].strip()
+            elif field == 'website':
+                data['website'] = node.attributes.get('href')
+            elif field == 'follower_count':
+                data['follower_count'] = node.text()
+            else:
+                data[field] = _node_text(node)
+
+    @_memoize_scrape('twitter')
     def _scrape_twitter_profile(self, username: str) -> dict:
-        """Scrape Twitter profile for comprehensive data extraction using 2025 data-testid selectors"""
+        """Scrape Twitter profile via Nitter static HTML, falling back to rendering x.com"""
         data = {
             'emails': [],
             'phone_numbers': [],
@@ -243,53 +466,27 @@ class SocialMediaScanner:
             'scraped': False
         }
 
-        if not self.selenium_available:
-            return data
-
         try:
-            url = f"https://twitter.com/{username}"
-            self.driver.get(url)
-            time.sleep(3)
-
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-
-            # Extract bio using CORRECT 2025 data-testid selectors
-            bio_elem = soup.find('div', {'data-testid': 'UserDescription'})
-            if bio_elem:
-                data['bio_text'] = bio_elem.get_text().strip()
-
-            # Extract user full name
-            name_elem = soup.find('div', {'data-testid': 'UserName'})
-            if name_elem:
-                # UserName contains both display name and @handle
-                name_parts = name_elem.get_text().strip().split('@')
-                if name_parts:
-                    data['full_name'] = name_parts[0].strip()
-
-            # Extract location
-            location_elem = soup.find('span', {'data-testid': 'UserLocation'})
-            if location_elem:
-                data['location'] = location_elem.get_text().strip()
-
-            # Extract website
-            website_elem = soup.find('a', {'data-testid': 'UserUrl'})
-            if website_elem:
-                data['website'] = website_elem.get('href')
-
-            # Extract follower count
-            follower_elem = soup.find('a', href=re.compile(r'/verified_followers$|/followers$'))
-            if follower_elem:
-                follower_text = follower_elem.get_text()
-                data['follower_count'] = follower_text
+            # Nitter serves the same profile data without JavaScript - one HTTP GET
+            try:
+                page_source = self._fetch_static_html(f"{self.nitter_base_url}/{username}")
+                self._parse_nitter_profile(LexborHTMLParser(page_source), data)
+            except requests.RequestException as e:
+                self.logger.debug(f"Nitter unavailable for @{username}: {e}")
+
+            # Fall back to the JS-rendered x.com profile when Nitter gave us nothing
+            if not (data['full_name'] or data['bio_text']):
+                if not self.selenium_available:
+                    return data
+
+                url = f"https://twitter.com/{username}"
+                page_source = self._fetch_profile_html(
+                    url, 'div[data-testid="UserDescription"], div[data-testid="UserName"]'
+                )
+                self._parse_x_profile(LexborHTMLParser(page_source), data)
 
             # Extract emails and phone numbers from bio
-            data['emails'] = self._extract_emails_from_text(data['bio_text'])
-
-            # Phone number pattern
-            phone_pattern = r'\b(?:\+?1[-.]?)?\(?([0-9]{3})\)?[-.]?([0-9]{3})[-.]?([0-9]{4})\b'
-            phones = re.findall(phone_pattern, data['bio_text'])
-            data['phone_numbers'] = [''.join(p) for p in phones]
+            data['emails'], data['phone_numbers'] = self._extract_contacts_from_text(data['bio_text'])
 
             data['scraped'] = True
 
@@ -316,29 +513,29 @@ class SocialMediaScanner:
         }
 
         # Get primary name if available
-        primary_name = None
-        if self.enriched_identity.get('primary_names'):
-            primary_name = self.enriched_identity['primary_names'][0]
+        primary_name = self.primary_name
 
         # Try to find profile by name
         if primary_name and self.selenium_available:
             try:
                 # Search Twitter for name
-                search_url = f"https://twitter.com/search?q={primary_name.replace(' ', '%20')}&f=user"
-                self.driver.get(search_url)
-                time.sleep(3)
-
+                search_url = f"https://twitter.com/search?q={self._name_q}&f=user"
                 # Get potential usernames from search results
-                page_source = self.driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
+                page_source = self._load_page(search_url, 'div[data-testid="UserCell"]')
+                tree = LexborHTMLParser(page_source)
 
-                # Find profile links
-                profile_links = soup.find_all('a', href=re.compile(r'^/[^/]+$'))
+                # Find profile links (single-segment relative hrefs like "/handle")
                 usernames = []
-                for link in profile_links[:3]:  # Top 3 results
-                    username = link['href'].strip('/')
-                    if username and not username.startswith('search'):
+                seen = set()
+                for link in tree.css('a[href^="/"]'):
+                    username = link.attributes.get('href')[1:]
+                    if '/' in username:
+                        continue
+                    if username and not username.startswith('search') and username not in seen:
+                        seen.add(username)
                         usernames.append(username)
+                        if len(usernames) >= 3:  # Top 3 unique results
+                            break
 
                 # Scrape each profile for comprehensive data
                 for username in usernames:
@@ -369,19 +566,18 @@ class SocialMediaScanner:
                         results['found'] = True
                         results['profiles'].append(profile_data)
 
-                    time.sleep(2)  # Rate limit
-
             except Exception as e:
                 self.logger.warning(f"Twitter search/scrape error: {e}")
 
         # Generate search URLs for manual checking
         if primary_name:
-            search_url = f"https://twitter.com/search?q={primary_name.replace(' ', '%20')}"
+            search_url = f"https://twitter.com/search?q={self._name_q}"
             results['search_urls'].append({'type': 'name_search', 'url': search_url})
 
         results['note'] = f"Scraped {len(results['profiles'])} profiles, found {len(results['emails_discovered'])} emails, {len(results['usernames_discovered'])} usernames"
         return results
 
+    @_memoize_scrape('instagram')
     def _scrape_instagram_profile(self, username: str) -> dict:
         """Scrape Instagram profile for comprehensive data extraction"""
         data = {
@@ -400,41 +596,23 @@ class SocialMediaScanner:
 
         try:
             url = f"https://www.instagram.com/{username}/"
-            self.driver.get(url)
-            time.sleep(3)
+            page_source = self._fetch_profile_html(url, 'header section')
+            tree = LexborHTMLParser(page_source)
 
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-
-            # Extract bio
-            bio_selectors = [
-                'div[class*="biography"]',
-                'h1[class*="_aacl"]',
-                'div[class*="_aa_c"]',
-                'span[class*="_aade"]'
-            ]
-
-            for selector in bio_selectors:
-                elements = soup.select(selector)
-                for elem in elements:
-                    data['bio_text'] += elem.get_text() + " "
+            # Extract bio (all bio selectors matched in one pass)
+            for elem in tree.css(INSTAGRAM_BIO_SELECTOR):
+                data['bio_text'] += elem.text() + " "
 
             # Extract full name
-            name_elem = soup.find('span', {'class': re.compile(r'.*_aacl.*')})
-            if name_elem:
-                data['full_name'] = name_elem.get_text().strip()
+            data['full_name'] = _node_text(tree.css_first('span[class*="_aacl"]'))
 
             # Extract website/link
-            link_elem = soup.find('a', {'class': re.compile(r'.*external_link.*')})
+            link_elem = tree.css_first('a[class*="external_link"]')
             if link_elem:
-                data['website'] = link_elem.get('href')
+                data['website'] = link_elem.attributes.get('href')
 
             # Extract emails and phone numbers
-            data['emails'] = self._extract_emails_from_text(data['bio_text'])
-
-            phone_pattern = r'\b(?:\+?1[-.]?)?\(?([0-9]{3})\)?[-.]?([0-9]{3})[-.]?([0-9]{4})\b'
-            phones = re.findall(phone_pattern, data['bio_text'])
-            data['phone_numbers'] = [''.join(p) for p in phones]
+            data['emails'], data['phone_numbers'] = self._extract_contacts_from_text(data['bio_text'])
 
             data['scraped'] = True
 
@@ -461,37 +639,27 @@ class SocialMediaScanner:
         }
 
         # Get primary name if available
-        primary_name = None
-        if self.enriched_identity.get('primary_names'):
-            primary_name = self.enriched_identity['primary_names'][0]
+        primary_name = self.primary_name
 
         # Try to find profile by name
         if primary_name and self.selenium_available:
             try:
                 # Google search for Instagram profile (Instagram search requires login)
-                search_query = f"site:instagram.com {primary_name}"
-                search_url = f"https://www.google.com/search?q={search_query.replace(' ', '+')}"
-                self.driver.get(search_url)
-                time.sleep(3)
-
-                page_source = self.driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
+                search_url = f"https://www.google.com/search?q=site:instagram.com+{self._name_q}"
+                page_source = self._load_page(search_url, 'a[href*="instagram.com/"]')
 
                 # Extract Instagram profile URLs from Google results
                 instagram_urls = []
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
+                for href in _iter_link_hrefs(page_source):
                     if 'instagram.com/' in href and '/p/' not in href:  # Profile, not post
                         # Extract clean username from URL
-                        import re
-                        match = re.search(r'instagram\.com/([^/\?]+)', href)
+                        match = INSTAGRAM_USERNAME_PATTERN.search(href)
                         if match:
                             username = match.group(1)
-                            if username not in ['explore', 'accounts', 'directory']:
+                            if username not in ('explore', 'accounts', 'directory') and username not in instagram_urls:
                                 instagram_urls.append(username)
-
-                # Dedupe and limit
-                instagram_urls = list(set(instagram_urls))[:3]
+                                if len(instagram_urls) >= 3:  # Dedupe and limit, keeping rank order
+                                    break
 
                 # Scrape each profile
                 for username in instagram_urls:
@@ -520,19 +688,18 @@ class SocialMediaScanner:
                         results['found'] = True
                         results['profiles'].append(profile_data)
 
-                    time.sleep(2)
-
             except Exception as e:
                 self.logger.warning(f"Instagram search/scrape error: {e}")
 
         # Generate search URLs for manual checking
         if primary_name:
-            search_url = f"https://www.google.com/search?q=site:instagram.com+{primary_name.replace(' ', '+')}"
+            search_url = f"https://www.google.com/search?q=site:instagram.com+{self._name_q}"
             results['search_urls'].append({'type': 'name_search', 'url': search_url})
 
         results['note'] = f"Scraped {len(results['profiles'])} profiles, found {len(results['emails_discovered'])} emails, {len(results['usernames_discovered'])} usernames"
         return results
 
+    @_memoize_scrape('github')
     def _scrape_github_profile(self, username: str) -> dict:
         """Scrape GitHub profile for comprehensive data extraction"""
         data = {
@@ -546,56 +713,37 @@ class SocialMediaScanner:
             'scraped': False
         }
 
-        if not self.selenium_available:
-            return data
-
         try:
+            # GitHub profiles are server-rendered, so skip the browser entirely
             url = f"https://github.com/{username}"
-            self.driver.get(url)
-            time.sleep(2)
-
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            page_source = self._fetch_static_html(url)
+            tree = LexborHTMLParser(page_source)
 
             # Extract full name
-            name_elem = soup.find('span', {'class': 'p-name'}) or soup.find('span', {'itemprop': 'name'})
-            if name_elem:
-                data['full_name'] = name_elem.get_text().strip()
+            name_elem = tree.css_first('span.p-name') or tree.css_first('span[itemprop="name"]')
+            data['full_name'] = _node_text(name_elem)
 
             # Extract location
-            location_elem = soup.find('span', {'class': 'p-label'})
-            if location_elem:
-                data['location'] = location_elem.get_text().strip()
+            data['location'] = _node_text(tree.css_first('span.p-label'))
 
             # Extract company
-            company_elem = soup.find('span', {'class': 'p-org'})
-            if company_elem:
-                data['company'] = company_elem.get_text().strip()
+            data['company'] = _node_text(tree.css_first('span.p-org'))
 
             # Extract website
-            website_elem = soup.find('a', {'class': 'Link--primary'}) or soup.find('a', {'itemprop': 'url'})
+            website_elem = tree.css_first('a.Link--primary') or tree.css_first('a[itemprop="url"]')
             if website_elem:
-                data['website'] = website_elem.get('href')
+                data['website'] = website_elem.attributes.get('href')
 
             # Extract Twitter username
-            twitter_elem = soup.find('a', {'href': re.compile(r'twitter\.com')})
+            twitter_elem = tree.css_first('a[href*="twitter.com"]')
             if twitter_elem:
-                twitter_match = re.search(r'twitter\.com/([^/?]+)', twitter_elem.get('href', ''))
+                twitter_match = TWITTER_HANDLE_PATTERN.search(twitter_elem.attributes.get('href') or '')
                 if twitter_match:
                     data['twitter_username'] = twitter_match.group(1)
 
             # Extract bio
-            bio_selectors = [
-                'div[class*="user-profile-bio"]',
-                'div[data-bio-text]',
-                'article[class*="markdown-body"]',
-                'div[class*="vcard-detail"]'
-            ]
-
-            for selector in bio_selectors:
-                elements = soup.select(selector)
-                for elem in elements:
-                    data['bio_text'] += elem.get_text() + " "
+            for elem in tree.css(GITHUB_BIO_SELECTOR):
+                data['bio_text'] += elem.text() + " "
 
             # Extract emails
             data['emails'] = self._extract_emails_from_text(data['bio_text'])
@@ -625,36 +773,20 @@ class SocialMediaScanner:
         }
 
         # Get primary name if available
-        primary_name = None
-        if self.enriched_identity.get('primary_names'):
-            primary_name = self.enriched_identity['primary_names'][0]
+        primary_name = self.primary_name
 
         # Search by name first
-        if primary_name and self.selenium_available:
+        if primary_name:
             try:
-                search_url = f"https://github.com/search?q={primary_name.replace(' ', '+')}&type=users"
-                self.driver.get(search_url)
-                time.sleep(3)
+                usernames = self._search_github_users(primary_name)
 
-                page_source = self.driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
-
-                # Extract GitHub usernames from search results
-                usernames = []
-                for link in soup.find_all('a', {'data-hovercard-type': 'user'}):
-                    href = link.get('href', '')
-                    if href.startswith('/') and len(href.split('/')) == 2:
-                        username = href.strip('/')
-                        usernames.append(username)
-
-                # Dedupe and limit
-                usernames = list(set(usernames))[:3]
-
-                # Scrape each profile
+                # Scrape profiles concurrently over the shared HTTP session
                 for username in usernames:
                     self.logger.info(f"🔍 Scraping GitHub profile: {username}")
-                    scrape_result = self._scrape_github_profile(username)
+                with ThreadPoolExecutor(max_workers=PROFILE_SCRAPE_WORKERS) as executor:
+                    scrape_results = list(executor.map(self._scrape_github_profile, usernames))
 
+                for username, scrape_result in zip(usernames, scrape_results):
                     # Always track discovered username
                     results['usernames_discovered'].append({
                         'platform': 'github',
@@ -679,19 +811,50 @@ class SocialMediaScanner:
                         results['found'] = True
                         results['profiles'].append(profile_data)
 
-                    time.sleep(2)
+                    # Follow the linked Twitter handle (free if the Twitter check already scraped it)
+                    twitter_username = scrape_result.get('twitter_username')
+                    if twitter_username:
+                        twitter_result = self._scrape_twitter_profile(twitter_username)
+                        results['usernames_discovered'].append({
+                            'platform': 'twitter',
+                            'username': twitter_username,
+                            'profile_url': f"https://twitter.com/{twitter_username}",
+                            'linked_from': f"github:{username}"
+                        })
+                        results['emails_discovered'].extend(twitter_result.get('emails', []))
 
             except Exception as e:
                 self.logger.warning(f"GitHub search/scrape error: {e}")
 
         # Also search by discovered emails
         for email in self.emails[:3]:
-            github_search_url = f"https://github.com/search?q={email}&type=users"
+            github_search_url = f"https://github.com/search?q={quote_plus(email)}&type=users"
             results['search_urls'].append({'type': 'email', 'url': github_search_url, 'email': email})
 
         results['note'] = f"Scraped {len(results['profiles'])} profiles, found {len(results['emails_discovered'])} emails, {len(results['usernames_discovered'])} usernames"
         return results
 
+    def _search_github_users(self, query: str, limit: int = 3) -> list:
+        """Return up to limit GitHub logins matching query, in search rank order"""
+        self._throttle_host(GITHUB_USER_SEARCH_API)
+        response = self.http.get(
+            GITHUB_USER_SEARCH_API,
+            params={'q': query, 'per_page': limit},
+            headers={'Accept': 'application/vnd.github+json'},
+            timeout=10
+        )
+        response.raise_for_status()
+        logins = dict.fromkeys(item['login'] for item in response.json().get('items', []))
+        return list(logins)[:limit]
+
+    def _scan_platform(self, platform_name: str, checker_func) -> dict:
+        """Run one platform check, converting failures into an error entry"""
+        try:
+            return checker_func()
+        except Exception as e:
+            self.logger.error(f"Error checking {platform_name}: {e}")
+            return {'error': str(e)}
+
     def scan_all_platforms(self):
         """Scan all configured platforms with comprehensive data aggregation"""
         results = {
@@ -726,51 +889,66 @@ class SocialMediaScanner:
 
         total_search_urls = 0
 
-        for platform_name, checker_func in platforms:
-            try:
-                platform_results = checker_func()
+        # Insertion-ordered sets (dict keys) so duplicates are dropped as they arrive
+        all_emails = {}
+        all_phone_numbers = {}
+        all_usernames = {}
+        all_locations = {}
+        all_companies = {}
+        all_websites = {}
+
+        # Run every platform check concurrently, then merge in platform order so output is stable
+        with ThreadPoolExecutor(max_workers=PLATFORM_SCAN_WORKERS) as executor:
+            futures = [
+                (platform_name, executor.submit(self._scan_platform, platform_name, checker_func))
+                for platform_name, checker_func in platforms
+            ]
+
+            for platform_name, future in futures:
+                platform_results = future.result()
                 results[platform_name] = platform_results
 
                 # Aggregate discovered data
                 if 'emails_discovered' in platform_results:
-                    results['aggregated_data']['all_emails'].extend(platform_results['emails_discovered'])
+                    all_emails.update(dict.fromkeys(platform_results['emails_discovered']))
 
                 if 'usernames_discovered' in platform_results:
-                    results['aggregated_data']['all_usernames'].extend(platform_results['usernames_discovered'])
+                    for entry in platform_results['usernames_discovered']:
+                        all_usernames.setdefault((entry['platform'], entry['username']), entry)
 
                 # Extract locations, companies, etc from profiles
                 if 'profiles' in platform_results:
                     for profile in platform_results['profiles']:
+                        # Keyed by (platform, value) - the same value from two profiles is listed once
                         if profile.get('location'):
-                            results['aggregated_data']['all_locations'].append({
+                            all_locations.setdefault((platform_name, profile['location']), {
                                 'platform': platform_name,
                                 'location': profile['location']
                             })
                         if profile.get('company'):
-                            results['aggregated_data']['all_companies'].append({
+                            all_companies.setdefault((platform_name, profile['company']), {
                                 'platform': platform_name,
                                 'company': profile['company']
                             })
                         if profile.get('website'):
-                            results['aggregated_data']['all_websites'].append({
+                            all_websites.setdefault((platform_name, profile['website']), {
                                 'platform': platform_name,
                                 'website': profile['website']
                             })
                         if profile.get('phone_numbers'):
-                            results['aggregated_data']['all_phone_numbers'].extend(profile['phone_numbers'])
+                            all_phone_numbers.update(dict.fromkeys(profile['phone_numbers']))
 
                 # Count search URLs
                 if 'search_urls' in platform_results:
                     total_search_urls += len(platform_results['search_urls'])
 
-                time.sleep(1)  # Rate limiting
-            except Exception as e:
-                self.logger.error(f"Error checking {platform_name}: {e}")
-                results[platform_name] = {'error': str(e)}
-
-        # Dedupe aggregated data
-        results['aggregated_data']['all_emails'] = list(set(results['aggregated_data']['all_emails']))
-        results['aggregated_data']['all_phone_numbers'] = list(set(results['aggregated_data']['all_phone_numbers']))
+        # Serialize deduped aggregates back to lists
+        results['aggregated_data']['all_emails'] = list(all_emails)
+        results['aggregated_data']['all_phone_numbers'] = list(all_phone_numbers)
+        results['aggregated_data']['all_usernames'] = list(all_usernames.values())
+        results['aggregated_data']['all_locations'] = list(all_locations.values())
+        results['aggregated_data']['all_companies'] = list(all_companies.values())
+        results['aggregated_data']['all_websites'] = list(all_websites.values())
 
         # Update summary counts
         results['summary']['total_platforms'] = len(platforms)
@@ -782,6 +960,7 @@ class SocialMediaScanner:
 
         if self.driver:
             self.driver.quit()
+        self.http.close()
 
         self.logger.info(f"🎯 Social media scan complete: {len(platforms)} platforms scanned")
         self.logger.info(f"   📧 {results['summary']['total_emails_discovered']} emails discovered")
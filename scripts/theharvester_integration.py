@@ -5,38 +5,164 @@ Much more effective than Google Custom Search for finding actual emails
 """
 
 import os
+import re
 import json
-import subprocess
+import asyncio
+import functools
+import shutil
 import logging
+import random
 import time
-from typing import Dict, List
+from collections import deque
+from typing import Dict, List, Optional
 from pathlib import Path
 
+from .api_utils import RATE_LIMITER
+
+try:
+    import orjson  # Several times faster than json on large harvester dumps
+except ImportError:
+    orjson = None
+
+# Personal email providers searched when hunting by name
+PERSONAL_EMAIL_DOMAINS = ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com']
+
+HARVEST_ENGINE = 'duckduckgo'            # theHarvester source searched for each domain
+HARVEST_ENGINE_HOST = 'duckduckgo.com'   # Rate limiter key for that engine
+HARVEST_TIMEOUT = 90        # Seconds per theHarvester run
+HARVEST_CONCURRENCY = 2     # Concurrent theHarvester runs (polite to the search engine)
+HARVEST_RETRIES = 3         # Attempts per domain on failure or timeout
+RETRY_MAX_DELAY = 60        # Cap on exponential backoff, seconds
+RATE_LIMIT_BASE_DELAY = 30  # Backoff base when the engine reports throttling
+ENGINE_COOLDOWN = 300       # Skip the engine this long after a domain exhausts its retries
+RATE_LIMIT_MARKERS = ('429', 'rate limit', 'too many')
+OUTPUT_TAIL_LINES = 50      # theHarvester output lines kept for failure diagnosis
+
+def _json_load(path: Path):
+    """Load a JSON file, using orjson when installed"""
+    if orjson:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _json_dumps(obj) -> str:
+    """Pretty-print obj as JSON, using orjson when installed"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+@functools.lru_cache(maxsize=32)
+def _name_pattern(target_name: str) -> Optional[re.Pattern]:
+    """Alternation of the name's parts longer than two letters, or None if there are none"""
+    parts = [re.escape(part) for part in target_name.lower().split() if len(part) > 2]
+    return re.compile('|'.join(parts)) if parts else None
+
 class TheHarvesterIntegration:
     """
     Integration wrapper for theHarvester email discovery tool
     Specialized for finding actual email addresses vs pattern generation
     """
 
+    # Probe result shared across instances - installation doesn't change mid-run
+    _harvester_available: Optional[bool] = None
+    # Last time a domain exhausted its retries - shared so every instance backs off the engine
+    _engine_failed_at: Optional[float] = None
+
     def __init__(self, target_domain: str = None, target_name: str = None):
         self.target_domain = target_domain
         self.target_name = target_name
         self.logger = logging.getLogger(__name__)
+        # theHarvester checkout inside the framework directory
+        self.harvester_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'theHarvester', 'theHarvester.py')
         
     def check_theharvester_available(self) -> bool:
-        """Check if theHarvester is installed and available"""
+        """Check if theHarvester is installed and available (probed once per process)"""
+        if TheHarvesterIntegration._harvester_available is None:
+            TheHarvesterIntegration._harvester_available = self._probe_theharvester()
+        return TheHarvesterIntegration._harvester_available
+
+    def _probe_theharvester(self) -> bool:
+        """Look for theHarvester on disk - filesystem checks only, no interpreter launch"""
+        # Check if theHarvester exists in framework directory
+        if os.path.isfile(self.harvester_path):
+            return True
+        
+        # Check system theharvester command
+        return shutil.which('theharvester') is not None
+
+    def _prepare_output_file(self, domain: str, output_dir: Path) -> Path:
+        """Create the harvester output directory and return the JSON path for domain"""
+        harvester_dir = output_dir / "theharvester_results"
+        harvester_dir.mkdir(exist_ok=True)
+        return harvester_dir / f"{domain.replace('.', '_')}_harvest.json"
+
+    def _build_command(self, domain: str, output_file: Path) -> List[str]:
+        """Build theHarvester command - use the installed version in our directory"""
+        return [
+            'python', self.harvester_path,
+            '-d', domain,
+            '-l', '50',            # Limit results
+            '-b', HARVEST_ENGINE,  # Use supported engine
+            '-f', str(output_file) # JSON output
+        ]
+
+    def _parse_harvest_output(self, domain: str, output_file: Path) -> Dict:
+        """Read emails from theHarvester JSON output after a successful run"""
+        emails_found = []
+
+        if output_file.exists():
+            harvest_data = _json_load(output_file)
+
+            # Extract emails from theHarvester results
+            if 'emails' in harvest_data:
+                emails_found = harvest_data['emails']
+
+        self.logger.info(f"✅ theHarvester found {len(emails_found)} emails for {domain}")
+        return {
+            'found': len(emails_found) > 0,
+            'domain': domain,
+            'emails': emails_found,
+            'method': 'theHarvester'
+        }
+
+    def _engine_cooling_down(self) -> bool:
+        """True while the search engine is being skipped after repeated failures"""
+        failed_at = TheHarvesterIntegration._engine_failed_at
+        return failed_at is not None and time.time() - failed_at < ENGINE_COOLDOWN
+
+    def _record_engine_failure(self, domain: str) -> None:
+        self.logger.warning(f"theHarvester gave up on {domain}; skipping the engine for {ENGINE_COOLDOWN}s")
+        TheHarvesterIntegration._engine_failed_at = time.time()
+
+    def _retry_delay(self, attempt: int, output) -> float:
+        """Exponential backoff with jitter; longer base when theHarvester output reports throttling"""
+        output = (output or '').lower()
+        base = RATE_LIMIT_BASE_DELAY if any(marker in output for marker in RATE_LIMIT_MARKERS) else 1
+        return min(RETRY_MAX_DELAY, base * 2 ** attempt) + random.uniform(0, 1)
+
+    async def _pump_output(self, proc, tail: deque) -> int:
+        """Forward theHarvester output lines to the logger, keeping the last few; returns the exit code"""
+        async for line in proc.stdout:
+            line = line.decode(errors='replace').rstrip()
+            if line:
+                self.logger.info(f"[theHarvester] {line}")
+                tail.append(line)
+        return await proc.wait()
+
+    async def _run_harvester(self, cmd: List[str]):
+        """Run theHarvester streaming its output to the logger; returns (returncode, output tail)"""
+        proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE,
+                                                    stderr=asyncio.subprocess.STDOUT)
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+
         try:
-            # Check if theHarvester exists in framework directory
-            harvester_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'theHarvester', 'theHarvester.py')
-            if os.path.exists(harvester_path):
-                result = subprocess.run(['python', harvester_path, '-h'], capture_output=True, text=True, timeout=5)
-                return result.returncode == 0
-            
-            # Check system theharvester command
-            result = subprocess.run(['theharvester', '-h'], capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
-        except:
-            return False
+            returncode = await asyncio.wait_for(self._pump_output(proc, tail), timeout=HARVEST_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+
+        return returncode, '\n'.join(tail)
 
     def harvest_domain_emails(self, domain: str, output_dir: Path) -> Dict:
         """Harvest emails from a specific domain using theHarvester"""
@@ -48,70 +174,49 @@ class TheHarvesterIntegration:
                 'install_instructions': 'pip install theHarvester or clone from https://github.com/laramies/theHarvester'
             }
         
-        self.logger.info(f"🔍 Running theHarvester for domain: {domain}")
-        
-        # Create harvester output directory
-        harvester_dir = output_dir / "theharvester_results"
-        harvester_dir.mkdir(exist_ok=True)
-        
-        output_file = harvester_dir / f"{domain.replace('.', '_')}_harvest.json"
-        
-        # Build theHarvester command - use the installed version in our directory  
-        harvester_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'theHarvester', 'theHarvester.py')
-        
-        cmd = [
-            'python', harvester_path,
-            '-d', domain,
-            '-l', '50',            # Limit results
-            '-b', 'duckduckgo',    # Use supported engine
-            '-f', str(output_file) # JSON output
-        ]
-        
         try:
-            self.logger.info(f"🎨 theHarvester scan starting (live output below)...")
-            self.logger.info("=" * 70)
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=False,  # Show colorful output in terminal!
-                timeout=90  # 1.5 minute timeout
-            )
-            
-            self.logger.info("=" * 70)
-            
-            if result.returncode == 0:
-                # Parse theHarvester output
-                emails_found = []
-                
-                # theHarvester creates XML and HTML files, need to parse
-                if output_file.exists():
-                    with open(output_file, 'r') as f:
-                        harvest_data = json.load(f)
-                    
-                    # Extract emails from theHarvester results
-                    if 'emails' in harvest_data:
-                        emails_found = harvest_data['emails']
-                    
-                self.logger.info(f"✅ theHarvester found {len(emails_found)} emails for {domain}")
-                return {
-                    'found': len(emails_found) > 0,
-                    'domain': domain,
-                    'emails': emails_found,
-                    'method': 'theHarvester'
-                }
-            else:
-                self.logger.warning(f"theHarvester failed for {domain} (check output above)")
-                return {'found': False, 'error': 'theHarvester failed - see output above'}
-                
-        except subprocess.TimeoutExpired:
-            self.logger.warning(f"theHarvester scan timed out for {domain}")
-            return {'found': False, 'error': 'Scan timed out'}
+            return asyncio.run(self._harvest_domain_async(domain, output_dir))
         except Exception as e:
             self.logger.error(f"theHarvester error for {domain}: {e}")
             return {'found': False, 'error': str(e)}
 
-    def harvest_name_based_emails(self, name: str, output_dir: Path) -> Dict:
-        """Use theHarvester to search for emails associated with a person's name"""
+    async def _harvest_domain_async(self, domain: str, output_dir: Path,
+                                    semaphore: Optional[asyncio.Semaphore] = None) -> Dict:
+        """Harvest one domain with retries and backoff; semaphore caps concurrent theHarvester runs"""
+        semaphore = semaphore or asyncio.Semaphore(1)
+        output_file = self._prepare_output_file(domain, output_dir)
+        cmd = self._build_command(domain, output_file)
+
+        for attempt in range(HARVEST_RETRIES):
+            if self._engine_cooling_down():
+                return {'found': False, 'error': 'Search engine cooling down after repeated failures'}
+
+            # Hold the semaphore only while theHarvester runs, not during backoff
+            async with semaphore:
+                await asyncio.get_running_loop().run_in_executor(None, RATE_LIMITER.acquire, HARVEST_ENGINE_HOST)
+                self.logger.info(f"🔍 Running theHarvester for domain: {domain}")
+
+                try:
+                    returncode, output = await self._run_harvester(cmd)
+                except asyncio.TimeoutError:
+                    self.logger.warning(f"theHarvester scan timed out for {domain}")
+                    error, output = 'Scan timed out', None
+                else:
+                    if returncode == 0:
+                        return self._parse_harvest_output(domain, output_file)
+                    self.logger.warning(f"theHarvester failed for {domain} (exit code {returncode})")
+                    error = f'theHarvester exited with code {returncode}'
+
+            if attempt < HARVEST_RETRIES - 1:
+                delay = self._retry_delay(attempt, output)
+                self.logger.info(f"Retrying theHarvester for {domain} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        self._record_engine_failure(domain)
+        return {'found': False, 'error': error}
+
+    async def harvest_name_based_emails_async(self, name: str, output_dir: Path) -> Dict:
+        """Search personal email domains for emails matching a name, running domains concurrently"""
         
         if not self.check_theharvester_available():
             return {
@@ -119,8 +224,6 @@ class TheHarvesterIntegration:
                 'error': 'theHarvester not installed'
             }
         
-        # For name-based searches, we'll search common domains where people have emails
-        personal_domains = ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com']
         all_results = {
             'found': False,
             'emails': [],
@@ -130,52 +233,46 @@ class TheHarvesterIntegration:
         
         # Since theHarvester works on domains, we'll search each major email provider
         # This is more effective than Google Custom Search for actual email discovery
-        for domain in personal_domains:
-            try:
-                self.logger.info(f"🔍 Searching {domain} for emails related to {name}")
-                
-                # Build search query combining name + domain
-                # theHarvester will search for emails in this domain
-                domain_results = self.harvest_domain_emails(domain, output_dir)
-                
-                if domain_results.get('found'):
-                    domain_emails = domain_results.get('emails', [])
-                    all_results['domains_searched'].append(domain)
-                    
-                    # Filter emails that might belong to our target
-                    for email in domain_emails:
-                        if self._email_matches_name(email, name):
-                            all_results['emails'].append({
-                                'email': email,
-                                'confidence': 0.8,  # High confidence - found by theHarvester
-                                'source': 'theHarvester',
-                                'domain': domain
-                            })
-                
-                # Rate limiting between domain searches
-                time.sleep(5)
-                
-            except Exception as e:
-                self.logger.warning(f"theHarvester search failed for {domain}: {e}")
+        self.logger.info(f"🔍 Searching {', '.join(PERSONAL_EMAIL_DOMAINS)} for emails related to {name}")
+        semaphore = asyncio.Semaphore(HARVEST_CONCURRENCY)
+        domain_results = await asyncio.gather(
+            *[self._harvest_domain_async(domain, output_dir, semaphore) for domain in PERSONAL_EMAIL_DOMAINS],
+            return_exceptions=True
+        )
+        
+        for domain, domain_result in zip(PERSONAL_EMAIL_DOMAINS, domain_results):
+            if isinstance(domain_result, Exception):
+                self.logger.warning(f"theHarvester search failed for {domain}: {domain_result}")
                 continue
+            
+            if domain_result.get('found'):
+                all_results['domains_searched'].append(domain)
+                
+                # Filter emails that might belong to our target
+                for email in domain_result.get('emails', []):
+                    if self._email_matches_name(email, name):
+                        all_results['emails'].append({
+                            'email': email,
+                            'confidence': 0.8,  # High confidence - found by theHarvester
+                            'source': 'theHarvester',
+                            'domain': domain
+                        })
         
         all_results['found'] = len(all_results['emails']) > 0
         return all_results
 
+    def harvest_name_based_emails(self, name: str, output_dir: Path) -> Dict:
+        """Use theHarvester to search for emails associated with a person's name"""
+        return asyncio.run(self.harvest_name_based_emails_async(name, output_dir))
+
     def _email_matches_name(self, email: str, target_name: str) -> bool:
         """Check if email might belong to the target name"""
         if not email or not target_name:
             return False
-            
-        email_lower = email.lower()
-        name_parts = target_name.lower().split()
         
-        # Check if any name part appears in the email username
-        for part in name_parts:
-            if len(part) > 2 and part in email_lower:
-                return True
-                
-        return False
+        # Check if any name part appears in the email username - one regex scan per email
+        pattern = _name_pattern(target_name)
+        return bool(pattern and pattern.search(email.lower()))
 
 # Integration functions for main framework
 def enhance_email_discovery_with_sherlock(target_name: str, output_dir: Path) -> Dict:
@@ -222,4 +319,4 @@ if __name__ == "__main__":
     output.mkdir(exist_ok=True)
     
     results = enhance_email_discovery_with_theharvester(target, output)
-    print(f"\ntheHarvester Results: {json.dumps(results, indent=2)}")
+    print(f"\ntheHarvester Results: {_json_dumps(results)}")
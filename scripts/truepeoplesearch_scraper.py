@@ -6,10 +6,40 @@ Handles CAPTCHA challenges using undetected-chromedriver
 """
 
 import re
-import time
 import logging
+import threading
 from typing import Dict, List, Optional
 from pathlib import Path
+from urllib.parse import urlparse
+from selectolax.lexbor import LexborHTMLParser
+
+from .api_utils import RATE_LIMITER
+
+PAGE_READY_TIMEOUT = 5      # Max seconds to wait for results or a challenge page to render
+# Subresources parsing never needs - blocked in headless runs (a visible browser keeps
+# them so image CAPTCHAs stay solvable)
+BLOCKED_RESOURCE_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.woff', '*.woff2', '*.ttf', '*.css']
+
+CAPTCHA_REQUIRED = 'captcha_required'  # Error returned when a headless search hits a CAPTCHA
+CANCELLED = 'cancelled'  # Error returned when the caller stopped waiting mid-search
+
+# Challenge check run in the page: a DOM query plus visible text, instead of pulling the whole page source
+CAPTCHA_CHECK_SCRIPT = """
+if (document.querySelector('iframe[src*="captcha"], [class*="cf-challenge"], #challenge-form')) return true;
+return !!document.body && /captcha|cloudflare|please verify you are human/i.test(document.body.innerText);
+"""
+
+# Result page selectors - the DOM is parsed once and queried per field
+ADDRESS_SELECTOR = 'div[class*=address i]'
+
+# Content-level patterns, applied to extracted text - compiled once at import
+# Age and phone numbers share one alternation so the page text is scanned once
+_CONTENT_RE = re.compile(
+    r'(?i:Age:\s*(?P<age>\d+))'
+    r'|(?P<phone>\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+)
+_PERSON_NAME_RE = re.compile(r'[A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?')
+_NONDIGIT_RE = re.compile(r'[^\d]')
 
 class TruePeopleSearchScraper:
     """
@@ -23,10 +53,30 @@ class TruePeopleSearchScraper:
     - CAPTCHA handling with undetected-chromedriver
     """
     
-    def __init__(self):
+    def __init__(self, headless: bool = True, cancel_event: Optional[threading.Event] = None):
         self.logger = logging.getLogger(__name__)
+        self.headless = headless  # Visible only when a CAPTCHA must be solved by hand
+        self.cancel_event = cancel_event  # Set by the caller to abandon a search between steps
         self.base_url = "https://www.truepeoplesearch.com"
-        
+        self._driver = None  # Launched on first search, reused until close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self) -> None:
+        """Quit the shared browser, if one was launched"""
+        if self._driver:
+            try:
+                self._driver.quit()
+                self.logger.info("🔒 Browser closed")
+            except Exception as cleanup_error:
+                # Suppress cleanup errors (common on Windows with handle issues)
+                self.logger.debug(f"Driver cleanup error (ignored): {cleanup_error}")
+            self._driver = None
+    
     def check_dependencies(self) -> Dict:
         """Check if required dependencies are installed"""
         dependencies = {
@@ -90,7 +140,7 @@ class TruePeopleSearchScraper:
             return results
         
         # Clean phone number
-        clean_phone = re.sub(r'[^\d]', '', phone_number)
+        clean_phone = _NONDIGIT_RE.sub('', phone_number)
         if len(clean_phone) == 11 and clean_phone.startswith('1'):
             clean_phone = clean_phone[1:]
         
@@ -105,60 +155,49 @@ class TruePeopleSearchScraper:
         
         self.logger.info(f"🔍 Searching TruePeopleSearch for: {formatted_phone}")
         
-        driver = None
         try:
             # Import here to avoid errors if not installed
-            import undetected_chromedriver as uc
             from selenium.webdriver.common.by import By
             from selenium.webdriver.support.ui import WebDriverWait
             from selenium.webdriver.support import expected_conditions as EC
+            from selenium.common.exceptions import TimeoutException
             
-            # Initialize undetected Chrome (bypasses most anti-bot measures)
-            options = uc.ChromeOptions()
-            options.headless = False  # Keep visible to handle manual CAPTCHA if needed
-            
-            # Add robust stealth and stability options
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1920,1080')
-            
-            self.logger.info("🚀 Launching undetected Chrome browser...")
-            
-            # Try to initialize driver with version handling
-            try:
-                driver = uc.Chrome(options=options, use_subprocess=False)
-            except Exception as driver_error:
-                # Handle version mismatch specifically
-                error_msg = str(driver_error)
-                if 'version' in error_msg.lower() or 'chrome' in error_msg.lower():
-                    self.logger.error("❌ ChromeDriver version mismatch detected")
-                    self.logger.error("🔧 Fix: Update Chrome browser to latest version")
-                    self.logger.error("   Method 1: Navigate to chrome://settings/help in Chrome")
-                    self.logger.error("   Method 2: Undetected-chromedriver will auto-download correct version on next run")
-                    results['error'] = f'ChromeDriver version mismatch - update Chrome browser'
-                    return results
-                else:
-                    # Other error - re-raise
-                    raise driver_error
+            if self._cancelled(results):
+                return results
+            driver = self._ensure_driver()
             
-            # Wrap all scraping in try/finally for robust cleanup
+            # Wrap all scraping in try/finally so the session is reset for the next search
             try:
                 # Navigate to search URL
+                RATE_LIMITER.acquire(urlparse(search_url).netloc)
                 driver.get(search_url)
                 self.logger.info(f"📄 Loaded: {search_url}")
                 
-                # Wait for page load
-                time.sleep(3)
+                # Wait until results or a CAPTCHA challenge render instead of a fixed sleep
+                try:
+                    WebDriverWait(driver, PAGE_READY_TIMEOUT, poll_frequency=0.25).until(
+                        lambda d: d.find_elements(By.CLASS_NAME, "card") or self._detect_captcha(d)
+                    )
+                except TimeoutException:
+                    pass
+                if self._cancelled(results):
+                    return results
                 
                 # Check for CAPTCHA
                 if self._detect_captcha(driver):
+                    if self.headless:
+                        # Nobody can solve it - let the caller retry with a visible browser
+                        self.logger.warning("🛡️ CAPTCHA detected in headless mode")
+                        results['error'] = CAPTCHA_REQUIRED
+                        return results
+                    
                     self.logger.warning("🛡️ CAPTCHA detected - waiting for manual solve...")
                     self.logger.info("💡 Please solve the CAPTCHA in the browser window...")
                     
                     # Wait up to 60 seconds for CAPTCHA resolution
                     captcha_solved = self._wait_for_captcha_solve(driver, timeout=60)
+                    if self._cancelled(results):
+                        return results
                     
                     if not captcha_solved:
                         results['error'] = 'CAPTCHA not solved within timeout'
@@ -178,96 +217,16 @@ class TruePeopleSearchScraper:
                     return results
                 
                 # Extract data from page
-                page_source = driver.page_source
-                
-                # Extract name
-                name_match = re.search(r'<h1[^>]*>([^<]+)</h1>', page_source)
-                if name_match:
-                    results['name'] = name_match.group(1).strip()
-                    results['names'] = [results['name']]  # List format for unified_name_hunter
-                    results['found'] = True
-                    self.logger.info(f"✅ Name found: {results['name']}")
-                
-                # Extract age
-                age_match = re.search(r'Age:\s*(\d+)', page_source, re.IGNORECASE)
-                if age_match:
-                    results['age'] = int(age_match.group(1))
-                    self.logger.info(f"📅 Age: {results['age']}")
-                
-                # Extract addresses
-                address_matches = re.findall(
-                    r'<div[^>]*class="[^"]*address[^"]*"[^>]*>([^<]+(?:<[^>]+>[^<]*</[^>]+>[^<]*)*)</div>',
-                    page_source,
-                    re.IGNORECASE
-                )
-                
-                for addr in address_matches:
-                    # Clean HTML tags
-                    clean_addr = re.sub(r'<[^>]+>', ' ', addr)
-                    clean_addr = re.sub(r'\s+', ' ', clean_addr).strip()
-                    if clean_addr and len(clean_addr) > 10:
-                        addr_type = 'current' if 'current' in addr.lower() else 'previous'
-                        results['addresses'].append({
-                            'address': clean_addr,
-                            'type': addr_type
-                        })
-                        
-                        # Populate current/previous address fields for unified_name_hunter
-                        if addr_type == 'current' and not results['current_address']:
-                            results['current_address'] = clean_addr
-                        elif addr_type == 'previous':
-                            results['previous_addresses'].append(clean_addr)
-                
-                if results['addresses']:
-                    self.logger.info(f"🏠 Addresses found: {len(results['addresses'])}")
-                
-                # Extract associates/relatives
-                associate_matches = re.findall(
-                    r'<a[^>]*>([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)</a>',
-                    page_source
-                )
-                
-                # Filter and deduplicate associates
-                seen_associates = set()
-                for associate in associate_matches:
-                    cleaned = associate.strip()
-                    if (cleaned and 
-                        cleaned != results['name'] and
-                        cleaned not in seen_associates and
-                        len(cleaned.split()) >= 2):  # At least first and last name
-                        results['associates'].append(cleaned)
-                        seen_associates.add(cleaned)
-                
-                # Populate relatives field (alias for unified_name_hunter)
-                results['relatives'] = results['associates'].copy()
-                
-                if results['associates']:
-                    self.logger.info(f"👥 Associates/Relatives found: {len(results['associates'])}")
-                
-                # Extract additional phone numbers
-                phone_matches = re.findall(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', page_source)
-                for phone in phone_matches:
-                    clean = re.sub(r'[^\d]', '', phone)
-                    if clean != clean_phone and clean not in results['additional_phones']:
-                        formatted = f"{clean[:3]}-{clean[3:6]}-{clean[6:]}"
-                        results['additional_phones'].append(formatted)
-                
-                if results['additional_phones']:
-                    self.logger.info(f"📞 Additional phones: {len(results['additional_phones'])}")
+                self._parse_results(driver.page_source, clean_phone, results)
             
             except Exception as e:
                 self.logger.error(f"❌ TruePeopleSearch scraping error: {e}")
                 results['error'] = str(e)
+                # The browser may be wedged - relaunch on the next search
+                self.close()
                 
             finally:
-                # Always cleanup driver, suppress cleanup errors
-                if driver:
-                    try:
-                        driver.quit()
-                        self.logger.info("🔒 Browser closed")
-                    except Exception as cleanup_error:
-                        # Suppress cleanup errors (common on Windows with handle issues)
-                        self.logger.debug(f"Driver cleanup error (ignored): {cleanup_error}")
+                self._reset_driver()
         
         except Exception as outer_error:
             # Catch any errors from imports or driver initialization
@@ -276,21 +235,157 @@ class TruePeopleSearchScraper:
         
         return results
     
+    def _ensure_driver(self):
+        """Launch undetected Chrome on first use and return the shared driver"""
+        if self._driver is not None:
+            return self._driver
+        
+        import undetected_chromedriver as uc
+        
+        # Initialize undetected Chrome (bypasses most anti-bot measures)
+        options = uc.ChromeOptions()
+        if self.headless:
+            options.add_argument('--headless=new')
+        options.page_load_strategy = 'eager'  # Return at DOMContentLoaded, don't wait on ads/trackers
+        
+        # Add robust stealth and stability options
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--window-size=1920,1080')
+        options.add_argument('--disable-extensions')
+        options.add_experimental_option('prefs', {'profile.default_content_setting_values.notifications': 2})
+        
+        if self.headless:
+            # Markup-only loads: skip images and the extra renderer processes for cross-site frames
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_argument('--disable-features=IsolateOrigins,site-per-process')
+        
+        self.logger.info("🚀 Launching undetected Chrome browser...")
+        
+        # Try to initialize driver with version handling
+        try:
+            self._driver = uc.Chrome(options=options, use_subprocess=False)
+        except Exception as driver_error:
+            # Handle version mismatch specifically
+            error_msg = str(driver_error)
+            if 'version' in error_msg.lower() or 'chrome' in error_msg.lower():
+                self.logger.error("❌ ChromeDriver version mismatch detected")
+                self.logger.error("🔧 Fix: Update Chrome browser to latest version")
+                self.logger.error("   Method 1: Navigate to chrome://settings/help in Chrome")
+                self.logger.error("   Method 2: Undetected-chromedriver will auto-download correct version on next run")
+                raise RuntimeError('ChromeDriver version mismatch - update Chrome browser') from driver_error
+            # Other error - re-raise
+            raise
+        
+        if self.headless:
+            self._block_subresources()
+        
+        return self._driver
+    
+    def _block_subresources(self) -> None:
+        """Block image, font and stylesheet requests over CDP"""
+        try:
+            self._driver.execute_cdp_cmd('Network.enable', {})
+            self._driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_PATTERNS})
+        except Exception as cdp_error:
+            self.logger.debug(f"Resource blocking unavailable (ignored): {cdp_error}")
+    
+    def _reset_driver(self) -> None:
+        """Clear cookies and blank the page so searches don't share state"""
+        if self._driver is None:
+            return
+        try:
+            self._driver.delete_all_cookies()
+            self._driver.get('about:blank')
+        except Exception as reset_error:
+            self.logger.debug(f"Driver reset failed, relaunching next search: {reset_error}")
+            self.close()
+    
+    def _parse_results(self, page_source: str, clean_phone: str, results: Dict) -> None:
+        """Populate results from a TruePeopleSearch results page"""
+        tree = LexborHTMLParser(page_source)
+        page_text = tree.body.text(separator=' ') if tree.body else ''
+        
+        # Extract name
+        name_node = tree.css_first('h1')
+        if name_node and name_node.text(strip=True):
+            results['name'] = name_node.text(strip=True)
+            results['names'] = [results['name']]  # List format for unified_name_hunter
+            results['found'] = True
+            self.logger.info(f"✅ Name found: {results['name']}")
+        
+        # Extract age and candidate phone numbers in a single pass over the text
+        phone_matches = []
+        for match in _CONTENT_RE.finditer(page_text):
+            if match.group('phone'):
+                phone_matches.append(match.group('phone'))
+            elif results['age'] is None:
+                results['age'] = int(match.group('age'))
+        
+        if results['age'] is not None:
+            self.logger.info(f"📅 Age: {results['age']}")
+        
+        # Extract addresses
+        for node in tree.css(ADDRESS_SELECTOR):
+            clean_addr = ' '.join(node.text(separator=' ').split())  # Collapse whitespace without a regex pass
+            if clean_addr and len(clean_addr) > 10:
+                addr_type = 'current' if 'current' in node.html.lower() else 'previous'
+                results['addresses'].append({
+                    'address': clean_addr,
+                    'type': addr_type
+                })
+                
+                # Populate current/previous address fields for unified_name_hunter
+                if addr_type == 'current' and not results['current_address']:
+                    results['current_address'] = clean_addr
+                elif addr_type == 'previous':
+                    results['previous_addresses'].append(clean_addr)
+        
+        if results['addresses']:
+            self.logger.info(f"🏠 Addresses found: {len(results['addresses'])}")
+        
+        # Extract associates/relatives - link text that looks like a full name
+        seen_associates = set()
+        for link in tree.css('a'):
+            cleaned = link.text(strip=True)
+            if (_PERSON_NAME_RE.fullmatch(cleaned) and
+                cleaned != results['name'] and
+                cleaned not in seen_associates):
+                results['associates'].append(cleaned)
+                seen_associates.add(cleaned)
+        
+        # Populate relatives field (alias for unified_name_hunter - read-only, so share the list)
+        results['relatives'] = results['associates']
+        
+        if results['associates']:
+            self.logger.info(f"👥 Associates/Relatives found: {len(results['associates'])}")
+        
+        # Extract additional phone numbers
+        seen_phones = {clean_phone}
+        for phone in phone_matches:
+            clean = _NONDIGIT_RE.sub('', phone)
+            if clean in seen_phones:
+                continue
+            seen_phones.add(clean)
+            results['additional_phones'].append(f"{clean[:3]}-{clean[3:6]}-{clean[6:]}")
+        
+        if results['additional_phones']:
+            self.logger.info(f"📞 Additional phones: {len(results['additional_phones'])}")
+    
+    def _cancelled(self, results: Dict) -> bool:
+        """Record CANCELLED in results if the caller has given up on this search"""
+        if self.cancel_event is None or not self.cancel_event.is_set():
+            return False
+        self.logger.info("⏹️ TruePeopleSearch search cancelled")
+        results['error'] = CANCELLED
+        return True
+    
     def _detect_captcha(self, driver) -> bool:
         """Detect if CAPTCHA is present on the page"""
         try:
-            page_source = driver.page_source.lower()
-            
-            # Common CAPTCHA indicators
-            captcha_indicators = [
-                'recaptcha',
-                'captcha',
-                'cf-challenge',
-                'cloudflare',
-                'please verify you are human'
-            ]
-            
-            return any(indicator in page_source for indicator in captcha_indicators)
+            return bool(driver.execute_script(CAPTCHA_CHECK_SCRIPT))
         except:
             return False
     
@@ -305,29 +400,41 @@ class TruePeopleSearchScraper:
         Returns:
             True if CAPTCHA was solved, False if timeout
         """
-        start_time = time.time()
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
         
-        while (time.time() - start_time) < timeout:
-            if not self._detect_captcha(driver):
-                return True
-            
-            time.sleep(2)  # Check every 2 seconds
+        def still_blocked(d):
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                return False
+            return self._detect_captcha(d)
         
-        return False
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.5).until_not(still_blocked)
+            return True
+        except TimeoutException:
+            return False
 
-# Factory function for easy integration
-def search_truepeoplesearch(phone_number: str) -> Dict:
+# Factory functions for easy integration
+def search_truepeoplesearch(phone_number: str, cancel_event: Optional[threading.Event] = None) -> Dict:
     """
     Search TruePeopleSearch for phone number information
     
     Args:
         phone_number: Phone number to search
+        cancel_event: Once set, the search stops at its next step and the browser is closed
         
     Returns:
         Dict with search results
     """
-    scraper = TruePeopleSearchScraper()
-    return scraper.search_by_phone(phone_number)
+    with TruePeopleSearchScraper(cancel_event=cancel_event) as scraper:
+        results = scraper.search_by_phone(phone_number)
+    
+    if results.get('error') == CAPTCHA_REQUIRED:
+        # Relaunch visible so the CAPTCHA can be solved manually
+        with TruePeopleSearchScraper(headless=False, cancel_event=cancel_event) as scraper:
+            results = scraper.search_by_phone(phone_number)
+    
+    return results
 
 if __name__ == "__main__":
     # Test the scraper
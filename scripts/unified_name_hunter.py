@@ -4,18 +4,193 @@ Unified Name Hunting Pipeline
 THE GRAIL: Coordinated multi-source name extraction with advanced correlation
 """
 
+import copy
 import logging
 import time
 import asyncio
-from typing import Dict, List, Set, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+import hashlib
+import json
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Set, Optional, Tuple
 import re
+import string
+import sys
 from difflib import SequenceMatcher
+from operator import itemgetter
+
+import numpy as np
+import phonenumbers
+from cachetools import TTLCache
+
+try:
+    from rapidfuzz import process as rapidfuzz_process
+    from rapidfuzz.distance import JaroWinkler  # Native Jaro-Winkler, tuned for short person names
+except ImportError:
+    rapidfuzz_process = None
+    JaroWinkler = None
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+except ImportError:
+    connected_components = None
+
+try:
+    import orjson  # Sorted serialization straight to bytes for cache keys
+except ImportError:
+    orjson = None
 
 # Import our hunting modules
-from scripts.phone_validator import PhoneValidator
+from scripts.phone_validator import PhoneValidator, twilio_client
 from scripts.truepeoplesearch_scraper import search_truepeoplesearch
 
+HUNT_TIMEOUT = 120  # Seconds before outstanding parallel hunters are abandoned
+HUNT_CACHE_TTL = 3600  # Seconds a finished hunt_ultimate result is reused for the same number
+SOURCE_CACHE_TTL = 3600  # Seconds one source's lookup is reused across hunter instances
+# Hunted sources in run order: (name, hunter method, correlation weight, sequential stop confidence)
+HUNT_SOURCES = (
+    ('twilio', '_hunt_twilio_enhanced', 0.9, 0.8),              # Official carrier data, highest weight
+    ('truepeoplesearch', '_hunt_truepeoplesearch', 0.8, 0.7),   # Free, comprehensive people search
+)
+PARALLEL_EARLY_EXIT = {'twilio': 0.85}  # Source confidence that ends the parallel pass on its own
+MAX_NAME_LENGTH = 128  # Longer "names" are scraped page junk; also bounds similarity cost
+MAX_NAME_WORDS = 8
+
+# Finished hunts keyed by (E.164 number, identity hash), shared by every hunter in the process
+_hunt_cache = TTLCache(maxsize=10000, ttl=HUNT_CACHE_TTL)
+# Single-source results keyed by (source, E.164 number, identity hash or None)
+_source_cache = TTLCache(maxsize=10000, ttl=SOURCE_CACHE_TTL)
+_cache_lock = threading.Lock()
+
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+_CLEAN_RE = re.compile(r'[^\w\s\-\.]')
+# Same deletions as _CLEAN_RE for ASCII input, applied by str.translate without the regex engine
+_CLEAN_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if _CLEAN_RE.match(chr(c))))
+_DIGIT_RE = re.compile(r'\d')
+
+# Placeholder caller-ID values that are never a person's name
+_FALSE_POSITIVES = frozenset({
+    'unknown', 'private', 'blocked', 'restricted', 'anonymous',
+    'unavailable', 'withheld', 'caller', 'number', 'phone'
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_name_for_sim(name: str) -> str:
+    """Lowercase and strip punctuation for similarity comparison"""
+    # Names reaching here went through _clean_name, so only ASCII punctuation (-, .) remains
+    return name[:MAX_NAME_LENGTH].translate(_PUNCT_TABLE).lower().strip()
+
+
+@functools.lru_cache(maxsize=8192)
+def _similarity(norm1: str, norm2: str) -> float:
+    """Similarity ratio of two normalized names; callers pass them in sorted order"""
+    if JaroWinkler is not None:
+        return JaroWinkler.normalized_similarity(norm1, norm2)
+    return SequenceMatcher(None, norm1, norm2).ratio()
+
+
+def _to_e164(phone: str) -> str:
+    """E.164 form of a (default US) number, or the input unchanged if it doesn't parse"""
+    try:
+        parsed = phonenumbers.parse(phone, 'US')
+    except phonenumbers.NumberParseException:
+        return phone
+    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+
+
+def _identity_hash(identity_data: Dict) -> str:
+    """Short stable digest of identity_data for cache keys"""
+    if orjson:
+        payload = orjson.dumps(identity_data, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        payload = json.dumps(identity_data, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def cached_source(source: str, per_identity: bool = True):
+    """
+    Reuse a _hunt_* method's result for the same number across hunter instances
+    Sources that don't look at identity_data set per_identity=False to share entries
+    """
+    def decorator(hunt_func):
+        @functools.wraps(hunt_func)
+        def wrapper(self) -> Dict:
+            key = (source, self.phone_e164, self.identity_hash if per_identity else None)
+            with _cache_lock:
+                cached = _source_cache.get(key)
+            if cached is not None:
+                self.logger.info("📦 Using cached %s result for: %s", source, self.phone_e164)
+                return copy.deepcopy(cached)
+
+            result = hunt_func(self)
+            if not result.get('error'):
+                with _cache_lock:
+                    _source_cache[key] = copy.deepcopy(result)
+            return result
+        return wrapper
+    return decorator
+
+
+def _release_executor(executor: ThreadPoolExecutor, futures: List[Future], cancel_event: threading.Event) -> None:
+    """Cancel futures not yet started, signal running hunters to stop and shut down without joining them"""
+    # Same as shutdown(cancel_futures=True), which needs Python 3.9
+    for future in futures:
+        future.cancel()
+    cancel_event.set()
+    executor.shutdown(wait=False)
+
+
+def _format_truepeoplesearch(results: Dict) -> Dict:
+    """Convert a TruePeopleSearch scrape into the unified hunter format"""
+    if results.get('error'):
+        return {'error': results['error'], 'found': False, 'source': 'truepeoplesearch'}
+
+    if not results.get('found'):
+        return {
+            'found': False,
+            'source': 'truepeoplesearch',
+            'note': results.get('note', 'No results found')
+        }
+
+    return {
+        'found': True,
+        'names': results.get('names', []),
+        'confidence': 0.8,  # High confidence - direct match
+        'source': 'truepeoplesearch',
+        'metadata': {
+            'current_address': results.get('current_address'),
+            'previous_addresses': results.get('previous_addresses', []),
+            'age': results.get('age'),
+            'associates': results.get('associates', []),
+            'relatives': results.get('relatives', [])
+        }
+    }
+
+
+def _component_labels(adjacency: np.ndarray) -> List[int]:
+    """Connected-component label per node of a symmetric boolean adjacency matrix"""
+    if connected_components is not None:
+        _, labels = connected_components(csr_matrix(adjacency), directed=False)
+        return labels.tolist()
+
+    # Union-find fallback when scipy is unavailable
+    parent = list(range(len(adjacency)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in zip(*np.nonzero(np.triu(adjacency, 1))):
+        parent[find(i)] = find(j)
+    return [find(i) for i in range(len(parent))]
+
+
 class UnifiedNameHunter:
     """
     Advanced unified name hunting pipeline that coordinates multiple sources
@@ -24,30 +199,67 @@ class UnifiedNameHunter:
 
     def __init__(self, phone_number: str, identity_data: Dict = None, skip_truepeoplesearch: bool = False):
         self.phone = phone_number
+        # Parsed once; every hunter and the result cache use this canonical form
+        self.phone_e164 = _to_e164(phone_number)
         self.identity_data = identity_data or {}
+        self.identity_hash = _identity_hash(self.identity_data)
         self.skip_truepeoplesearch = skip_truepeoplesearch
         self.logger = logging.getLogger(__name__)
+        # Sources both hunting strategies run; TruePeopleSearch may be deferred to a later step
+        self.enabled_sources = [
+            name for name, _, _, _ in HUNT_SOURCES
+            if not (name == 'truepeoplesearch' and skip_truepeoplesearch)
+        ]
 
         # Log identity data if provided
         if self.identity_data:
-            self.logger.info(f"🎯 Enhanced hunting with identity data: {list(self.identity_data.keys())}")
+            self.logger.info("🎯 Enhanced hunting with identity data: %s", list(self.identity_data.keys()))
 
-        # Initialize all hunting modules
-        self.phone_validator = PhoneValidator(phone_number)
+        # Initialize hunting modules
+        self.phone_validator = PhoneValidator(self.phone_e164)
+        self._carrier_info = None  # Filled lazily by get_carrier_info
+        # Set once a hunt stops waiting, so abandoned hunters (the TruePeopleSearch browser) wind down
+        self._cancel_event = threading.Event()
 
         # Name correlation settings
-        self.min_name_similarity = 0.7  # Minimum similarity for name correlation
-        self.confidence_weights = {
-            'twilio': 0.9,          # Highest weight for official Twilio data
-            'truepeoplesearch': 0.8,  # High weight - free, comprehensive data
-            'numverify': 0.6        # Lower weight for basic validation
-        }
-
-    def hunt_parallel(self) -> Dict:
+        self.min_name_similarity = 0.7  # Minimum similarity for name correlation (difflib)
+        # Jaro-Winkler's prefix bonus scores a shared first name high ("David Lindley" vs "David Smith" is 0.84)
+        self.min_jaro_winkler_similarity = 0.9
+        self.confidence_weights = {name: weight for name, _, weight, _ in HUNT_SOURCES}
+
+    def close(self):
+        """Release the validator's pooled HTTP connections"""
+        self.phone_validator.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def invalidate(phone: str):
+        """Drop every cached hunt and source result for a number"""
+        e164 = _to_e164(phone)
+        with _cache_lock:
+            for key in [k for k in _hunt_cache if k[0] == e164]:
+                _hunt_cache.pop(key, None)
+            for key in [k for k in _source_cache if k[1] == e164]:
+                _source_cache.pop(key, None)
+
+    def hunt_parallel(self, early_exit: bool = True) -> Dict:
         """
         Execute all hunting methods in parallel for maximum speed
         """
-        self.logger.info(f"🚀 Starting PARALLEL NAME HUNTING for: {self.phone}")
+        return asyncio.run(self.hunt_parallel_async(early_exit))
+
+    async def hunt_parallel_async(self, early_exit: bool = True) -> Dict:
+        """
+        Run all hunting methods concurrently on the event loop
+        With early_exit, a dominant source (PARALLEL_EARLY_EXIT) reaching its
+        confidence cancels the hunters still running
+        """
+        self.logger.info("🚀 Starting PARALLEL NAME HUNTING for: %s", self.phone)
         start_time = time.time()
 
         results = {
@@ -56,62 +268,109 @@ class UnifiedNameHunter:
             'all_names': [],
             'confidence_scores': {},
             'source_summary': {},
-            'correlation_analysis': {},
             'execution_time': 0.0,
             'methods_attempted': [],
-            'methods_successful': []
+            'methods_successful': [],
+            'early_termination': False,
+            'termination_reason': None
         }
 
-        # Define hunting tasks
-        hunting_tasks = [
-            ('twilio', self._hunt_twilio_enhanced),
-            ('numverify', self._hunt_numverify)
-        ]
-        
-        # Only add TruePeopleSearch if not skipped
-        if not self.skip_truepeoplesearch:
-            hunting_tasks.append(('truepeoplesearch', self._hunt_truepeoplesearch))
-        else:
+        hunting_tasks = [(name, hunt_func) for name, hunt_func, _ in self._hunt_methods()]
+        if self.skip_truepeoplesearch:
             self.logger.info("⏭️ TruePeopleSearch skipped (will run in dedicated step after breach discovery)")
 
-        # Execute in parallel using ThreadPoolExecutor
-        max_workers = 3 if not self.skip_truepeoplesearch else 2
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_method = {
-                executor.submit(task_func): method_name
-                for method_name, task_func in hunting_tasks
+        # Hunters wrap blocking clients (Twilio SDK, requests, Selenium) - run each off the event loop.
+        # Own executor rather than asyncio.to_thread: asyncio.run joins the default
+        # executor on exit, which would block on hunters that already timed out
+        self._cancel_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=len(hunting_tasks))
+        futures = [executor.submit(task_func) for _, task_func in hunting_tasks]
+        try:
+            tasks = {
+                asyncio.wrap_future(future): method_name
+                for future, (method_name, _) in zip(futures, hunting_tasks)
             }
+            pending = set(tasks)
+            deadline = time.monotonic() + HUNT_TIMEOUT
+            while pending:
+                done, pending = await asyncio.wait(pending, timeout=max(deadline - time.monotonic(), 0),
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                if early_exit:
+                    reason = self._dominant_result({task: tasks[task] for task in done})
+                    if reason:
+                        results['early_termination'] = True
+                        results['termination_reason'] = reason
+                        self.logger.info("🚀 EARLY TERMINATION: %s", reason)
+                        break
+        finally:
+            _release_executor(executor, futures, self._cancel_event)
+        for task in pending:
+            task.cancel()
 
-            for future in as_completed(future_to_method, timeout=120):
-                method_name = future_to_method[future]
-                results['methods_attempted'].append(method_name)
+        for task, method_name in tasks.items():
+            results['methods_attempted'].append(method_name)
 
-                try:
-                    method_result = future.result()
-                    results['source_summary'][method_name] = method_result
+            if task in pending:
+                if results['early_termination']:
+                    results['source_summary'][method_name] = {'error': 'Cancelled after early termination', 'found': False}
+                    continue
+                self.logger.warning("⏱️ %s hunting timed out after %ss", method_name, HUNT_TIMEOUT)
+                results['source_summary'][method_name] = {'error': f'Timed out after {HUNT_TIMEOUT}s', 'found': False}
+                continue
 
-                    if method_result.get('found', False):
-                        results['methods_successful'].append(method_name)
-                        self.logger.info(f"✅ {method_name.upper()} SUCCESS: {method_result.get('names', [])}")
+            try:
+                method_result = task.result()
+                results['source_summary'][method_name] = method_result
 
-                except Exception as e:
-                    self.logger.warning(f"❌ {method_name} hunting failed: {e}")
-                    results['source_summary'][method_name] = {'error': str(e), 'found': False}
+                if method_result.get('found', False):
+                    results['methods_successful'].append(method_name)
+                    self.logger.info("✅ %s SUCCESS: %s", method_name.upper(), method_result.get('names', []))
+
+            except Exception as e:
+                self.logger.warning("❌ %s hunting failed: %s", method_name, e)
+                results['source_summary'][method_name] = {'error': str(e), 'found': False}
 
         # Correlate and analyze all results
         results.update(self._correlate_all_results(results['source_summary']))
 
         results['execution_time'] = time.time() - start_time
-        self.logger.info(f"🎯 PARALLEL HUNT COMPLETE: {results['execution_time']:.2f}s")
+        self.logger.info("🎯 PARALLEL HUNT COMPLETE: %.2fs", results['execution_time'])
 
         return results
 
-    def hunt_sequential_aggressive(self) -> Dict:
+    def _dominant_result(self, finished: Dict) -> Optional[str]:
+        """
+        Termination reason if a finished dominant source is confident enough on its own
+        """
+        for task, method_name in finished.items():
+            threshold = PARALLEL_EARLY_EXIT.get(method_name)
+            if threshold is None or task.exception() is not None:
+                continue
+
+            method_result = task.result()
+            if not method_result.get('found'):
+                continue
+
+            confidence = self._correlate_all_results({method_name: method_result})['best_confidence']
+            if confidence >= threshold:
+                return f"High confidence from {method_name} ({confidence:.2f})"
+        return None
+
+    def hunt_sequential_aggressive(self, prior_summary: Dict = None) -> Dict:
         """
-        Execute hunting methods sequentially with increasing aggression
-        Stops early if high-confidence result is found
+        Execute hunting methods with early termination
         """
-        self.logger.info(f"🎯 Starting SEQUENTIAL AGGRESSIVE HUNTING for: {self.phone}")
+        return asyncio.run(self.hunt_sequential_aggressive_async(prior_summary))
+
+    async def hunt_sequential_aggressive_async(self, prior_summary: Dict = None) -> Dict:
+        """
+        Run hunting methods concurrently and evaluate each as it finishes
+        Stops early if high-confidence result is found. Methods that already
+        completed without error in prior_summary are not re-run.
+        """
+        self.logger.info("🎯 Starting SEQUENTIAL AGGRESSIVE HUNTING for: %s", self.phone)
         start_time = time.time()
 
         results = {
@@ -119,47 +378,116 @@ class UnifiedNameHunter:
             'primary_names': [],
             'all_names': [],
             'confidence_scores': {},
-            'source_summary': {},
+            'source_summary': dict(prior_summary or {}),
             'execution_time': 0.0,
             'early_termination': False,
             'termination_reason': None
         }
 
-        # Sequential hunting order (fastest/most reliable first)
-        hunting_sequence = [
-            ('twilio', self._hunt_twilio_enhanced, 0.8),         # High confidence threshold
-            ('numverify', self._hunt_numverify, 0.6),           # Medium threshold
-            ('truepeoplesearch', self._hunt_truepeoplesearch, 0.7)  # High quality free data
-        ]
+        hunting_sequence = self._hunt_methods()
 
+        # Private executor so cancelled stragglers don't hold up asyncio.run (see hunt_parallel_async)
+        self._cancel_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=len(hunting_sequence))
+        futures = []
+        pending = {}
         for method_name, hunt_func, confidence_threshold in hunting_sequence:
-            self.logger.info(f"🔍 Attempting {method_name} hunting...")
+            if not self._needs_hunt(results['source_summary'], method_name):
+                self.logger.info("⏭️ Skipping %s - already completed", method_name)
+                continue
 
-            try:
-                method_result = hunt_func()
-                results['source_summary'][method_name] = method_result
+            self.logger.info("🔍 Attempting %s hunting...", method_name)
+            futures.append(executor.submit(hunt_func))
+            pending[asyncio.wrap_future(futures[-1])] = (method_name, confidence_threshold)
 
-                if method_result.get('found', False):
-                    self.logger.info(f"✅ {method_name.upper()} SUCCESS")
+        deadline = time.monotonic() + HUNT_TIMEOUT
+        try:
+            while pending and not results['early_termination']:
+                done, _ = await asyncio.wait(pending, timeout=max(deadline - time.monotonic(), 0),
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+
+                for task in done:
+                    method_name, confidence_threshold = pending.pop(task)
+                    try:
+                        method_result = task.result()
+                    except Exception as e:
+                        self.logger.warning("❌ %s hunting failed: %s", method_name, e)
+                        results['source_summary'][method_name] = {'error': str(e), 'found': False}
+                        continue
 
-                    # Update results
-                    temp_results = self._correlate_all_results(results['source_summary'])
-                    results.update(temp_results)
+                    results['source_summary'][method_name] = method_result
+                    if not method_result.get('found', False):
+                        continue
+                    self.logger.info("✅ %s SUCCESS", method_name.upper())
+
+                    # Only pay for full clustering once the threshold is reachable
+                    if self._confidence_upper_bound(results['source_summary']) < confidence_threshold:
+                        continue
+
+                    results.update(self._correlate_all_results(results['source_summary']))
 
                     # Check if we should terminate early
                     if results['found'] and results.get('best_confidence', 0) >= confidence_threshold:
                         results['early_termination'] = True
                         results['termination_reason'] = f"High confidence from {method_name} ({results['best_confidence']:.2f})"
-                        self.logger.info(f"🚀 EARLY TERMINATION: {results['termination_reason']}")
+                        self.logger.info("🚀 EARLY TERMINATION: %s", results['termination_reason'])
                         break
+        finally:
+            _release_executor(executor, futures, self._cancel_event)
 
-            except Exception as e:
-                self.logger.warning(f"❌ {method_name} hunting failed: {e}")
-                results['source_summary'][method_name] = {'error': str(e), 'found': False}
+        # Stragglers are abandoned - their worker threads finish in the background
+        for task, (method_name, _) in pending.items():
+            task.cancel()
+            if not results['early_termination']:
+                self.logger.warning("⏱️ %s hunting timed out after %ss", method_name, HUNT_TIMEOUT)
+                results['source_summary'][method_name] = {'error': f'Timed out after {HUNT_TIMEOUT}s', 'found': False}
+
+        if not results['early_termination'] and any(r.get('found') for r in results['source_summary'].values()):
+            results.update(self._correlate_all_results(results['source_summary']))
 
         results['execution_time'] = time.time() - start_time
         return results
 
+    def _hunt_methods(self) -> List[Tuple[str, Callable[[], Dict], float]]:
+        """
+        Enabled hunting methods with the confidence each must reach to stop a sequential hunt
+        """
+        return [
+            (name, getattr(self, method), threshold)
+            for name, method, _, threshold in HUNT_SOURCES
+            if name in self.enabled_sources
+        ]
+
+    @staticmethod
+    def _needs_hunt(source_summary: Dict, method_name: str) -> bool:
+        """
+        A method runs unless an earlier pass already completed it without error
+        """
+        prior = source_summary.get(method_name)
+        return prior is None or bool(prior.get('error'))
+
+    def _confidence_upper_bound(self, source_results: Dict) -> float:
+        """
+        Cheap ceiling on the best cluster confidence _correlate_all_results could report
+        """
+        weights = []
+        name_count = 0
+        for source, result in source_results.items():
+            count = len(result.get('names') or []) + bool(result.get('caller_id_name'))
+            if result.get('found') and count:
+                weights.append(self.confidence_weights.get(source, 0.5))
+                name_count += count
+
+        if not weights:
+            return 0.0
+
+        # Mirrors the bonuses in _calculate_cluster_confidence at their most generous
+        bound = max(weights) + min(len(weights) * 0.1, 0.3) + min((name_count - 1) * 0.05, 0.2)
+        return min(bound, 1.0)
+
+    @cached_source('twilio')
     def _hunt_twilio_enhanced(self) -> Dict:
         """Enhanced Twilio hunting with aggressive name extraction and identity matching"""
         try:
@@ -173,22 +501,26 @@ class UnifiedNameHunter:
             names = []
 
             # Extract owner name if found
-            if validation_results.get('OWNER_NAME'):
-                names.append(validation_results['OWNER_NAME'])
-
-            # Look for caller name data
-            if 'caller_name_data' in validation_results:
-                caller_data = validation_results['caller_name_data']
-                if isinstance(caller_data, dict) and caller_data.get('caller_name'):
-                    names.append(caller_data['caller_name'])
-                elif hasattr(caller_data, 'caller_name') and caller_data.caller_name:
-                    names.append(caller_data.caller_name)
+            owner_name = validation_results.get('OWNER_NAME')
+            if owner_name:
+                names.append(owner_name)
+
+            # Look for caller name data (a dict from the lookup API, or an SDK object)
+            caller_data = validation_results.get('caller_name_data')
+            if isinstance(caller_data, dict):
+                caller_name = caller_data.get('caller_name')
+            else:
+                caller_name = getattr(caller_data, 'caller_name', None)
+            if caller_name:
+                names.append(caller_name)
 
             return {
                 'found': len(names) > 0,
                 'names': names,
                 'confidence': 0.9 if names else 0.0,
-                'raw_data': validation_results,
+                # Only the match score is kept - the full lookup holds Twilio SDK objects that every
+                # cache copy and report dump would otherwise carry
+                'identity_match_score': validation_results.get('identity_match_score'),
                 'used_identity_data': bool(self.identity_data)
             }
         except Exception as e:
@@ -197,145 +529,116 @@ class UnifiedNameHunter:
     def _validate_with_twilio_identity(self) -> Dict:
         """Enhanced Twilio validation using identity data for better matching"""
         try:
-            from twilio.rest import Client
-            import os
-
-            twilio_sid = os.getenv('TWILIO_SID')
-            twilio_token = os.getenv('TWILIO_AUTH_TOKEN')
-
-            if not twilio_sid or not twilio_token:
+            validator = self.phone_validator
+            if not validator.twilio_sid or not validator.twilio_token:
                 self.logger.warning("Twilio credentials not configured")
                 return {}
 
-            client = Client(twilio_sid, twilio_token)
+            client = twilio_client(validator.twilio_sid, validator.twilio_token)
             result = {}
 
-            # Try identity match with provided data
-            if self.identity_data:
-                self.logger.info("🎯 Attempting Twilio identity match with provided data")
-
-                # Prepare identity match fields
-                fields = ['identity_match']
-                params = {}
-
-                # Map our identity data to Twilio's expected format (snake_case)
-                if 'first_name' in self.identity_data:
-                    params['first_name'] = self.identity_data['first_name']
-                if 'last_name' in self.identity_data:
-                    params['last_name'] = self.identity_data['last_name']
-                if 'address' in self.identity_data:
-                    params['address_line_1'] = self.identity_data['address']
-                if 'city' in self.identity_data:
-                    params['city'] = self.identity_data['city']
-                if 'state' in self.identity_data:
-                    params['state'] = self.identity_data['state']
-                if 'postal_code' in self.identity_data:
-                    params['postal_code'] = self.identity_data['postal_code']
+            # Map our identity data to Twilio's expected format (snake_case)
+            param_names = {
+                'first_name': 'first_name',
+                'last_name': 'last_name',
+                'address': 'address_line_1',
+                'city': 'city',
+                'state': 'state',
+                'postal_code': 'postal_code',
+            }
+            params = {param: self.identity_data[key] for key, param in param_names.items() if key in self.identity_data}
 
+            # The identity match and the caller name fallback are independent, so both go out at once
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                caller_future = executor.submit(
+                    lambda: client.lookups.v2.phone_numbers(self.phone_e164).fetch(fields='caller_name')
+                )
+                identity_future = None
                 if params:  # Only try if we have at least some identity data
-                    try:
-                        # Use the correct Twilio API format - fields as parameter, identity data as separate params
-                        enhanced_lookup = client.lookups.v2.phone_numbers(self.phone).fetch(
-                            fields='identity_match',
-                            **params
-                        )
-
-                        if hasattr(enhanced_lookup, 'identity_match'):
-                            identity_match = enhanced_lookup.identity_match
-                            result['identity_match_data'] = identity_match
-
-                            # Extract any confirmed name information
-                            if hasattr(identity_match, 'summary_score'):
-                                score = identity_match.summary_score
-                                result['identity_match_score'] = score
-
-                                if score and score > 0.5:  # High confidence match
-                                    # Construct full name from matched parts
-                                    full_name_parts = []
-                                    if 'first_name' in self.identity_data and getattr(identity_match, 'first_name_match', None):
-                                        full_name_parts.append(self.identity_data['first_name'])
-                                    if 'last_name' in self.identity_data and getattr(identity_match, 'last_name_match', None):
-                                        full_name_parts.append(self.identity_data['last_name'])
-
-                                    if full_name_parts:
-                                        result['OWNER_NAME'] = ' '.join(full_name_parts)
-                                        self.logger.info(f"🔥 IDENTITY MATCH SUCCESS: {result['OWNER_NAME']} (score: {score})")
+                    self.logger.info("🎯 Attempting Twilio identity match with provided data")
+                    # Use the correct Twilio API format - fields as parameter, identity data as separate params
+                    identity_future = executor.submit(
+                        lambda: client.lookups.v2.phone_numbers(self.phone_e164).fetch(fields='identity_match', **params)
+                    )
 
+                if identity_future is not None:
+                    try:
+                        result.update(self._identity_match_result(identity_future.result()))
                     except Exception as e:
-                        self.logger.warning(f"Twilio identity match failed: {e}")
+                        self.logger.warning("Twilio identity match failed: %s", e)
                         result['identity_match_error'] = str(e)
 
-            # Also try standard caller name lookup as fallback
-            try:
-                caller_lookup = client.lookups.v2.phone_numbers(self.phone).fetch(fields='caller_name')
-                if hasattr(caller_lookup, 'caller_name'):
-                    result['caller_name_data'] = caller_lookup.caller_name
-            except Exception as e:
-                self.logger.warning(f"Twilio caller name lookup failed: {e}")
+                try:
+                    caller_lookup = caller_future.result()
+                    if hasattr(caller_lookup, 'caller_name'):
+                        result['caller_name_data'] = caller_lookup.caller_name
+                except Exception as e:
+                    self.logger.warning("Twilio caller name lookup failed: %s", e)
 
             return result
 
         except Exception as e:
-            self.logger.error(f"Enhanced Twilio validation error: {e}")
+            self.logger.error("Enhanced Twilio validation error: %s", e)
             return {'error': str(e)}
 
+    def _identity_match_result(self, enhanced_lookup) -> Dict:
+        """Extract the match score and any confirmed owner name from an identity_match lookup"""
+        result = {}
+        if not hasattr(enhanced_lookup, 'identity_match'):
+            return result
+
+        identity_match = enhanced_lookup.identity_match
+        result['identity_match_data'] = identity_match
+
+        # Extract any confirmed name information
+        if hasattr(identity_match, 'summary_score'):
+            score = identity_match.summary_score
+            result['identity_match_score'] = score
+
+            if score and score > 0.5:  # High confidence match
+                # Construct full name from the parts Twilio confirmed
+                full_name = ' '.join(
+                    self.identity_data[part] for part in ('first_name', 'last_name')
+                    if part in self.identity_data and getattr(identity_match, f'{part}_match', None)
+                )
+                if full_name:
+                    result['OWNER_NAME'] = full_name
+                    self.logger.info("🔥 IDENTITY MATCH SUCCESS: %s (score: %s)", result['OWNER_NAME'], score)
+        return result
+
+    @cached_source('truepeoplesearch', per_identity=False)
     def _hunt_truepeoplesearch(self) -> Dict:
         """
         TruePeopleSearch hunting - Free comprehensive people search
         Returns: names, addresses, age, associates, relatives
         """
         try:
-            self.logger.info(f"🔍 Searching TruePeopleSearch for: {self.phone}")
-            results = search_truepeoplesearch(self.phone)
-            
-            if results.get('found'):
-                # Convert to unified format
-                names = results.get('names', [])
-                return {
-                    'found': True,
-                    'names': names,
-                    'confidence': 0.8,  # High confidence - direct match
-                    'source': 'truepeoplesearch',
-                    'metadata': {
-                        'current_address': results.get('current_address'),
-                        'previous_addresses': results.get('previous_addresses', []),
-                        'age': results.get('age'),
-                        'associates': results.get('associates', []),
-                        'relatives': results.get('relatives', [])
-                    }
-                }
-            else:
-                return {
-                    'found': False,
-                    'source': 'truepeoplesearch',
-                    'note': results.get('note', 'No results found')
-                }
-                
+            self.logger.info("🔍 Searching TruePeopleSearch for: %s", self.phone)
+            return _format_truepeoplesearch(search_truepeoplesearch(self.phone_e164, self._cancel_event))
         except Exception as e:
-            self.logger.error(f"TruePeopleSearch error: {e}")
+            self.logger.error("TruePeopleSearch error: %s", e)
             return {'error': str(e), 'found': False, 'source': 'truepeoplesearch'}
 
-    def _hunt_numverify(self) -> Dict:
-        """Enhanced NumVerify hunting"""
-        try:
-            validation_results = self.phone_validator.validate_with_numverify()
-            # NumVerify typically doesn't provide names, but we include it for completeness
-            return {
-                'found': False,  # NumVerify doesn't provide names
-                'names': [],
-                'confidence': 0.0,
+    def get_carrier_info(self) -> Dict:
+        """
+        NumVerify carrier lookup, made on first request only
+        NumVerify never returns names, so it is not one of the name hunters
+        """
+        if self._carrier_info is None:
+            try:
+                validation_results = self.phone_validator.validate_with_numverify()
+            except Exception as e:
+                return {'error': str(e)}
+            self._carrier_info = {
                 'carrier_info': validation_results.get('carrier', 'Unknown'),
                 'raw_data': validation_results
             }
-        except Exception as e:
-            return {'error': str(e), 'found': False}
+        return self._carrier_info
 
     def _correlate_all_results(self, source_results: Dict) -> Dict:
         """
         Advanced correlation of all hunting results with confidence scoring
         """
-        self.logger.info("🧠 Starting advanced name correlation analysis...")
-
         correlation_results = {
             'found': False,
             'primary_names': [],
@@ -344,13 +647,18 @@ class UnifiedNameHunter:
             'best_confidence': 0.0,
             'correlation_analysis': {
                 'name_clusters': [],
-                'confidence_matrix': {},
                 'consensus_score': 0.0
             }
         }
 
-        # Collect all names from all sources
-        all_names_with_sources = []
+        # Nothing to correlate when no source found anything
+        if not any(results.get('found') for results in source_results.values()):
+            return correlation_results
+
+        self.logger.info("🧠 Starting advanced name correlation analysis...")
+
+        # Collect unique names with every (source, weight) that reported them
+        by_name: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
 
         for source, results in source_results.items():
             if not results.get('found', False):
@@ -365,9 +673,6 @@ class UnifiedNameHunter:
                     source_names.append(results['caller_id_name'])
             elif source in ['truepeoplesearch', 'twilio']:
                 source_names.extend(results.get('names', []))
-            elif source == 'numverify':
-                # NumVerify doesn't provide names
-                continue
 
             # Add source weight to each name
             source_weight = self.confidence_weights.get(source, 0.5)
@@ -375,47 +680,44 @@ class UnifiedNameHunter:
                 if name and len(name.strip()) > 2:
                     cleaned_name = self._clean_name(name)
                     if cleaned_name:
-                        all_names_with_sources.append({
-                            'name': cleaned_name,
-                            'source': source,
-                            'weight': source_weight
-                        })
+                        by_name[cleaned_name].append((source, source_weight))
 
-        if not all_names_with_sources:
+        if not by_name:
             self.logger.warning("No names found across all sources")
             return correlation_results
 
         # Cluster similar names
-        name_clusters = self._cluster_similar_names(all_names_with_sources)
+        name_clusters = self._cluster_similar_names(
+            [{'name': name, 'sources': sources} for name, sources in by_name.items()]
+        )
         correlation_results['correlation_analysis']['name_clusters'] = name_clusters
 
         # Calculate confidence scores for each cluster
         cluster_scores = []
         for cluster in name_clusters:
-            cluster_score = self._calculate_cluster_confidence(cluster)
+            sources = {source for item in cluster for source, _ in item['sources']}
+            cluster_score = self._calculate_cluster_confidence(cluster, sources)
             cluster_scores.append({
                 'names': [item['name'] for item in cluster],
                 'representative_name': cluster[0]['name'],  # Use first name as representative
                 'confidence': cluster_score,
-                'sources': list(set(item['source'] for item in cluster)),
-                'source_count': len(set(item['source'] for item in cluster))
+                'sources': list(sources),
+                'source_count': len(sources)
             })
 
-        # Sort by confidence
-        cluster_scores.sort(key=lambda x: x['confidence'], reverse=True)
-
         if cluster_scores:
+            # Only the top cluster is ranked - no need to sort the rest
+            top_cluster = max(cluster_scores, key=itemgetter('confidence'))
             correlation_results['found'] = True
-            correlation_results['best_confidence'] = cluster_scores[0]['confidence']
+            correlation_results['best_confidence'] = top_cluster['confidence']
 
             # Primary names (highest confidence cluster)
-            correlation_results['primary_names'] = cluster_scores[0]['names']
+            correlation_results['primary_names'] = top_cluster['names']
 
-            # All unique names
-            all_unique_names = set()
-            for cluster in cluster_scores:
-                all_unique_names.update(cluster['names'])
-            correlation_results['all_names'] = list(all_unique_names)
+            # All unique names, best cluster first
+            correlation_results['all_names'] = list(dict.fromkeys(
+                name for cluster in [top_cluster, *cluster_scores] for name in cluster['names']
+            ))
 
             # Individual name confidence scores
             for cluster in cluster_scores:
@@ -423,10 +725,10 @@ class UnifiedNameHunter:
                     correlation_results['confidence_scores'][name] = cluster['confidence']
 
             # Consensus score (agreement between sources)
-            consensus_score = self._calculate_consensus_score(cluster_scores)
+            consensus_score = self._calculate_consensus_score(top_cluster)
             correlation_results['correlation_analysis']['consensus_score'] = consensus_score
 
-            self.logger.info(f"🎯 CORRELATION COMPLETE: {len(correlation_results['primary_names'])} primary names, confidence: {correlation_results['best_confidence']:.2f}")
+            self.logger.info("🎯 CORRELATION COMPLETE: %s primary names, confidence: %.2f", len(correlation_results['primary_names']), correlation_results['best_confidence'])
 
         return correlation_results
 
@@ -434,76 +736,86 @@ class UnifiedNameHunter:
         """
         Cluster similar names together using string similarity
         """
-        clusters = []
-        processed = set()
-
-        for i, name_item in enumerate(names_with_sources):
-            if i in processed:
-                continue
+        # Names equal up to case and punctuation group by hash; only one per group is scored
+        exact_groups = defaultdict(list)
+        for item in names_with_sources:
+            exact_groups[_normalize_name_for_sim(item['name'])].append(item)
 
-            current_cluster = [name_item]
-            processed.add(i)
+        groups = list(exact_groups.values())
+        if len(groups) == 1:
+            return groups
 
-            # Find similar names
-            for j, other_item in enumerate(names_with_sources):
-                if j in processed or i == j:
-                    continue
+        names = [group[0]['name'] for group in groups]
+        threshold = self.min_jaro_winkler_similarity if JaroWinkler is not None else self.min_name_similarity
+        adjacency = self._similarity_matrix(names) >= threshold
+        labels = _component_labels(adjacency)
 
-                similarity = self._calculate_name_similarity(
-                    name_item['name'],
-                    other_item['name']
-                )
+        # Clusters keep the order in which their first name was seen
+        clusters = {}
+        for group, label in zip(groups, labels):
+            clusters.setdefault(label, []).extend(group)
 
-                if similarity >= self.min_name_similarity:
-                    current_cluster.append(other_item)
-                    processed.add(j)
+        return list(clusters.values())
 
-            clusters.append(current_cluster)
+    def _similarity_matrix(self, names: List[str]) -> np.ndarray:
+        """
+        Pairwise name similarity, computed natively by rapidfuzz when available
+        """
+        normalized = [_normalize_name_for_sim(name) for name in names]
+        if rapidfuzz_process is not None:
+            return rapidfuzz_process.cdist(normalized, normalized, scorer=JaroWinkler.normalized_similarity)
 
-        return clusters
+        matrix = np.eye(len(names))
+        for i in range(len(names)):
+            for j in range(i + 1, len(names)):
+                matrix[i, j] = matrix[j, i] = self._calculate_name_similarity(names[i], names[j])
+        return matrix
 
     def _calculate_name_similarity(self, name1: str, name2: str) -> float:
         """
         Calculate similarity between two names
         """
-        # Normalize names
-        norm1 = re.sub(r'[^\w\s]', '', name1.lower()).strip()
-        norm2 = re.sub(r'[^\w\s]', '', name2.lower()).strip()
+        norm1 = _normalize_name_for_sim(name1)
+        norm2 = _normalize_name_for_sim(name2)
 
-        # Use sequence matcher for similarity
-        return SequenceMatcher(None, norm1, norm2).ratio()
+        # Canonical order so (a, b) and (b, a) share one cache entry
+        if norm1 > norm2:
+            norm1, norm2 = norm2, norm1
+        return _similarity(norm1, norm2)
 
-    def _calculate_cluster_confidence(self, cluster: List[Dict]) -> float:
+    def _calculate_cluster_confidence(self, cluster: List[Dict], sources: Set[str] = None) -> float:
         """
         Calculate confidence score for a name cluster
+        sources is the cluster's set of reporting sources, when the caller already has it
         """
         if not cluster:
             return 0.0
 
+        # Every report of every name in the cluster
+        occurrences = [pair for item in cluster for pair in item['sources']]
+
         # Base confidence from source weights
-        base_confidence = sum(item['weight'] for item in cluster) / len(cluster)
+        base_confidence = sum(weight for _, weight in occurrences) / len(occurrences)
 
         # Bonus for multiple sources
-        unique_sources = len(set(item['source'] for item in cluster))
-        multi_source_bonus = min(unique_sources * 0.1, 0.3)
+        if sources is None:
+            sources = {source for source, _ in occurrences}
+        multi_source_bonus = min(len(sources) * 0.1, 0.3)
 
         # Bonus for multiple occurrences
-        occurrence_bonus = min((len(cluster) - 1) * 0.05, 0.2)
+        occurrence_bonus = min((len(occurrences) - 1) * 0.05, 0.2)
 
         total_confidence = base_confidence + multi_source_bonus + occurrence_bonus
 
         return min(total_confidence, 1.0)
 
-    def _calculate_consensus_score(self, cluster_scores: List[Dict]) -> float:
+    def _calculate_consensus_score(self, top_cluster: Dict) -> float:
         """
         Calculate consensus score based on agreement between sources
         """
-        if not cluster_scores:
-            return 0.0
-
-        # High consensus if top cluster has multiple sources
-        top_cluster = cluster_scores[0]
-        consensus = top_cluster['source_count'] / 4.0  # Normalize by max possible sources
+        # High consensus if top cluster has multiple sources; normalized by the sources actually hunted,
+        # but never fewer than two - a lone source can't agree with itself
+        consensus = top_cluster['source_count'] / max(len(self.enabled_sources), 2)
 
         return min(consensus, 1.0)
 
@@ -512,7 +824,11 @@ class UnifiedNameHunter:
         Clean and validate a name string
         Handles formats like "LINDLEY, DAVID" or "Lindley, David" and converts to "David Lindley"
         """
-        if not name:
+        if not name or len(name) > MAX_NAME_LENGTH:
+            return None
+
+        # Reject placeholder caller-ID values before any regex work
+        if name.strip().lower() in _FALSE_POSITIVES:
             return None
 
         # Handle "LastName, FirstName" format (common in Twilio responses)
@@ -523,40 +839,66 @@ class UnifiedNameHunter:
                 first_name = parts[1].strip()
                 # Reconstruct as "FirstName LastName"
                 name = f"{first_name} {last_name}"
-                self.logger.info(f"🔧 Reformatted name: '{parts[0].strip()}, {parts[1].strip()}' -> '{name}'")
+                self.logger.info("🔧 Reformatted name: '%s, %s' -> '%s'", parts[0].strip(), parts[1].strip(), name)
 
         # Remove extra whitespace and special characters
-        cleaned = re.sub(r'[^\w\s\-\.]', '', name).strip()
+        cleaned = (name.translate(_CLEAN_TABLE) if name.isascii() else _CLEAN_RE.sub('', name)).strip()
 
         # Skip if too short or contains numbers
-        if len(cleaned) < 3 or re.search(r'\d', cleaned):
+        if len(cleaned) < 3 or _DIGIT_RE.search(cleaned):
             return None
 
-        # Skip common false positives
-        false_positives = {
-            'unknown', 'private', 'blocked', 'restricted', 'anonymous',
-            'unavailable', 'withheld', 'caller', 'number', 'phone'
-        }
+        words = cleaned.split()
+        if len(words) > MAX_NAME_WORDS:
+            return None
 
-        if cleaned.lower() in false_positives:
+        # Skip common false positives
+        if cleaned.lower() in _FALSE_POSITIVES:
             return None
 
-        # Title case
-        return ' '.join(word.capitalize() for word in cleaned.split())
+        # Title case; interned so repeated names share one string through clustering and scoring
+        return sys.intern(' '.join(word.capitalize() for word in words))
 
     def hunt_ultimate(self) -> Dict:
         """
         Ultimate name hunting that combines parallel and sequential strategies
+        Results are cached per number and identity data for HUNT_CACHE_TTL seconds
         """
-        self.logger.info(f"🔥 ULTIMATE NAME HUNTING INITIATED for: {self.phone}")
+        self.logger.info("🔥 ULTIMATE NAME HUNTING INITIATED for: %s", self.phone)
 
+        cache_key = (self.phone_e164, self.identity_hash)
+        with _cache_lock:
+            cached = _hunt_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info("📦 Using cached name hunt for: %s", self.phone_e164)
+            return {**copy.deepcopy(cached), 'execution_time': 0.0}
+
+        results = self._hunt_ultimate_uncached()
+
+        # Don't pin transient failures for the whole TTL
+        if results['found'] or not any(r.get('error') for r in results['source_summary'].values()):
+            cached = copy.deepcopy({k: v for k, v in results.items() if k != 'execution_time'})
+            with _cache_lock:
+                _hunt_cache[cache_key] = cached
+
+        return results
+
+    def _hunt_ultimate_uncached(self) -> Dict:
+        """
+        Parallel pass, escalating to sequential hunting on low confidence
+        """
         # Try parallel first for speed
         parallel_results = self.hunt_parallel()
 
         # If parallel didn't achieve high confidence, try sequential aggressive
         if not parallel_results['found'] or parallel_results.get('best_confidence', 0) < 0.8:
+            summary = parallel_results['source_summary']
+            if not any(self._needs_hunt(summary, name) for name in self.enabled_sources):
+                # Nothing left to retry - re-correlating the same data can't raise confidence
+                return parallel_results
+
             self.logger.info("🎯 Escalating to sequential aggressive hunting...")
-            sequential_results = self.hunt_sequential_aggressive()
+            sequential_results = self.hunt_sequential_aggressive(parallel_results['source_summary'])
 
             # Use best results
             if sequential_results.get('best_confidence', 0) > parallel_results.get('best_confidence', 0):
@@ -578,8 +920,8 @@ if __name__ == "__main__":
     )
 
     phone = sys.argv[1]
-    hunter = UnifiedNameHunter(phone)
-    results = hunter.hunt_ultimate()
+    with UnifiedNameHunter(phone) as hunter:
+        results = hunter.hunt_ultimate()
 
     print(f"\n🎯 ULTIMATE NAME HUNTING RESULTS for {phone}:")
     print(f"Found: {results['found']}")
@@ -2,9 +2,10 @@
 """
 Test all configured APIs to ensure they're working
 """
+import asyncio
 import os
 import sys
-import requests
+import aiohttp
 from dotenv import load_dotenv
 import json
 from colorama import init, Fore, Style
@@ -14,13 +15,13 @@ init()
 # Load environment
 load_dotenv('config/.env')
 
-def test_numverify():
+async def probe_numverify(session, out):
     """Test NumVerify API"""
-    print(f"\n{Fore.CYAN}Testing NumVerify API...{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}Testing NumVerify API...{Style.RESET_ALL}")
     
     api_key = os.getenv('NUMVERIFY_API_KEY')
     if not api_key:
-        print(f"{Fore.RED}[X] NumVerify API key not found{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] NumVerify API key not found{Style.RESET_ALL}")
         return False
     
     try:
@@ -31,31 +32,31 @@ def test_numverify():
             'format': 1
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        data = response.json()
+        async with session.get(url, params=params) as response:
+            data = await response.json(content_type=None)
         
         if 'error' in data:
-            print(f"{Fore.RED}[X] NumVerify error: {data['error']['info']}{Style.RESET_ALL}")
+            out.append(f"{Fore.RED}[X] NumVerify error: {data['error']['info']}{Style.RESET_ALL}")
             return False
             
-        print(f"{Fore.GREEN}[OK] NumVerify working! Test response:{Style.RESET_ALL}")
-        print(f"  Carrier: {data.get('carrier', 'N/A')}")
-        print(f"  Location: {data.get('location', 'N/A')}")
+        out.append(f"{Fore.GREEN}[OK] NumVerify working! Test response:{Style.RESET_ALL}")
+        out.append(f"  Carrier: {data.get('carrier', 'N/A')}")
+        out.append(f"  Location: {data.get('location', 'N/A')}")
         return True
         
     except Exception as e:
-        print(f"{Fore.RED}[X] NumVerify error: {str(e)}{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] NumVerify error: {str(e)}{Style.RESET_ALL}")
         return False
 
-def test_google_search():
+async def probe_google_search(session, out):
     """Test Google Custom Search API"""
-    print(f"\n{Fore.CYAN}Testing Google Search API...{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}Testing Google Search API...{Style.RESET_ALL}")
     
     api_key = os.getenv('GOOGLE_API_KEY')
     cse_id = os.getenv('GOOGLE_CSE_ID')
     
     if not api_key or not cse_id:
-        print(f"{Fore.RED}[X] Google API credentials not found{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] Google API credentials not found{Style.RESET_ALL}")
         return False
     
     try:
@@ -67,28 +68,28 @@ def test_google_search():
             'num': 1
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        data = response.json()
+        async with session.get(url, params=params) as response:
+            data = await response.json(content_type=None)
         
         if 'error' in data:
-            print(f"{Fore.RED}[X] Google API error: {data['error']['message']}{Style.RESET_ALL}")
+            out.append(f"{Fore.RED}[X] Google API error: {data['error']['message']}{Style.RESET_ALL}")
             return False
             
-        print(f"{Fore.GREEN}[OK] Google Search API working!{Style.RESET_ALL}")
-        print(f"  Total results: ~{data['searchInformation']['formattedTotalResults']}")
+        out.append(f"{Fore.GREEN}[OK] Google Search API working!{Style.RESET_ALL}")
+        out.append(f"  Total results: ~{data['searchInformation']['formattedTotalResults']}")
         return True
         
     except Exception as e:
-        print(f"{Fore.RED}[X] Google API error: {str(e)}{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] Google API error: {str(e)}{Style.RESET_ALL}")
         return False
 
-def test_opencellid():
+async def probe_opencellid(session, out):
     """Test OpenCellID API"""
-    print(f"\n{Fore.CYAN}Testing OpenCellID API...{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}Testing OpenCellID API...{Style.RESET_ALL}")
     
     api_key = os.getenv('OPENCELLID_API_KEY')
     if not api_key:
-        print(f"{Fore.RED}[X] OpenCellID API key not found{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] OpenCellID API key not found{Style.RESET_ALL}")
         return False
     
     try:
@@ -103,126 +104,128 @@ def test_opencellid():
             'format': 'json'
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        async with session.get(url, params=params) as response:
+            status = response.status
         
-        if response.status_code == 200:
-            print(f"{Fore.GREEN}[OK] OpenCellID API working!{Style.RESET_ALL}")
+        if status == 200:
+            out.append(f"{Fore.GREEN}[OK] OpenCellID API working!{Style.RESET_ALL}")
             return True
         else:
-            print(f"{Fore.YELLOW}[!] OpenCellID returned status: {response.status_code}{Style.RESET_ALL}")
+            out.append(f"{Fore.YELLOW}[!] OpenCellID returned status: {status}{Style.RESET_ALL}")
             return True  # API is responding, just no data for test cell
             
     except Exception as e:
-        print(f"{Fore.RED}[X] OpenCellID error: {str(e)}{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] OpenCellID error: {str(e)}{Style.RESET_ALL}")
         return False
 
-def test_twilio():
+async def probe_twilio(session, out):
     """Test Twilio API"""
-    print(f"\n{Fore.CYAN}Testing Twilio API...{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}Testing Twilio API...{Style.RESET_ALL}")
     
     account_sid = os.getenv('TWILIO_SID')
     auth_token = os.getenv('TWILIO_AUTH_TOKEN')
     
     if not account_sid or not auth_token:
-        print(f"{Fore.RED}[X] Twilio credentials not found{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] Twilio credentials not found{Style.RESET_ALL}")
         return False
     
     try:
         from twilio.rest import Client
         client = Client(account_sid, auth_token)
         
-        # Get account info to verify credentials
-        account = client.api.accounts(account_sid).fetch()
+        # Twilio's SDK is blocking (the shared session is unused); keep it off the event loop
+        loop = asyncio.get_running_loop()
+        account = await loop.run_in_executor(None, client.api.accounts(account_sid).fetch)
         
-        print(f"{Fore.GREEN}[OK] Twilio API working!{Style.RESET_ALL}")
-        print(f"  Account Status: {account.status}")
-        print(f"  Type: {account.type}")
+        out.append(f"{Fore.GREEN}[OK] Twilio API working!{Style.RESET_ALL}")
+        out.append(f"  Account Status: {account.status}")
+        out.append(f"  Type: {account.type}")
         
         # Try a phone lookup (costs $0.01)
         try:
-            phone_number = client.lookups.v2.phone_numbers('+14158586273').fetch()
-            print(f"  Test lookup successful!")
+            await loop.run_in_executor(None, client.lookups.v2.phone_numbers('+14158586273').fetch)
+            out.append(f"  Test lookup successful!")
         except:
-            print(f"  {Fore.YELLOW}Note: Phone lookup skipped (costs $0.01){Style.RESET_ALL}")
+            out.append(f"  {Fore.YELLOW}Note: Phone lookup skipped (costs $0.01){Style.RESET_ALL}")
             
         return True
         
     except Exception as e:
-        print(f"{Fore.RED}[X] Twilio error: {str(e)}{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] Twilio error: {str(e)}{Style.RESET_ALL}")
         return False
 
-def test_hunter():
+async def probe_hunter(session, out):
     """Test Hunter.io API"""
-    print(f"\n{Fore.CYAN}Testing Hunter.io API...{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}Testing Hunter.io API...{Style.RESET_ALL}")
     
     api_key = os.getenv('HUNTER_API_KEY')
     if not api_key:
-        print(f"{Fore.RED}[X] Hunter.io API key not found{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] Hunter.io API key not found{Style.RESET_ALL}")
         return False
     
     try:
         url = "https://api.hunter.io/v2/account"
         params = {'api_key': api_key}
         
-        response = requests.get(url, params=params, timeout=10)
-        data = response.json()
+        async with session.get(url, params=params) as response:
+            data = await response.json(content_type=None)
         
         if 'data' in data:
-            print(f"{Fore.GREEN}[OK] Hunter.io API working!{Style.RESET_ALL}")
-            print(f"  Plan: {data['data']['plan_name']}")
+            out.append(f"{Fore.GREEN}[OK] Hunter.io API working!{Style.RESET_ALL}")
+            out.append(f"  Plan: {data['data']['plan_name']}")
             if 'requests' in data['data']:
                 requests_data = data['data']['requests']
                 if 'available' in requests_data:
-                    print(f"  Requests available: {requests_data['available']}")
+                    out.append(f"  Requests available: {requests_data['available']}")
                 elif 'used' in requests_data:
-                    print(f"  Requests used: {requests_data['used']}")
+                    out.append(f"  Requests used: {requests_data['used']}")
                 else:
-                    print(f"  Requests: {requests_data}")
+                    out.append(f"  Requests: {requests_data}")
             return True
         else:
-            print(f"{Fore.RED}[X] Hunter.io error: Invalid response{Style.RESET_ALL}")
+            out.append(f"{Fore.RED}[X] Hunter.io error: Invalid response{Style.RESET_ALL}")
             return False
             
     except Exception as e:
-        print(f"{Fore.RED}[X] Hunter.io error: {str(e)}{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] Hunter.io error: {str(e)}{Style.RESET_ALL}")
         return False
 
-def test_shodan():
+async def probe_shodan(session, out):
     """Test Shodan API"""
-    print(f"\n{Fore.CYAN}Testing Shodan API...{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}Testing Shodan API...{Style.RESET_ALL}")
 
     api_key = os.getenv('SHODAN_KEY')
     if not api_key:
-        print(f"{Fore.RED}[X] Shodan API key not found{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] Shodan API key not found{Style.RESET_ALL}")
         return False
 
     try:
         url = "https://api.shodan.io/api-info"
         params = {'key': api_key}
 
-        response = requests.get(url, params=params, timeout=10)
-        data = response.json()
+        async with session.get(url, params=params) as response:
+            data = await response.json(content_type=None)
 
         if 'query_credits' in data:
-            print(f"{Fore.GREEN}[OK] Shodan API working!{Style.RESET_ALL}")
-            print(f"  Query credits: {data['query_credits']}")
-            print(f"  Scan credits: {data['scan_credits']}")
+            out.append(f"{Fore.GREEN}[OK] Shodan API working!{Style.RESET_ALL}")
+            out.append(f"  Query credits: {data['query_credits']}")
+            out.append(f"  Scan credits: {data['scan_credits']}")
             return True
         else:
-            print(f"{Fore.RED}[X] Shodan error: Invalid response{Style.RESET_ALL}")
+            out.append(f"{Fore.RED}[X] Shodan error: Invalid response{Style.RESET_ALL}")
             return False
 
     except Exception as e:
-        print(f"{Fore.RED}[X] Shodan error: {str(e)}{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] Shodan error: {str(e)}{Style.RESET_ALL}")
         return False
 
-def test_hibp():
+async def probe_hibp(session, out):
     """Test Have I Been Pwned API"""
-    print(f"\n{Fore.CYAN}Testing Have I Been Pwned API...{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}Testing Have I Been Pwned API...{Style.RESET_ALL}")
 
     api_key = os.getenv('HAVEIBEENPWNED_API_KEY')
     if not api_key:
-        print(f"{Fore.RED}[X] HIBP API key not found{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] HIBP API key not found{Style.RESET_ALL}")
         return False
 
     try:
@@ -233,39 +236,56 @@ def test_hibp():
             'User-Agent': 'PhoneOSINT-Framework'
         }
 
-        response = requests.get(url, headers=headers, timeout=10)
+        async with session.get(url, headers=headers) as response:
+            status = response.status
 
-        if response.status_code == 200:
-            print(f"{Fore.GREEN}[OK] HIBP API working!{Style.RESET_ALL}")
-            print(f"  Status: Active")
+        if status == 200:
+            out.append(f"{Fore.GREEN}[OK] HIBP API working!{Style.RESET_ALL}")
+            out.append(f"  Status: Active")
             return True
-        elif response.status_code == 404:
-            print(f"{Fore.GREEN}[OK] HIBP API working!{Style.RESET_ALL}")
-            print(f"  Status: Active (test email not found)")
+        elif status == 404:
+            out.append(f"{Fore.GREEN}[OK] HIBP API working!{Style.RESET_ALL}")
+            out.append(f"  Status: Active (test email not found)")
             return True
         else:
-            print(f"{Fore.RED}[X] HIBP error: HTTP {response.status_code}{Style.RESET_ALL}")
+            out.append(f"{Fore.RED}[X] HIBP error: HTTP {status}{Style.RESET_ALL}")
             return False
 
     except Exception as e:
-        print(f"{Fore.RED}[X] HIBP error: {str(e)}{Style.RESET_ALL}")
+        out.append(f"{Fore.RED}[X] HIBP error: {str(e)}{Style.RESET_ALL}")
         return False
 
-def main():
+async def main():
     """Run all API tests"""
     print(f"\n{Fore.MAGENTA}{'='*50}")
     print("Phone OSINT Framework - API Testing")
     print(f"{'='*50}{Style.RESET_ALL}")
     
-    results = {
-        'NumVerify': test_numverify(),
-        'Google Search': test_google_search(),
-        'OpenCellID': test_opencellid(),
-        'Twilio': test_twilio(),
-        'Hunter.io': test_hunter(),
-        'Shodan': test_shodan(),
-        'Have I Been Pwned': test_hibp()
+    # Probes are independent, so run them concurrently: wall time is the slowest one.
+    # Each probe buffers its output so reports print whole and in order.
+    probes = {
+        'NumVerify': probe_numverify,
+        'Google Search': probe_google_search,
+        'OpenCellID': probe_opencellid,
+        'Twilio': probe_twilio,
+        'Hunter.io': probe_hunter,
+        'Shodan': probe_shodan,
+        'Have I Been Pwned': probe_hibp
     }
+    outputs = {api: [] for api in probes}
+    
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+        outcomes = await asyncio.gather(
+            *(probe(session, outputs[api]) for api, probe in probes.items()),
+            return_exceptions=True
+        )
+    
+    results = {}
+    for api, outcome in zip(probes, outcomes):
+        print("\n".join(outputs[api]))
+        if isinstance(outcome, BaseException):
+            print(f"{Fore.RED}[X] {api} error: {str(outcome)}{Style.RESET_ALL}")
+        results[api] = outcome is True
     
     print(f"\n{Fore.MAGENTA}{'='*50}")
     print("Test Summary:")
@@ -286,4 +306,4 @@ def main():
         print(f"\n{Fore.GREEN}All APIs configured correctly! Ready for testing.{Style.RESET_ALL}")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
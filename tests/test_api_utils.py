@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Unit tests for shared API utilities
+Tests the per-host token-bucket rate limiter and search result parsing
+"""
+import pytest
+import sys
+from pathlib import Path
+import json
+from contextlib import nullcontext
+from unittest.mock import Mock, patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.api_utils import DuckDuckGoClient, HostRateLimiter, RateLimitedAPIClient, SerpApiClient, UnifiedSearchClient
+from scripts.query_cache import QueryCache
+
+
+@pytest.fixture(autouse=True)
+def query_cache(tmp_path):
+    cache = QueryCache(cache_dir=str(tmp_path))
+    with patch('scripts.query_cache.get_query_cache', return_value=cache):
+        yield cache
+
+
+class FakeClock:
+    """Monotonic clock that only advances when slept on"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch('scripts.api_utils.time.monotonic', clock.monotonic), \
+         patch('scripts.api_utils.time.sleep', clock.sleep):
+        yield clock
+
+
+class TestHostRateLimiter:
+    """Test token-bucket pacing per host"""
+
+    def test_first_request_is_free_then_paced(self, clock):
+        """Test a fresh host doesn't wait and back-to-back requests wait 1/rate"""
+        limiter = HostRateLimiter(rates={'default': 2.0})
+
+        assert limiter.acquire('example.com') == 0
+        assert limiter.acquire('example.com') == pytest.approx(0.5)
+
+    def test_idle_host_refills(self, clock):
+        """Test time spent elsewhere refills the bucket"""
+        limiter = HostRateLimiter(rates={'default': 1.0})
+        limiter.acquire('example.com')
+        clock.now += 5
+
+        assert limiter.acquire('example.com') == 0
+
+    def test_hosts_are_independent(self, clock):
+        """Test one busy host doesn't delay another"""
+        limiter = HostRateLimiter(rates={'default': 1.0})
+        limiter.acquire('a.example')
+
+        assert limiter.acquire('b.example') == 0
+
+    def test_subdomain_uses_parent_rate(self, clock):
+        """Test www.* hosts pick up their configured domain rate"""
+        limiter = HostRateLimiter()
+        limiter.acquire('www.truepeoplesearch.com')
+
+        assert limiter.acquire('www.truepeoplesearch.com') == pytest.approx(5.0)
+
+
+class TestRateLimitedAPIClient:
+    """Test connection reuse by the API clients"""
+
+    @patch('scripts.api_utils.time.sleep')
+    def test_requests_share_one_session(self, mock_sleep):
+        """Test every request goes through the client's keep-alive session, closed with the client"""
+        with patch('scripts.api_utils.requests.Session') as mock_session_cls:
+            session = mock_session_cls.return_value
+            session.get.return_value = Mock(status_code=200)
+            with RateLimitedAPIClient(base_delay=0) as client:
+                client.make_request_with_backoff("https://api.example.com/a")
+                client.make_request_with_backoff("https://api.example.com/b")
+
+        mock_session_cls.assert_called_once()
+        assert session.get.call_count == 2
+        session.close.assert_called_once()
+
+    def test_shared_session_left_open(self):
+        """Test a caller-provided session is not closed by the client"""
+        shared = Mock()
+        RateLimitedAPIClient(session=shared).close()
+        shared.close.assert_not_called()
+
+    def test_router_closes_its_engines(self):
+        """Test closing the unified router closes every engine client it holds"""
+        google, bing = Mock(), Mock()
+        router = UnifiedSearchClient(google, bing)
+
+        with patch.object(router.ddg, 'close') as ddg_close:
+            router.close()
+
+        google.close.assert_called_once()
+        bing.close.assert_called_once()
+        ddg_close.assert_called_once()
+
+
+DDG_HTML = """
+<html><body>
+  <div class="result results_links web-result">
+    <a class="result__a" href="https://example.com/jane">Jane Doe - Example</a>
+    <a class="result__snippet">Jane Doe, Springfield</a>
+  </div>
+  <div class="result"><a class="result__a" href="https://example.org/">Second</a></div>
+  <div class="result"><a class="result__a" href="https://example.net/">Third</a></div>
+</body></html>
+"""
+
+
+class TestDuckDuckGoClient:
+    """Test DuckDuckGo HTML result parsing"""
+
+    def test_parses_results_up_to_limit(self):
+        """Test links, titles and snippets are extracted and capped at num_results"""
+        client = DuckDuckGoClient()
+        response = Mock(status_code=200, content=DDG_HTML.encode())
+
+        with patch.object(client, 'make_request_with_backoff', return_value=response):
+            result = client.search("Jane Doe", num_results=2)
+
+        assert result['items'] == [
+            {'link': 'https://example.com/jane', 'title': 'Jane Doe - Example', 'snippet': 'Jane Doe, Springfield'},
+            {'link': 'https://example.org/', 'title': 'Second', 'snippet': ''},
+        ]
+        assert result['searchInformation'] == {'totalResults': 2}
+
+    def test_repeat_query_served_from_cache(self):
+        """Test a query with results is scraped once, while an empty page is retried"""
+        client = DuckDuckGoClient()
+        found = Mock(status_code=200, content=DDG_HTML.encode())
+        empty = Mock(status_code=200, content=b'<html><body></body></html>')
+
+        with patch.object(client, 'make_request_with_backoff', side_effect=[found, empty, empty]) as mock_request:
+            first = client.search("Jane Doe")
+            second = client.search("Jane Doe")
+            client.search("John Roe")
+            client.search("John Roe")
+
+        assert second == first
+        assert mock_request.call_count == 3
+
+    def test_cache_keyed_by_result_count(self):
+        """Test a cached short page does not answer a request for more results"""
+        client = DuckDuckGoClient()
+        response = Mock(status_code=200, content=DDG_HTML.encode())
+
+        with patch.object(client, 'make_request_with_backoff', return_value=response) as mock_request:
+            short = client.search("Jane Doe", num_results=1)
+            full = client.search("Jane Doe", num_results=3)
+            client.search("Jane Doe", num_results=3)
+
+        assert len(short['items']) == 1
+        assert len(full['items']) == 3
+        assert mock_request.call_count == 2
+
+
+class TestSerpApiClient:
+    """Test SerpApi response conversion"""
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_converts_organic_results(self, use_orjson):
+        """Test organic results map to Google-style items with orjson or the stdlib fallback"""
+        payload = {'organic_results': [{'link': 'https://example.com/', 'title': 'Jane Doe',
+                                        'snippet': 'Springfield', 'displayed_link': 'example.com'}]}
+        body = json.dumps(payload)
+        response = Mock(status_code=200, content=body.encode(), json=lambda: json.loads(body))
+        client = SerpApiClient("key")
+
+        with patch('scripts.api_utils.orjson', None) if not use_orjson else nullcontext(), \
+             patch.object(client, 'make_request_with_backoff', return_value=response):
+            result = client.search("Jane Doe")
+
+        assert result['items'] == [{'link': 'https://example.com/', 'title': 'Jane Doe',
+                                    'snippet': 'Springfield', 'displayLink': 'example.com'}]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Unit tests for SocialMediaScanner module
+Tests profile parsing with a mocked Selenium driver
+"""
+import pytest
+import requests
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+from cachetools import TTLCache
+from selenium.common.exceptions import TimeoutException
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import social_scanner
+from scripts.social_scanner import SocialMediaScanner
+
+
+def make_scanner(enriched_identity=None, discovered_emails=None):
+    """Scanner with Selenium setup skipped and a mock driver attached"""
+    social_scanner._profile_html_cache.clear()
+    with patch.object(SocialMediaScanner, 'setup_selenium'):
+        scanner = SocialMediaScanner("+14158586273", discovered_emails, enriched_identity)
+    scanner.driver = Mock()
+    scanner.selenium_available = True
+    scanner.rate_limiter = Mock()
+    # No network in tests: static HTML fetches fail unless a test mocks a response
+    scanner.http = Mock()
+    scanner.http.get.side_effect = requests.ConnectionError("offline")
+    return scanner
+
+
+@pytest.fixture
+def scanner():
+    return make_scanner()
+
+
+@pytest.fixture
+def named_scanner():
+    return make_scanner(enriched_identity={'primary_names': ['Jane Doe']})
+
+
+class TestLinkedInProfileParsing:
+    """Test LinkedIn top-card extraction"""
+
+    def test_scrape_linkedin_top_card(self, scanner):
+        """Test name, headline and location come from one selector pass"""
+        scanner.driver.page_source = """
+            <html><body>
+              <h1 class="top-card-layout__name">Jane Doe</h1>
+              <div class="top-card-layout__headline">Engineer at Acme Corp</div>
+              <span class="top-card__subline-location">Austin, TX</span>
+            </body></html>
+        """
+        result = scanner._scrape_linkedin_profile("https://www.linkedin.com/in/janedoe")
+
+        assert result['scraped'] == True
+        assert result['full_name'] == "Jane Doe"
+        assert result['headline'] == "Engineer at Acme Corp"
+        assert result['location'] == "Austin, TX"
+        assert result['job_title'] == "Engineer"
+        assert result['company'] == "Acme Corp"
+
+    def test_scrape_linkedin_login_wall(self, scanner):
+        """Test login-walled page returns empty fields"""
+        scanner.driver.page_source = "<html><body><h1>Sign in</h1></body></html>"
+        result = scanner._scrape_linkedin_profile("https://www.linkedin.com/in/janedoe")
+
+        assert result['scraped'] == True
+        assert result['full_name'] is None
+        assert result['headline'] is None
+
+
+class TestInstagramProfileParsing:
+    """Test Instagram bio extraction"""
+
+    def test_scrape_instagram_bio(self, scanner):
+        """Test bio selectors are combined and contacts extracted"""
+        scanner.driver.page_source = """
+            <html><body>
+              <div class="x-biography">Photographer jane@example.com</div>
+              <span class="_aade">Call 415-555-2671</span>
+            </body></html>
+        """
+        result = scanner._scrape_instagram_profile("janedoe")
+
+        assert result['scraped'] == True
+        assert 'Photographer' in result['bio_text']
+        assert result['emails'] == ['jane@example.com']
+        assert result['phone_numbers'] == ['4155552671']
+
+
+class TestTwitterProfileParsing:
+    """Test Twitter data-testid extraction"""
+
+    def test_scrape_twitter_profile(self, scanner):
+        """Test bio, name, location, website and followers are extracted"""
+        scanner.driver.page_source = """
+            <html><body>
+              <div data-testid="UserName">Jane Doe @janedoe</div>
+              <div data-testid="UserDescription">Contact: jane@example.com</div>
+              <span data-testid="UserLocation">Austin, TX</span>
+              <a data-testid="UserUrl" href="https://t.co/abc">janedoe.dev</a>
+              <a href="/janedoe/verified_followers">1,234 Followers</a>
+            </body></html>
+        """
+        result = scanner._scrape_twitter_profile("janedoe")
+
+        assert result['full_name'] == "Jane Doe"
+        assert result['location'] == "Austin, TX"
+        assert result['website'] == "https://t.co/abc"
+        assert result['follower_count'] == "1,234 Followers"
+        assert result['emails'] == ['jane@example.com']
+
+    def test_scrape_twitter_profile_via_nitter(self, scanner):
+        """Test Nitter static HTML is used without touching Selenium"""
+        scanner.http = Mock()
+        scanner.http.get.return_value.text = """
+            <html><body>
+              <a class="profile-card-fullname" href="/janedoe">Jane Doe</a>
+              <div class="profile-bio"><p>DMs open: jane@example.com</p></div>
+              <div class="profile-location"><span>Austin, TX</span></div>
+              <div class="profile-website"><a href="https://janedoe.dev">janedoe.dev</a></div>
+              <ul class="profile-statlist">
+                <li class="followers"><span class="profile-stat-num">1,234</span></li>
+              </ul>
+            </body></html>
+        """
+        result = scanner._scrape_twitter_profile("janedoe")
+
+        assert result['full_name'] == "Jane Doe"
+        assert result['location'] == "Austin, TX"
+        assert result['website'] == "https://janedoe.dev"
+        assert result['follower_count'] == "1,234"
+        assert result['emails'] == ['jane@example.com']
+        assert scanner.http.get.call_args.args[0] == "https://nitter.net/janedoe"
+        scanner.driver.get.assert_not_called()
+
+
+class TestGitHubProfileParsing:
+    """Test GitHub vcard extraction"""
+
+    def test_scrape_github_profile(self, scanner):
+        """Test vcard fields and linked Twitter handle are extracted"""
+        scanner.http = Mock()
+        scanner.http.get.return_value.text = """
+            <html><body>
+              <span class="p-name vcard-fullname">Jane Doe</span>
+              <span class="p-org">Acme Corp</span>
+              <span class="p-label">Austin, TX</span>
+              <a href="https://twitter.com/janedoe">@janedoe</a>
+              <div class="user-profile-bio">Reach me at jane@example.com</div>
+            </body></html>
+        """
+        result = scanner._scrape_github_profile("janedoe")
+
+        assert result['full_name'] == "Jane Doe"
+        assert result['company'] == "Acme Corp"
+        assert result['location'] == "Austin, TX"
+        assert result['twitter_username'] == "janedoe"
+        assert result['emails'] == ['jane@example.com']
+        scanner.driver.get.assert_not_called()
+
+    def test_check_github_scrapes_all_profiles(self, named_scanner):
+        """Test concurrently scraped profiles keep search result order"""
+        scanner = named_scanner
+        scanner.http = Mock()
+        scanner.http.get.return_value.json.return_value = {
+            'items': [{'login': 'janedoe'}, {'login': 'jdoe'}, {'login': 'janedoe'}]
+        }
+        profiles = {
+            'janedoe': {'company': 'Acme Corp', 'emails': ['jane@example.com']},
+            'jdoe': {'location': 'Austin, TX', 'emails': []},
+        }
+        with patch.object(scanner, '_scrape_github_profile', side_effect=profiles.get):
+            result = scanner.check_github()
+
+        assert [p['username'] for p in result['profiles']] == ['janedoe', 'jdoe']
+        assert result['emails_discovered'] == ['jane@example.com']
+        assert scanner.http.get.call_args.kwargs['params']['q'] == 'Jane Doe'
+
+    def test_check_github_without_selenium(self, named_scanner):
+        """Test the GitHub check runs over HTTP when Chrome is unavailable"""
+        scanner = named_scanner
+        scanner.selenium_available = False
+        scanner.http = Mock()
+        scanner.http.get.return_value.json.return_value = {'items': [{'login': 'janedoe'}]}
+
+        with patch.object(scanner, '_scrape_github_profile', return_value={'emails': ['jane@example.com']}):
+            result = scanner.check_github()
+
+        assert result['emails_discovered'] == ['jane@example.com']
+        scanner.driver.get.assert_not_called()
+
+    def test_scrape_results_memoized(self, named_scanner):
+        """Test a handle is scraped once per scan, including when GitHub links to it"""
+        scanner = named_scanner
+        scanner.http = Mock()
+        scanner.http.get.return_value.text = """
+            <span class="p-name">Jane Doe</span>
+            <a href="https://twitter.com/janedoe">@janedoe</a>
+        """
+        scanner.http.get.return_value.json.return_value = {'items': [{'login': 'janedoe'}]}
+        first = scanner._scrape_github_profile("janedoe")
+        second = scanner._scrape_github_profile("janedoe")
+        assert first is second
+
+        # Twitter check already scraped the linked handle earlier in the scan
+        scanner._scrape_cache[('twitter', 'janedoe')] = {'emails': ['jane@example.com']}
+        result = scanner.check_github()
+
+        # One profile fetch plus the user search - the profile itself isn't refetched
+        assert scanner.http.get.call_count == 2
+        assert 'jane@example.com' in result['emails_discovered']
+        assert result['usernames_discovered'][-1]['linked_from'] == "github:janedoe"
+
+    def test_failed_scrapes_not_memoized(self, scanner):
+        """Test an errored or skipped scrape is retried rather than cached for the scan"""
+        scanner._scrape_github_profile("janedoe")  # http is offline
+        scanner._scrape_github_profile("janedoe")
+        assert scanner.http.get.call_count == 2
+
+        scanner.selenium_available = False
+        scanner._scrape_instagram_profile("janedoe")
+        assert scanner._scrape_cache == {}
+
+
+class TestContactExtraction:
+    """Test email and phone extraction from bio text"""
+
+    def test_extract_contacts_single_pass(self, scanner):
+        """Test emails and phones are split, normalized and deduped"""
+        emails, phones = scanner._extract_contacts_from_text(
+            "Mail jane@example.com or jane@example.com, call 415-555-2671 or 415.555.0000"
+        )
+        assert emails == ['jane@example.com']
+        assert phones == ['4155552671', '4155550000']
+
+    def test_phone_digits_inside_email_not_counted(self, scanner):
+        """Test digits that are part of an email address are not reported as phones"""
+        emails, phones = scanner._extract_contacts_from_text("4155552671@example.com")
+        assert emails == ['4155552671@example.com']
+        assert phones == []
+
+
+class TestProfileFetching:
+    """Test profile page loading and reuse"""
+
+    def test_fetch_profile_html_cached(self, scanner):
+        """Test the same profile URL is only loaded once"""
+        scanner.driver.page_source = "<html><body>profile</body></html>"
+
+        first = scanner._fetch_profile_html("https://github.com/janedoe", '.p-name')
+        second = scanner._fetch_profile_html("https://github.com/janedoe", '.p-name')
+
+        assert first == second
+        assert scanner.driver.get.call_count == 1
+
+    def test_fetch_profile_html_expires(self, scanner):
+        """Test cached profile HTML is refetched once its TTL has passed"""
+        now = [0]
+        cache = TTLCache(maxsize=social_scanner.PROFILE_HTML_CACHE_SIZE,
+                         ttl=social_scanner.PROFILE_HTML_CACHE_TTL, timer=lambda: now[0])
+        scanner.driver.page_source = "<html><body>profile</body></html>"
+
+        with patch.object(social_scanner, '_profile_html_cache', cache):
+            scanner._fetch_profile_html("https://github.com/janedoe", '.p-name')
+            now[0] = social_scanner.PROFILE_HTML_CACHE_TTL + 1
+            scanner._fetch_profile_html("https://github.com/janedoe", '.p-name')
+
+        assert scanner.driver.get.call_count == 2
+
+    @patch('scripts.social_scanner.WebDriverWait')
+    def test_load_page_wait_timeout(self, mock_wait, scanner):
+        """Test a selector that never renders still returns the page source"""
+        mock_wait.return_value.until.side_effect = TimeoutException()
+        scanner.driver.page_source = "<html><body>Sign in</body></html>"
+
+        page_source = scanner._load_page("https://www.linkedin.com/in/janedoe", 'h1')
+
+        assert page_source == "<html><body>Sign in</body></html>"
+
+    def test_twitter_search_usernames_deduped(self, named_scanner):
+        """Test repeated profile links are only scraped once"""
+        scanner = named_scanner
+        scanner.driver.page_source = """
+            <a href="/janedoe">Jane</a><a href="/janedoe">Jane</a>
+            <a href="/search">Search</a><a href="/jdoe">J</a>
+        """
+        with patch.object(scanner, '_scrape_twitter_profile', return_value={}) as mock_scrape:
+            result = scanner.check_twitter_x()
+
+        scraped = [c.args[0] for c in mock_scrape.call_args_list]
+        assert scraped == ['janedoe', 'jdoe']
+        assert len(result['usernames_discovered']) == 2
+
+
+class TestSerpLinkExtraction:
+    """Test Google SERP link extraction for LinkedIn and Instagram"""
+
+    def test_linkedin_serp_links(self, named_scanner):
+        """Test profile URLs are extracted, deduped and limited in rank order"""
+        named_scanner.driver.page_source = """
+            <html><body>
+              <a href="https://www.linkedin.com/in/janedoe?trk=serp">Jane</a>
+              <a href="https://www.linkedin.com/in/janedoe">Jane again</a>
+              <a href="https://example.com/other">Other</a>
+              <a href="https://uk.linkedin.com/in/jdoe">J</a>
+            </body></html>
+        """
+        with patch.object(named_scanner, '_scrape_linkedin_profile', return_value={}) as mock_scrape:
+            result = named_scanner.check_linkedin()
+
+        scraped = [c.args[0] for c in mock_scrape.call_args_list]
+        assert scraped == ["https://www.linkedin.com/in/janedoe", "https://uk.linkedin.com/in/jdoe"]
+        assert len(result['usernames_discovered']) == 2
+
+    def test_instagram_serp_skips_posts_and_empty_page(self, named_scanner):
+        """Test post links and reserved paths are skipped; empty pages yield nothing"""
+        named_scanner.driver.page_source = """
+            <a href="https://www.instagram.com/p/abc123/">Post</a>
+            <a href="https://www.instagram.com/explore/">Explore</a>
+            <a href="https://www.instagram.com/janedoe/">Jane</a>
+        """
+        with patch.object(named_scanner, '_scrape_instagram_profile', return_value={}) as mock_scrape:
+            named_scanner.check_instagram()
+        assert [c.args[0] for c in mock_scrape.call_args_list] == ['janedoe']
+
+        assert list(social_scanner._iter_link_hrefs("")) == []
+
+
+class TestSearchUrls:
+    """Test search URL construction"""
+
+    def test_facebook_urls_are_encoded(self):
+        """Test phone '+' and email '@' are percent-encoded"""
+        scanner = make_scanner(discovered_emails=['jane+osint@example.com'])
+        result = scanner.check_facebook()
+
+        urls = [u['url'] for u in result['search_urls']]
+        assert urls[0] == "https://www.facebook.com/search/top?q=%2B14158586273"
+        assert urls[1] == "https://www.facebook.com/search/top?q=jane%2Bosint%40example.com"
+
+    def test_name_with_special_characters(self):
+        """Test names containing '&' do not break the query string"""
+        scanner = make_scanner(enriched_identity={'primary_names': ['Smith & Jones']})
+        scanner.selenium_available = False
+        result = scanner.check_linkedin()
+
+        assert result['search_urls'][0]['url'].endswith("keywords=Smith+%26+Jones")
+
+
+class TestScanAllPlatforms:
+    """Test cross-platform aggregation"""
+
+    def test_aggregated_data_deduped_in_order(self, scanner):
+        """Test emails, phones and usernames are deduplicated keeping first-seen order"""
+        twitter = {
+            'emails_discovered': ['b@example.com', 'a@example.com'],
+            'usernames_discovered': [{'platform': 'twitter', 'username': 'janedoe'}],
+            'profiles': [{'phone_numbers': ['4155552671']}]
+        }
+        github = {
+            'emails_discovered': ['a@example.com', 'c@example.com'],
+            'usernames_discovered': [
+                {'platform': 'github', 'username': 'janedoe'},
+                {'platform': 'twitter', 'username': 'janedoe'}
+            ],
+            'profiles': [{'phone_numbers': ['4155552671', '4155550000']}]
+        }
+        with patch.object(scanner, 'check_twitter_x', return_value=twitter), \
+             patch.object(scanner, 'check_github', return_value=github), \
+             patch.object(scanner, 'check_linkedin', return_value={}), \
+             patch.object(scanner, 'check_instagram', return_value={}):
+            result = scanner.scan_all_platforms()
+
+        aggregated = result['aggregated_data']
+        assert aggregated['all_emails'] == ['b@example.com', 'a@example.com', 'c@example.com']
+        assert aggregated['all_phone_numbers'] == ['4155552671', '4155550000']
+        assert len(aggregated['all_usernames']) == 2
+        assert result['summary']['total_emails_discovered'] == 3
+
+    def test_profile_fields_deduped_per_platform(self, scanner):
+        """Test identical (platform, value) locations and companies are listed once"""
+        github = {
+            'profiles': [
+                {'location': 'Austin, TX', 'company': 'Acme Corp'},
+                {'location': 'Austin, TX', 'company': 'Globex'},
+            ]
+        }
+        linkedin = {'profiles': [{'location': 'Austin, TX'}]}
+        with patch.object(scanner, 'check_github', return_value=github), \
+             patch.object(scanner, 'check_linkedin', return_value=linkedin), \
+             patch.object(scanner, 'check_twitter_x', return_value={}), \
+             patch.object(scanner, 'check_instagram', return_value={}):
+            result = scanner.scan_all_platforms()
+
+        aggregated = result['aggregated_data']
+        assert aggregated['all_locations'] == [
+            {'platform': 'linkedin', 'location': 'Austin, TX'},
+            {'platform': 'github', 'location': 'Austin, TX'},
+        ]
+        assert [c['company'] for c in aggregated['all_companies']] == ['Acme Corp', 'Globex']
+        assert result['summary']['total_locations_found'] == 2
+
+    def test_failing_platform_isolated(self, scanner):
+        """Test one platform raising does not stop the concurrent scan"""
+        with patch.object(scanner, 'check_linkedin', side_effect=RuntimeError("boom")), \
+             patch.object(scanner, 'check_twitter_x', return_value={'emails_discovered': ['a@example.com']}), \
+             patch.object(scanner, 'check_instagram', return_value={}), \
+             patch.object(scanner, 'check_github', return_value={}):
+            result = scanner.scan_all_platforms()
+
+        assert result['linkedin'] == {'error': 'boom'}
+        assert result['aggregated_data']['all_emails'] == ['a@example.com']
+        assert 'facebook' in result and 'whatsapp' in result
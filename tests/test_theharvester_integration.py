@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Unit tests for TheHarvesterIntegration module
+Tests theHarvester subprocess handling and name-based email filtering
+"""
+import pytest
+import asyncio
+import json
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.theharvester_integration import TheHarvesterIntegration, PERSONAL_EMAIL_DOMAINS
+
+
+def fake_harvester_process(emails_by_domain):
+    """Build a create_subprocess_exec replacement that writes theHarvester JSON output"""
+    async def create_subprocess_exec(*cmd, **kwargs):
+        domain = cmd[cmd.index('-d') + 1]
+        output_file = Path(cmd[cmd.index('-f') + 1])
+        output_file.write_text(json.dumps({'emails': emails_by_domain.get(domain, [])}))
+        return finished_process(0)
+    return create_subprocess_exec
+
+
+def finished_process(returncode, output=b''):
+    """Exited process whose combined stdout/stderr is output; build inside a running loop"""
+    stdout = asyncio.StreamReader()
+    stdout.feed_data(output)
+    stdout.feed_eof()
+    proc = Mock(returncode=returncode, stdout=stdout)
+    proc.wait = AsyncMock(return_value=returncode)
+    return proc
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit():
+    with patch('scripts.theharvester_integration.RATE_LIMITER'):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def reset_engine_cooldown():
+    with patch.object(TheHarvesterIntegration, '_engine_failed_at', None):
+        yield
+
+
+class TestNameBasedHarvest:
+    """Test concurrent name-based harvesting across personal email domains"""
+
+    def test_harvest_name_based_emails(self, tmp_path):
+        """Test every domain is searched and only name-matching emails are kept"""
+        harvester = TheHarvesterIntegration(target_name="Jane Doe")
+        emails = {
+            'gmail.com': ['jane.doe@gmail.com', 'someone@gmail.com'],
+            'outlook.com': ['jdoe@outlook.com'],
+        }
+
+        with patch.object(harvester, 'check_theharvester_available', return_value=True), \
+             patch('scripts.theharvester_integration.asyncio.create_subprocess_exec',
+                   side_effect=fake_harvester_process(emails)) as mock_exec:
+            result = harvester.harvest_name_based_emails("Jane Doe", tmp_path)
+
+        assert mock_exec.call_count == len(PERSONAL_EMAIL_DOMAINS)
+        assert result['found'] == True
+        assert result['domains_searched'] == ['gmail.com', 'outlook.com']
+        assert [e['email'] for e in result['emails']] == ['jane.doe@gmail.com', 'jdoe@outlook.com']
+
+    def test_harvest_name_based_emails_not_installed(self, tmp_path):
+        """Test missing theHarvester short-circuits before any subprocess"""
+        harvester = TheHarvesterIntegration(target_name="Jane Doe")
+
+        with patch.object(harvester, 'check_theharvester_available', return_value=False):
+            result = harvester.harvest_name_based_emails("Jane Doe", tmp_path)
+
+        assert result['found'] == False
+        assert result['error'] == 'theHarvester not installed'
+
+    def test_failed_domain_does_not_stop_others(self, tmp_path):
+        """Test a domain whose run raises is skipped"""
+        harvester = TheHarvesterIntegration(target_name="Jane Doe")
+        good = fake_harvester_process({'yahoo.com': ['janedoe@yahoo.com']})
+
+        async def flaky(*cmd, **kwargs):
+            if 'gmail.com' in cmd:
+                raise OSError("spawn failed")
+            return await good(*cmd, **kwargs)
+
+        with patch.object(harvester, 'check_theharvester_available', return_value=True), \
+             patch('scripts.theharvester_integration.asyncio.create_subprocess_exec', side_effect=flaky):
+            result = harvester.harvest_name_based_emails("Jane Doe", tmp_path)
+
+        assert [e['email'] for e in result['emails']] == ['janedoe@yahoo.com']
+
+
+class TestRetryBackoff:
+    """Test retries, rate-limit backoff and engine cooldown"""
+
+    @patch('scripts.theharvester_integration.asyncio.sleep', new_callable=AsyncMock)
+    def test_rate_limited_run_is_retried_with_long_backoff(self, mock_sleep, tmp_path):
+        """Test a throttled run backs off from the rate-limit base and succeeds on retry"""
+        harvester = TheHarvesterIntegration(target_name="Jane Doe")
+        good = fake_harvester_process({'gmail.com': ['jane@gmail.com']})
+        runs = []
+
+        async def throttled_once(*cmd, **kwargs):
+            runs.append(cmd)
+            if len(runs) == 1:
+                return finished_process(1, b'HTTP Error 429: Too Many Requests')
+            return await good(*cmd, **kwargs)
+
+        with patch('scripts.theharvester_integration.asyncio.create_subprocess_exec', side_effect=throttled_once):
+            result = asyncio.run(harvester._harvest_domain_async('gmail.com', tmp_path))
+
+        assert result['emails'] == ['jane@gmail.com']
+        assert len(runs) == 2
+        assert mock_sleep.await_args.args[0] >= 30
+
+    @patch('scripts.theharvester_integration.asyncio.sleep', new_callable=AsyncMock)
+    def test_exhausted_retries_start_engine_cooldown(self, mock_sleep, tmp_path):
+        """Test a domain that keeps failing puts the engine on cooldown for later domains"""
+        harvester = TheHarvesterIntegration()
+
+        with patch.object(harvester, 'check_theharvester_available', return_value=True), \
+             patch.object(harvester, '_run_harvester', return_value=(1, '')) as mock_run:
+            first = harvester.harvest_domain_emails('gmail.com', tmp_path)
+            second = harvester.harvest_domain_emails('yahoo.com', tmp_path)
+
+        assert mock_run.await_count == 3
+        assert mock_sleep.await_count == 2
+        assert first['found'] == False
+        assert 'cooling down' in second['error']
+
+
+class TestRunHarvester:
+    """Test theHarvester process output handling"""
+
+    def test_output_streamed_and_tail_returned(self):
+        """Test stdout and stderr lines are logged and returned for failure diagnosis"""
+        harvester = TheHarvesterIntegration()
+        script = "import sys; print('searching', flush=True); print('HTTP 429 Too Many Requests', file=sys.stderr); sys.exit(2)"
+
+        with patch.object(harvester.logger, 'info') as mock_info:
+            returncode, output = asyncio.run(harvester._run_harvester([sys.executable, '-c', script]))
+
+        assert returncode == 2
+        assert output == 'searching\nHTTP 429 Too Many Requests'
+        mock_info.assert_any_call('[theHarvester] searching')
+        mock_info.assert_any_call('[theHarvester] HTTP 429 Too Many Requests')
+
+    @patch('scripts.theharvester_integration.HARVEST_TIMEOUT', 0.5)
+    def test_hung_run_is_killed(self):
+        """Test a run past the timeout is killed and reported as a timeout"""
+        harvester = TheHarvesterIntegration()
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(harvester._run_harvester([sys.executable, '-c', "import time; time.sleep(30)"]))
+
+
+class TestParseHarvestOutput:
+    """Test reading theHarvester JSON output"""
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_reads_emails(self, tmp_path, use_orjson):
+        """Test emails are read with orjson or the stdlib fallback"""
+        output_file = tmp_path / "gmail_com_harvest.json"
+        output_file.write_text(json.dumps({'emails': ['jane@gmail.com'], 'hosts': []}))
+        harvester = TheHarvesterIntegration()
+
+        with patch('scripts.theharvester_integration.orjson', None) if not use_orjson else nullcontext():
+            result = harvester._parse_harvest_output('gmail.com', output_file)
+
+        assert result['found'] == True
+        assert result['emails'] == ['jane@gmail.com']
+
+    def test_missing_output_file(self, tmp_path):
+        """Test a run that wrote no file finds nothing"""
+        result = TheHarvesterIntegration()._parse_harvest_output('gmail.com', tmp_path / "missing.json")
+        assert result['found'] == False
+
+
+class TestAvailabilityCheck:
+    """Test theHarvester availability probing"""
+
+    @patch('scripts.theharvester_integration.shutil.which', return_value='/usr/bin/theharvester')
+    @patch('scripts.theharvester_integration.os.path.isfile', return_value=False)
+    def test_probe_runs_once_per_process(self, mock_isfile, mock_which):
+        """Test the probe is cached across calls and instances"""
+        with patch.object(TheHarvesterIntegration, '_harvester_available', None):
+            assert TheHarvesterIntegration().check_theharvester_available() == True
+            assert TheHarvesterIntegration().check_theharvester_available() == True
+
+        assert mock_which.call_count == 1
+
+    @patch('scripts.theharvester_integration.asyncio.create_subprocess_exec')
+    @patch('scripts.theharvester_integration.shutil.which', return_value=None)
+    @patch('scripts.theharvester_integration.os.path.isfile')
+    def test_probe_does_not_launch_process(self, mock_isfile, mock_which, mock_run):
+        """Test the bundled checkout is found by path and nothing is executed"""
+        mock_isfile.return_value = True
+        assert TheHarvesterIntegration()._probe_theharvester() == True
+
+        mock_isfile.return_value = False
+        assert TheHarvesterIntegration()._probe_theharvester() == False
+        mock_run.assert_not_called()
+
+
+class TestEmailMatchesName:
+    """Test email-to-name matching"""
+
+    def test_matches_name_part(self):
+        harvester = TheHarvesterIntegration()
+        assert harvester._email_matches_name("jane.doe@gmail.com", "Jane Doe") == True
+
+    def test_ignores_short_parts(self):
+        harvester = TheHarvesterIntegration()
+        assert harvester._email_matches_name("jo@gmail.com", "Jo Li") == False
+
+    def test_empty_inputs(self):
+        harvester = TheHarvesterIntegration()
+        assert harvester._email_matches_name("", "Jane Doe") == False
+        assert harvester._email_matches_name("jane@gmail.com", None) == False
+
+    def test_name_parts_are_escaped(self):
+        harvester = TheHarvesterIntegration()
+        assert harvester._email_matches_name("oxconnor@gmail.com", "Al O.Connor") == False
+        assert harvester._email_matches_name("o.connor@gmail.com", "Al O.Connor") == True
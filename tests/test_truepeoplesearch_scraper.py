@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Unit tests for TruePeopleSearchScraper module
+Tests results page parsing without launching a browser
+"""
+import pytest
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.truepeoplesearch_scraper import (
+    TruePeopleSearchScraper, search_truepeoplesearch,
+    BLOCKED_RESOURCE_PATTERNS, CAPTCHA_REQUIRED, CANCELLED
+)
+
+
+RESULTS_PAGE = """
+<html><body>
+  <div class="card">
+    <h1> Jane Doe </h1>
+    <span>Age: 42</span>
+    <div class="content-address current-address">123 Main St <span>Springfield, IL 62701</span></div>
+    <div class="content-address">9 Old Road, Shelbyville, IL</div>
+    <a href="/p/1">John Doe</a>
+    <a href="/p/2">Mary Ann Smith</a>
+    <a href="/p/1">John Doe</a>
+    <a href="/p/3">Jane Doe</a>
+    <a href="/help">view details</a>
+    <a href="/more">more</a>
+    <span>(415) 555-1234</span>
+    <span>415-555-0000</span>
+    <span>415.555.0000</span>
+    <span>217-555-9999</span>
+  </div>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit():
+    with patch('scripts.truepeoplesearch_scraper.RATE_LIMITER'):
+        yield
+
+
+def empty_results():
+    return {
+        'found': False, 'name': None, 'names': [], 'addresses': [],
+        'current_address': None, 'previous_addresses': [], 'associates': [],
+        'relatives': [], 'age': None, 'additional_phones': []
+    }
+
+
+@pytest.fixture
+def parsed():
+    results = empty_results()
+    TruePeopleSearchScraper()._parse_results(RESULTS_PAGE, '4155551234', results)
+    return results
+
+
+class TestParseResults:
+    """Test extraction of fields from a results page"""
+
+    def test_name_and_age(self, parsed):
+        """Test the heading name and age are extracted"""
+        assert parsed['found'] == True
+        assert parsed['name'] == 'Jane Doe'
+        assert parsed['names'] == ['Jane Doe']
+        assert parsed['age'] == 42
+
+    def test_addresses(self, parsed):
+        """Test nested address markup is flattened and typed"""
+        assert parsed['current_address'] == '123 Main St Springfield, IL 62701'
+        assert parsed['previous_addresses'] == ['9 Old Road, Shelbyville, IL']
+        assert [a['type'] for a in parsed['addresses']] == ['current', 'previous']
+
+    def test_associates_deduped_in_order(self, parsed):
+        """Test associates keep page order, drop duplicates and the subject"""
+        assert parsed['associates'] == ['John Doe', 'Mary Ann Smith']
+        assert parsed['relatives'] == parsed['associates']
+
+    def test_additional_phones_exclude_searched_number(self, parsed):
+        """Test other phone numbers are deduped and formatted"""
+        assert parsed['additional_phones'] == ['415-555-0000', '217-555-9999']
+
+    def test_empty_page(self):
+        """Test a page without results leaves defaults untouched"""
+        results = empty_results()
+        TruePeopleSearchScraper()._parse_results('<html><body></body></html>', '4155551234', results)
+
+        assert results['found'] == False
+        assert results['associates'] == []
+        assert results['additional_phones'] == []
+
+
+class TestCaptchaHandling:
+    """Test CAPTCHA detection and waiting"""
+
+    def test_detect_captcha_uses_page_script(self):
+        """Test detection runs in the page rather than reading page_source"""
+        driver = Mock()
+        driver.execute_script.return_value = True
+
+        assert TruePeopleSearchScraper()._detect_captcha(driver) == True
+        assert 'captcha' in driver.execute_script.call_args.args[0]
+
+    def test_detect_captcha_driver_error(self):
+        """Test a failing driver is treated as no CAPTCHA"""
+        driver = Mock()
+        driver.execute_script.side_effect = Exception("no such window")
+
+        assert TruePeopleSearchScraper()._detect_captcha(driver) == False
+
+    def test_wait_returns_once_solved(self):
+        """Test the wait exits as soon as the challenge is gone"""
+        driver = Mock()
+        driver.execute_script.return_value = False
+
+        assert TruePeopleSearchScraper()._wait_for_captcha_solve(driver, timeout=10) == True
+        assert driver.execute_script.call_count == 1
+
+    def test_wait_times_out(self):
+        """Test an unsolved challenge reports failure"""
+        driver = Mock()
+        driver.execute_script.return_value = True
+
+        assert TruePeopleSearchScraper()._wait_for_captcha_solve(driver, timeout=0) == False
+
+    @patch.object(TruePeopleSearchScraper, 'check_dependencies', return_value={'ready': True})
+    @patch('undetected_chromedriver.Chrome')
+    def test_headless_search_fails_fast_on_captcha(self, mock_chrome, mock_deps):
+        """Test a headless browser reports the CAPTCHA instead of waiting on it"""
+        driver = Mock()
+        driver.execute_script.return_value = True
+        mock_chrome.return_value = driver
+
+        with TruePeopleSearchScraper() as scraper:
+            result = scraper.search_by_phone('415-555-1234')
+
+        assert result['error'] == CAPTCHA_REQUIRED
+        assert '--headless=new' in mock_chrome.call_args.kwargs['options'].arguments
+        driver.execute_cdp_cmd.assert_any_call('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_PATTERNS})
+
+    def test_factory_retries_visible_on_captcha(self):
+        """Test the single-search factory relaunches visible when headless hits a CAPTCHA"""
+        modes = []
+
+        def search(scraper, phone):
+            modes.append(scraper.headless)
+            return {'error': CAPTCHA_REQUIRED} if scraper.headless else {'found': True}
+
+        with patch.object(TruePeopleSearchScraper, 'search_by_phone', search):
+            result = search_truepeoplesearch('415-555-1234')
+
+        assert modes == [True, False]
+        assert result['found'] == True
+
+    @patch.object(TruePeopleSearchScraper, 'check_dependencies', return_value={'ready': True})
+    @patch('undetected_chromedriver.Chrome')
+    def test_cancelled_search_skips_browser(self, mock_chrome, mock_deps):
+        """Test a search cancelled before it starts never launches Chrome"""
+        cancel = threading.Event()
+        cancel.set()
+
+        result = search_truepeoplesearch('415-555-1234', cancel)
+
+        assert result['error'] == CANCELLED
+        mock_chrome.assert_not_called()
+
+    @patch.object(TruePeopleSearchScraper, 'check_dependencies', return_value={'ready': True})
+    @patch('undetected_chromedriver.Chrome')
+    def test_cancel_ends_captcha_wait(self, mock_chrome, mock_deps):
+        """Test a visible browser stops waiting on a CAPTCHA once cancelled and is closed"""
+        cancel = threading.Event()
+        driver = Mock()
+        driver.execute_script.side_effect = lambda script: cancel.set() or True  # CAPTCHA never clears
+        mock_chrome.return_value = driver
+
+        with TruePeopleSearchScraper(headless=False, cancel_event=cancel) as scraper:
+            result = scraper.search_by_phone('415-555-1234')
+
+        assert result['error'] == CANCELLED
+        driver.quit.assert_called_once()
+
+
+class TestSearchByPhone:
+    """Test input validation before any browser launch"""
+
+    def test_invalid_phone_number(self):
+        """Test a malformed number returns an error"""
+        scraper = TruePeopleSearchScraper()
+        scraper.check_dependencies = lambda: {'ready': True}
+        result = scraper.search_by_phone("12345")
+
+        assert result['found'] == False
+        assert 'Invalid phone number format' in result['error']
+
+
+class TestDriverReuse:
+    """Test one browser session serves many searches"""
+
+    @patch.object(TruePeopleSearchScraper, 'check_dependencies', return_value={'ready': True})
+    @patch('undetected_chromedriver.Chrome')
+    def test_failed_search_relaunches_browser(self, mock_chrome, mock_deps):
+        """Test a driver that errors mid-search is dropped"""
+        driver = Mock()
+        driver.get.side_effect = Exception("tab crashed")
+        mock_chrome.return_value = driver
+
+        with TruePeopleSearchScraper() as scraper:
+            result = scraper.search_by_phone('415-555-1234')
+            assert scraper._driver is None
+
+        assert result['error'] == 'tab crashed'
+        driver.quit.assert_called_once()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
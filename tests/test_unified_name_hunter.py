@@ -0,0 +1,599 @@
+#!/usr/bin/env python3
+"""
+Unit tests for UnifiedNameHunter module
+Tests hunter orchestration and multi-source name correlation
+"""
+import numpy as np
+import pytest
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import unified_name_hunter
+from scripts.phone_validator import PhoneValidator, twilio_client
+from scripts.unified_name_hunter import UnifiedNameHunter
+
+
+@pytest.fixture(autouse=True)
+def empty_hunt_cache():
+    unified_name_hunter._hunt_cache.clear()
+    unified_name_hunter._source_cache.clear()
+    yield
+    unified_name_hunter._hunt_cache.clear()
+    unified_name_hunter._source_cache.clear()
+
+
+@pytest.fixture
+def hunter():
+    return UnifiedNameHunter("+14158586273")
+
+
+def patch_hunters(hunter, twilio=None, truepeoplesearch=None):
+    """Replace the network-bound hunters with canned results"""
+    return (
+        patch.object(hunter, '_hunt_twilio_enhanced', side_effect=twilio or (lambda: {'found': False})),
+        patch.object(hunter, '_hunt_truepeoplesearch', side_effect=truepeoplesearch or (lambda: {'found': False})),
+    )
+
+
+class TestPhoneNormalization:
+    """Test the number is normalized once and shared with the hunters"""
+
+    def test_formatting_variants_normalized_to_e164(self):
+        hunter = UnifiedNameHunter("(415) 858-6273")
+        assert hunter.phone_e164 == "+14158586273"
+        assert hunter.phone_validator.phone == "+14158586273"
+
+    def test_unparseable_number_kept_as_given(self):
+        assert UnifiedNameHunter("not a number").phone_e164 == "not a number"
+
+    @patch('scripts.unified_name_hunter.search_truepeoplesearch', return_value={'found': False})
+    def test_truepeoplesearch_gets_e164(self, mock_search):
+        hunter = UnifiedNameHunter("415.858.6273")
+        hunter._hunt_truepeoplesearch()
+        mock_search.assert_called_once_with("+14158586273", hunter._cancel_event)
+
+
+class TestHttpSession:
+    """Test the hunter releases its HTTP clients"""
+
+    def test_context_manager_closes_session(self):
+        """Test leaving the with-block releases the validator's pooled connections"""
+        with patch('scripts.unified_name_hunter.PhoneValidator.close') as mock_close:
+            with UnifiedNameHunter("+14158586273"):
+                pass
+        mock_close.assert_called_once()
+
+
+class TestHuntParallel:
+    """Test concurrent hunter execution"""
+
+    def test_results_collected_from_all_hunters(self, hunter):
+        """Test every hunter runs and found names are correlated"""
+        p1, p2 = patch_hunters(
+            hunter,
+            twilio=lambda: {'found': True, 'names': ['LINDLEY, DAVID']},
+            truepeoplesearch=lambda: {'found': True, 'names': ['David Lindley']},
+        )
+        with p1, p2:
+            results = hunter.hunt_parallel(early_exit=False)
+
+        assert results['methods_attempted'] == ['twilio', 'truepeoplesearch']
+        assert results['methods_successful'] == ['twilio', 'truepeoplesearch']
+        assert results['found'] == True
+        assert results['primary_names'] == ['David Lindley']
+
+    def test_failing_hunter_isolated(self, hunter):
+        """Test one hunter raising is recorded without stopping the others"""
+        def boom():
+            raise RuntimeError("lookup down")
+
+        p1, p2 = patch_hunters(hunter, twilio=boom, truepeoplesearch=lambda: {'found': False, 'names': []})
+        with p1, p2:
+            results = hunter.hunt_parallel()
+
+        assert results['source_summary']['twilio'] == {'error': 'lookup down', 'found': False}
+        assert results['source_summary']['truepeoplesearch']['found'] == False
+        assert results['found'] == False
+
+    def test_timed_out_hunter_does_not_block_return(self, hunter):
+        """Test a hung hunter is recorded as timed out without waiting on its thread"""
+        release = threading.Event()
+        p1, p2 = patch_hunters(hunter, twilio=lambda: release.wait(5) and {'found': False})
+        try:
+            with p1, p2, patch('scripts.unified_name_hunter.HUNT_TIMEOUT', 0.2):
+                start = time.monotonic()
+                results = hunter.hunt_parallel()
+                elapsed = time.monotonic() - start
+        finally:
+            release.set()
+
+        assert elapsed < 2
+        assert results['source_summary']['twilio'] == {'error': 'Timed out after 0.2s', 'found': False}
+        assert results['source_summary']['truepeoplesearch'] == {'found': False}
+
+    def test_confident_twilio_cancels_remaining_hunters(self, hunter):
+        """Test a confident Twilio result returns without waiting on slower hunters"""
+        release = threading.Event()
+        p1, p2 = patch_hunters(
+            hunter,
+            twilio=lambda: {'found': True, 'names': ['David Lindley']},
+            truepeoplesearch=lambda: release.wait(5) and {'found': False},
+        )
+        try:
+            with p1, p2:
+                start = time.monotonic()
+                results = hunter.hunt_parallel()
+                elapsed = time.monotonic() - start
+        finally:
+            release.set()
+
+        assert elapsed < 2
+        assert results['early_termination'] == True
+        assert results['primary_names'] == ['David Lindley']
+        assert results['source_summary']['truepeoplesearch'] == {'error': 'Cancelled after early termination', 'found': False}
+
+    def test_early_exit_signals_abandoned_hunters(self, hunter):
+        """Test hunters still running after an early exit are told to stop"""
+        started, stopped = threading.Event(), threading.Event()
+
+        def slow_truepeoplesearch():
+            started.set()
+            if hunter._cancel_event.wait(5):
+                stopped.set()
+            return {'found': False}
+
+        p1, p2 = patch_hunters(
+            hunter,
+            twilio=lambda: started.wait(5) and {'found': True, 'names': ['David Lindley']},
+            truepeoplesearch=slow_truepeoplesearch,
+        )
+        with p1, p2:
+            hunter.hunt_parallel()
+
+        assert stopped.wait(2)
+
+    def test_early_exit_disabled_waits_for_all(self, hunter):
+        """Test early_exit=False keeps collecting after a confident result"""
+        release = threading.Event()
+        p1, p2 = patch_hunters(
+            hunter,
+            twilio=lambda: {'found': True, 'names': ['David Lindley']},
+            truepeoplesearch=lambda: release.wait(0.3) or {'found': True, 'names': ['David Lindley']},
+        )
+        with p1, p2:
+            results = hunter.hunt_parallel(early_exit=False)
+
+        assert results['early_termination'] == False
+        assert results['methods_successful'] == ['twilio', 'truepeoplesearch']
+
+    def test_skip_truepeoplesearch(self):
+        """Test TruePeopleSearch is left out when skipped"""
+        hunter = UnifiedNameHunter("+14158586273", skip_truepeoplesearch=True)
+        p1, p2 = patch_hunters(hunter)
+        with p1, p2 as mock_tps:
+            results = hunter.hunt_parallel()
+
+        assert results['methods_attempted'] == ['twilio']
+        mock_tps.assert_not_called()
+
+
+class TestCarrierInfo:
+    """Test the lazy NumVerify carrier lookup"""
+
+    def test_looked_up_once_on_demand(self, hunter):
+        """Test NumVerify is only called when carrier info is asked for, and only once"""
+        with patch.object(hunter.phone_validator, 'validate_with_numverify',
+                          return_value={'valid': True, 'carrier': 'AT&T'}) as mock_validate:
+            p1, p2 = patch_hunters(hunter)
+            with p1, p2:
+                hunter.hunt_parallel()
+            mock_validate.assert_not_called()
+
+            assert hunter.get_carrier_info()['carrier_info'] == 'AT&T'
+            hunter.get_carrier_info()
+
+        mock_validate.assert_called_once()
+
+
+class TestHuntSequential:
+    """Test sequential hunting with early termination"""
+
+    def test_correlates_only_when_threshold_reachable(self, hunter):
+        """Test sources that cannot reach the threshold don't trigger clustering"""
+        p1, p2 = patch_hunters(
+            hunter,
+            twilio=lambda: {'found': True, 'names': []},
+            truepeoplesearch=lambda: {'found': True, 'names': ['David Lindley']},
+        )
+        with p1, p2, patch.object(hunter, '_correlate_all_results',
+                                      wraps=hunter._correlate_all_results) as mock_correlate:
+            results = hunter.hunt_sequential_aggressive()
+
+        assert mock_correlate.call_count == 1
+        assert results['early_termination'] == True
+        assert results['primary_names'] == ['David Lindley']
+
+    def test_final_correlation_without_early_exit(self, hunter):
+        """Test names below every threshold are still correlated after the loop"""
+        hunter.confidence_weights['truepeoplesearch'] = 0.3
+        p1, p2 = patch_hunters(hunter, truepeoplesearch=lambda: {'found': True, 'names': ['David Lindley']})
+        with p1, p2:
+            results = hunter.hunt_sequential_aggressive()
+
+        assert results['early_termination'] == False
+        assert results['primary_names'] == ['David Lindley']
+        assert results['best_confidence'] == pytest.approx(0.4)
+
+    def test_skip_truepeoplesearch(self):
+        """Test a deferred TruePeopleSearch is not run by the sequential pass either"""
+        hunter = UnifiedNameHunter("+14158586273", skip_truepeoplesearch=True)
+        p1, p2 = patch_hunters(hunter)
+        with p1, p2 as mock_tps:
+            results = hunter.hunt_sequential_aggressive()
+
+        assert set(results['source_summary']) == {'twilio'}
+        mock_tps.assert_not_called()
+
+    def test_slow_hunters_cancelled_on_early_exit(self, hunter):
+        """Test a confident result returns without waiting for slower hunters"""
+        release = threading.Event()
+        p1, p2 = patch_hunters(
+            hunter,
+            twilio=lambda: {'found': True, 'names': ['David Lindley']},
+            truepeoplesearch=lambda: release.wait(5) and {'found': False},
+        )
+        try:
+            with p1, p2:
+                start = time.monotonic()
+                results = hunter.hunt_sequential_aggressive()
+                elapsed = time.monotonic() - start
+        finally:
+            release.set()
+
+        assert elapsed < 2
+        assert results['early_termination'] == True
+        assert set(results['source_summary']) == {'twilio'}
+
+
+class TestHuntUltimate:
+    """Test escalation from the parallel pass to sequential hunting"""
+
+    def test_escalation_reruns_only_failed_methods(self, hunter):
+        """Test methods that completed in the parallel pass are not called again"""
+        calls = []
+
+        def twilio():
+            calls.append('twilio')
+            if calls.count('twilio') == 1:
+                raise RuntimeError("timeout")
+            return {'found': True, 'names': ['David Lindley']}
+
+        def truepeoplesearch():
+            calls.append('truepeoplesearch')
+            return {'found': False, 'names': []}
+
+        p1, p2 = patch_hunters(hunter, twilio=twilio, truepeoplesearch=truepeoplesearch)
+        with p1, p2:
+            results = hunter.hunt_ultimate()
+
+        assert sorted(calls) == ['truepeoplesearch', 'twilio', 'twilio']
+        assert results['source_summary']['truepeoplesearch'] == {'found': False, 'names': []}
+        assert results['primary_names'] == ['David Lindley']
+
+    def test_no_escalation_when_every_method_completed(self, hunter):
+        """Test a low-confidence parallel pass with nothing to retry is returned as-is"""
+        hunter.confidence_weights['truepeoplesearch'] = 0.3
+        p1, p2 = patch_hunters(hunter, truepeoplesearch=lambda: {'found': True, 'names': ['David Lindley']})
+        with p1, p2, patch.object(hunter, 'hunt_sequential_aggressive') as mock_sequential:
+            results = hunter.hunt_ultimate()
+
+        mock_sequential.assert_not_called()
+        assert results['primary_names'] == ['David Lindley']
+
+    def test_repeat_lookup_served_from_cache(self, hunter):
+        """Test a second hunt for the same number in another format skips the hunters"""
+        p1, p2 = patch_hunters(hunter, twilio=lambda: {'found': True, 'names': ['David Lindley']})
+        with p1, p2:
+            first = hunter.hunt_ultimate()
+
+        again = UnifiedNameHunter("(415) 858-6273")
+        with patch.object(again, 'hunt_parallel') as mock_parallel:
+            second = again.hunt_ultimate()
+
+        mock_parallel.assert_not_called()
+        assert second['primary_names'] == first['primary_names'] == ['David Lindley']
+        assert second['execution_time'] == 0.0
+
+    def test_invalidate_and_errors_not_cached(self, hunter):
+        """Test invalidate drops an entry and runs with errors are never stored"""
+        p1, p2 = patch_hunters(hunter)
+        with p1, p2:
+            hunter.hunt_ultimate()
+        assert [key[0] for key in unified_name_hunter._hunt_cache] == ['+14158586273']
+
+        UnifiedNameHunter.invalidate("415-858-6273")
+        assert len(unified_name_hunter._hunt_cache) == 0
+
+        def boom():
+            raise RuntimeError("lookup down")
+
+        p1, p2 = patch_hunters(hunter, twilio=boom)
+        with p1, p2:
+            hunter.hunt_ultimate()
+        assert len(unified_name_hunter._hunt_cache) == 0
+
+
+class TestTwilioIdentity:
+    """Test the identity-aware Twilio lookup"""
+
+    @pytest.fixture
+    def mock_client(self):
+        twilio_client.cache_clear()
+        with patch('scripts.phone_validator.Client') as mock_client:
+            yield mock_client
+        twilio_client.cache_clear()
+
+    def test_client_shared_across_lookups(self, mock_client):
+        """Test one Twilio client is built and reused by every lookup with the same credentials"""
+        hunters = [UnifiedNameHunter("+14158586273", identity_data={'first_name': 'David'}) for _ in range(2)]
+        for hunter in hunters:
+            hunter.phone_validator.twilio_sid, hunter.phone_validator.twilio_token = 'AC123', 'secret'
+            hunter._validate_with_twilio_identity()
+
+        mock_client.assert_called_once_with('AC123', 'secret')
+        assert mock_client.return_value.lookups.v2.phone_numbers.return_value.fetch.call_count == 4
+
+    def test_identity_and_caller_name_fetched_concurrently(self, mock_client):
+        """Test both Twilio lookups are in flight together and their results merged"""
+        both_started = threading.Barrier(2, timeout=2)
+        match = Mock(summary_score=0.9, first_name_match='exact_match', last_name_match='exact_match')
+
+        def fetch(fields, **params):
+            both_started.wait()
+            if fields == 'identity_match':
+                return Mock(identity_match=match)
+            return Mock(caller_name={'caller_name': 'DAVID LINDLEY'})
+
+        mock_client.return_value.lookups.v2.phone_numbers.return_value.fetch.side_effect = fetch
+        hunter = UnifiedNameHunter("+14158586273", identity_data={'first_name': 'David', 'last_name': 'Lindley'})
+        hunter.phone_validator.twilio_sid, hunter.phone_validator.twilio_token = 'AC123', 'secret'
+
+        result = hunter._validate_with_twilio_identity()
+
+        assert result['OWNER_NAME'] == 'David Lindley'
+        assert result['identity_match_score'] == 0.9
+        assert result['caller_name_data'] == {'caller_name': 'DAVID LINDLEY'}
+
+    def test_hunt_result_omits_raw_lookup(self, hunter):
+        """Test the hunt keeps names and the match score, not the raw Twilio objects"""
+        lookup = {'OWNER_NAME': 'David Lindley', 'caller_name_data': Mock(caller_name=None)}
+        with patch.object(PhoneValidator, 'validate_with_twilio', return_value=lookup):
+            result = hunter._hunt_twilio_enhanced()
+
+        assert result == {'found': True, 'names': ['David Lindley'], 'confidence': 0.9,
+                          'identity_match_score': None, 'used_identity_data': False}
+
+    def test_missing_credentials(self, mock_client, hunter):
+        hunter.phone_validator.twilio_sid = None
+        assert hunter._validate_with_twilio_identity() == {}
+        mock_client.assert_not_called()
+
+
+class TestSourceCache:
+    """Test per-source result caching across hunter instances"""
+
+    @patch('scripts.unified_name_hunter.search_truepeoplesearch',
+           return_value={'found': True, 'names': ['David Lindley']})
+    def test_source_result_shared_across_instances(self, mock_search):
+        """Test a second hunter for the same number reuses the scrape, even with other identity data"""
+        first = UnifiedNameHunter("+14158586273")._hunt_truepeoplesearch()
+        second = UnifiedNameHunter("415-858-6273", identity_data={'email': 'd@example.com'})._hunt_truepeoplesearch()
+
+        assert mock_search.call_count == 1
+        assert second == first
+
+    def test_identity_data_separates_twilio_entries(self):
+        """Test Twilio results are keyed by identity data, and errors are not cached"""
+        plain = UnifiedNameHunter("+14158586273")
+        with_identity = UnifiedNameHunter("+14158586273", identity_data={'first_name': 'David'})
+        assert plain.identity_hash != with_identity.identity_hash
+
+        with patch.object(PhoneValidator, 'validate_with_twilio', return_value={'OWNER_NAME': 'David Lindley'}) as mock_plain, \
+             patch.object(UnifiedNameHunter, '_validate_with_twilio_identity', return_value={}) as mock_identity:
+            plain._hunt_twilio_enhanced()
+            plain._hunt_twilio_enhanced()
+            assert with_identity._hunt_twilio_enhanced()['found'] == False
+
+        assert mock_plain.call_count == 1
+        assert mock_identity.call_count == 1
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_identity_hash_ignores_key_order(self, use_orjson):
+        """Test the identity cache key is stable with orjson or the stdlib fallback"""
+        with patch('scripts.unified_name_hunter.orjson', None) if not use_orjson else nullcontext():
+            first = unified_name_hunter._identity_hash({'first_name': 'David', 'last_name': 'Lindley'})
+            second = unified_name_hunter._identity_hash({'last_name': 'Lindley', 'first_name': 'David'})
+            other = unified_name_hunter._identity_hash({'first_name': 'Mary'})
+
+        assert first == second
+        assert first != other
+
+    @patch('scripts.unified_name_hunter.search_truepeoplesearch', side_effect=RuntimeError("blocked"))
+    def test_errors_not_cached(self, mock_search, hunter):
+        hunter._hunt_truepeoplesearch()
+        hunter._hunt_truepeoplesearch()
+        assert mock_search.call_count == 2
+
+
+class TestNameCorrelation:
+    """Test name cleaning, clustering and confidence scoring"""
+
+    def test_clean_name_reorders_last_first(self, hunter):
+        assert hunter._clean_name("LINDLEY, DAVID") == "David Lindley"
+
+    def test_clean_name_rejects_false_positives(self, hunter):
+        assert hunter._clean_name("Unknown") is None
+        assert hunter._clean_name("Caller 123") is None
+        assert hunter._clean_name("") is None
+
+    def test_clean_name_strips_symbols(self, hunter):
+        """Test ASCII and non-ASCII names drop the same symbols"""
+        assert hunter._clean_name("david (dave) lindley!") == "David Dave Lindley"
+        assert hunter._clean_name("josé o'brien-díaz") == "José Obrien-díaz"
+        assert hunter._clean_name("Ann\tLee") == "Ann Lee"
+
+    def test_clean_name_rejects_oversized_input(self, hunter):
+        """Test scraped page junk is rejected before regex and similarity work"""
+        assert hunter._clean_name("A" * 200) is None
+        assert hunter._clean_name("one two three four five six seven eight nine") is None
+        assert hunter._clean_name("Mary Ann De La Cruz Smith") == "Mary Ann De La Cruz Smith"
+
+    def test_similar_names_clustered(self, hunter):
+        """Test near-identical names across sources land in one cluster"""
+        results = hunter._correlate_all_results({
+            'twilio': {'found': True, 'names': ['David Lindley']},
+            'truepeoplesearch': {'found': True, 'names': ['David Lindly', 'Mary Jones']},
+        })
+
+        clusters = results['correlation_analysis']['name_clusters']
+        assert [[item['name'] for item in c] for c in clusters] == [['David Lindley', 'David Lindly'], ['Mary Jones']]
+        assert results['primary_names'] == ['David Lindley', 'David Lindly']
+        assert results['best_confidence'] == pytest.approx(1.0)
+
+    def test_shared_first_name_not_clustered(self, hunter):
+        """Test different people who share a first name stay apart despite the Jaro-Winkler prefix bonus"""
+        results = hunter._correlate_all_results({
+            'twilio': {'found': True, 'names': ['David Lindley']},
+            'truepeoplesearch': {'found': True, 'names': ['David Smith']},
+        })
+
+        assert results['primary_names'] == ['David Lindley']
+        assert results['correlation_analysis']['consensus_score'] == pytest.approx(0.5)
+
+    @pytest.mark.parametrize('use_scipy', [True, False])
+    def test_clusters_join_transitively(self, hunter, use_scipy):
+        """Test A~B and B~C put all three in one cluster with scipy or the union-find fallback"""
+        items = [{'name': n, 'source': 'twilio', 'weight': 0.9} for n in ['Ann Lee', 'Anne Lee', 'Anne Leeds', 'Bob Ray']]
+        chain = np.array([[1.0, 0.95, 0.5, 0.1], [0.95, 1.0, 0.95, 0.1], [0.5, 0.95, 1.0, 0.1], [0.1, 0.1, 0.1, 1.0]])
+
+        with patch.object(hunter, '_similarity_matrix', return_value=chain), \
+             patch('scripts.unified_name_hunter.connected_components', None) if not use_scipy else nullcontext():
+            clusters = hunter._cluster_similar_names(items)
+
+        assert [[item['name'] for item in c] for c in clusters] == [['Ann Lee', 'Anne Lee', 'Anne Leeds'], ['Bob Ray']]
+
+    def test_clusters_independent_of_input_order(self, hunter):
+        """Test the same names partition the same way whichever order the sources reported them in"""
+        names = ['David Lindley', 'Mary Jones', 'David Lindly', 'Mary Jone', 'Dave Lindley']
+
+        def partition(order):
+            items = [{'name': n, 'source': 'twilio', 'weight': 0.9} for n in order]
+            return {frozenset(item['name'] for item in c) for c in hunter._cluster_similar_names(items)}
+
+        assert partition(names) == partition(reversed(names)) == {
+            frozenset({'David Lindley', 'David Lindly', 'Dave Lindley'}), frozenset({'Mary Jones', 'Mary Jone'})}
+
+    @pytest.mark.parametrize('missing', [(), ('rapidfuzz_process', 'JaroWinkler'), ('connected_components',)])
+    def test_clustering_without_optional_backends(self, hunter, missing):
+        """Test difflib and union-find fallbacks cluster the same way as rapidfuzz and scipy"""
+        items = [{'name': n, 'source': 'twilio', 'weight': 0.9}
+                 for n in ['David Lindley', 'Mary Jones', 'David Lindly', 'Mary Jone']]
+        patches = [patch(f'scripts.unified_name_hunter.{attr}', None) for attr in missing]
+
+        for p in patches:
+            p.start()
+        try:
+            unified_name_hunter._similarity.cache_clear()
+            clusters = hunter._cluster_similar_names(items)
+        finally:
+            for p in patches:
+                p.stop()
+            unified_name_hunter._similarity.cache_clear()
+
+        assert [[item['name'] for item in c] for c in clusters] == [
+            ['David Lindley', 'David Lindly'], ['Mary Jones', 'Mary Jone']]
+
+    def test_punctuation_variants_skip_similarity_scoring(self, hunter):
+        """Test names equal up to punctuation are grouped without pairwise scoring"""
+        items = [{'name': n, 'sources': [('twilio', 0.9)]}
+                 for n in ['Mary-Ann Jones', 'David Lindley', 'Maryann Jones', 'David Lindly']]
+
+        with patch.object(hunter, '_similarity_matrix', wraps=hunter._similarity_matrix) as mock_matrix:
+            clusters = hunter._cluster_similar_names(items)
+
+        mock_matrix.assert_called_once_with(['Mary-Ann Jones', 'David Lindley', 'David Lindly'])
+        assert [[item['name'] for item in c] for c in clusters] == [
+            ['Mary-Ann Jones', 'Maryann Jones'], ['David Lindley', 'David Lindly']]
+
+    def test_similarity_symmetric_and_ignores_case_punctuation(self, hunter):
+        """Test argument order and punctuation do not change the score"""
+        assert hunter._calculate_name_similarity("O'Brien, Pat", "pat obrien") == \
+            hunter._calculate_name_similarity("pat obrien", "O'Brien, Pat")
+        assert hunter._calculate_name_similarity("J. Smith", "j smith") == 1.0
+
+    @pytest.mark.parametrize('use_rapidfuzz', [True, False])
+    def test_similarity_scorer_threshold(self, hunter, use_rapidfuzz):
+        """Test spelling variants pass the threshold and different people do not, with either scorer"""
+        with patch('scripts.unified_name_hunter.JaroWinkler', None) if not use_rapidfuzz else nullcontext():
+            unified_name_hunter._similarity.cache_clear()
+            assert hunter._calculate_name_similarity("David Lindley", "David Lindly") >= hunter.min_name_similarity
+            assert hunter._calculate_name_similarity("David Lindley", "Mary Jones") < hunter.min_name_similarity
+        unified_name_hunter._similarity.cache_clear()
+
+    def test_duplicate_names_merged_before_clustering(self, hunter):
+        """Test a name reported by several sources is clustered once but scored per report"""
+        results = hunter._correlate_all_results({
+            'twilio': {'found': True, 'names': ['LINDLEY, DAVID']},
+            'truepeoplesearch': {'found': True, 'names': ['David Lindley']},
+        })
+
+        clusters = results['correlation_analysis']['name_clusters']
+        assert clusters == [[{'name': 'David Lindley', 'sources': [('twilio', 0.9), ('truepeoplesearch', 0.8)]}]]
+        # Mean weight 0.85 + two-source bonus 0.2 + second-occurrence bonus 0.05
+        assert results['best_confidence'] == pytest.approx(1.0)
+        assert hunter._calculate_cluster_confidence(clusters[0]) == hunter._calculate_cluster_confidence(
+            [{'name': 'David Lindley', 'sources': [('twilio', 0.9)]},
+             {'name': 'David Lindley', 'sources': [('truepeoplesearch', 0.8)]}])
+
+    def test_highest_confidence_cluster_is_primary(self, hunter):
+        """Test the best cluster wins even when it was not seen first"""
+        results = hunter._correlate_all_results({
+            'truepeoplesearch': {'found': True, 'names': ['Mary Jones', 'David Lindley']},
+            'twilio': {'found': True, 'names': ['David Lindley']},
+        })
+
+        assert results['primary_names'] == ['David Lindley']
+        assert results['all_names'] == ['David Lindley', 'Mary Jones']
+        assert results['confidence_scores']['Mary Jones'] == pytest.approx(0.9)
+        assert results['correlation_analysis']['consensus_score'] == 1.0
+
+    def test_consensus_relative_to_hunted_sources(self, hunter):
+        """Test one of the two hunted sources agreeing is half consensus"""
+        results = hunter._correlate_all_results({'twilio': {'found': True, 'names': ['David Lindley']}})
+        assert results['correlation_analysis']['consensus_score'] == 0.5
+
+    def test_consensus_with_truepeoplesearch_skipped(self):
+        """Test a single hunted source is capped at half consensus"""
+        hunter = UnifiedNameHunter("+14158586273", skip_truepeoplesearch=True)
+        results = hunter._correlate_all_results({'twilio': {'found': True, 'names': ['David Lindley']}})
+        assert results['correlation_analysis']['consensus_score'] == 0.5
+
+    def test_no_names(self, hunter):
+        """Test sources without names produce no correlation"""
+        with patch.object(hunter, '_clean_name') as mock_clean:
+            results = hunter._correlate_all_results({'twilio': {'found': False}, 'truepeoplesearch': {'error': 'blocked'}})
+
+        mock_clean.assert_not_called()
+        assert results['found'] == False
+        assert results['primary_names'] == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])